@@ -0,0 +1,11 @@
+"""
+Benchmarks del proyecto EDA Marketing Bancario.
+
+Cada script se ejecuta desde la raíz del repositorio, por ejemplo:
+    python -m benchmarks.bench_fechas --rows 1000000
+
+benchmarks.generador produce datos sintéticos con la forma de los ficheros en bruto
+(campaña y clientes) y bench_pipeline mide el pipeline completo etapa a etapa, guardando
+los resultados en JSON y comparándolos con un baseline:
+    python -m benchmarks.bench_pipeline --rows 1000000 --baseline benchmarks/resultados/base.json
+"""
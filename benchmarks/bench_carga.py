@@ -0,0 +1,57 @@
+"""
+Benchmark: carga en frío de las fuentes en bruto.
+
+Compara la carga secuencial del notebook (bank-additional.csv y después las hojas de
+customer-details.xlsx) con cargar_fuentes, que lee el CSV en un hilo y cada hoja en un
+proceso, sin caché de clientes en ambos casos. Verifica que los DataFrames coinciden y muestra
+el tiempo de cada fuente: con varios núcleos el total se acerca al de la fuente más lenta.
+
+Uso:
+    python -m benchmarks.bench_carga --rows 1000000 --xlsx data/raw/customer-details.xlsx --repeat 3
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+import src.cleaning_campaing as cc
+import src.ingestion as ing
+from benchmarks.bench_tasas import medir
+from benchmarks.generador import escribir_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='filas del CSV sintético de campaña')
+    parser.add_argument('--xlsx', default='data/raw/customer-details.xlsx')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--procesos', type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_csv = os.path.join(tmp, 'bank-additional.csv')
+        escribir_csv(ruta_csv, args.rows)
+
+        def secuencial():
+            return cc.leer_campaign_csv(ruta_csv), ing.load_customer_details(args.xlsx, usar_cache=False)
+
+        def concurrente():
+            return ing.cargar_fuentes(ruta_csv, args.xlsx, cache_dir=None, n_procesos=args.procesos)
+
+        campaign, clientes = secuencial()
+        fuentes = concurrente()
+        pd.testing.assert_frame_equal(campaign, fuentes.campaign)
+        pd.testing.assert_frame_equal(clientes, fuentes.clientes)
+
+        t_secuencial = medir(secuencial, args.repeat)
+        t_concurrente = medir(concurrente, args.repeat)
+    print(f"Filas campaña: {args.rows:,}  Clientes: {len(clientes):,}  Núcleos: {os.cpu_count()}")
+    print(fuentes.tabla().round(3).to_string())
+    print(f"  Secuencial (CSV + load_customer_details): {t_secuencial:8.3f} s")
+    print(f"  cargar_fuentes:                           {t_concurrente:8.3f} s"
+          f"  ({t_secuencial / t_concurrente:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
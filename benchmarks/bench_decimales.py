@@ -0,0 +1,71 @@
+"""
+Benchmark: reparación de la coma decimal en las columnas macro de la campaña.
+
+Compara, columna a columna, el camino original (astype(str) + str.replace + pd.to_numeric)
+con data_cleaning.reparar_decimales sobre las columnas leídas como object y como category
+(cleaning_campaing.leer_campaign_csv), midiendo tiempo y memoria asignada (tracemalloc), y
+verifica que los tres producen exactamente el mismo resultado.
+
+Uso:
+    python -m benchmarks.bench_decimales --rows 1000000 --repeat 3
+"""
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+import src.data_cleaning as dc
+from src.cleaning_campaing import COLUMNAS_MACRO
+from benchmarks.generador import generar_campaign
+
+
+def camino_str(serie: pd.Series) -> pd.Series:
+    return pd.to_numeric(serie.astype(str).str.replace(',', '.', regex=False), errors='coerce')
+
+
+def camino_reparar(serie: pd.Series) -> pd.Series:
+    return dc.a_float_decimal(serie)[0]
+
+
+def medir(func, serie: pd.Series, repeat: int):
+    """(segundos mínimos de repeat ejecuciones, MB asignados en pico)."""
+    tiempos = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(serie)
+        tiempos.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        func(serie)
+        pico = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+    return min(tiempos), pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = generar_campaign(args.rows)[COLUMNAS_MACRO]
+    print(f"Filas: {args.rows:,}")
+    for c in COLUMNAS_MACRO:
+        objeto = df[c]
+        categoria = objeto.astype('category')
+        referencia = camino_str(objeto)
+        pd.testing.assert_series_equal(referencia, camino_reparar(objeto))
+        pd.testing.assert_series_equal(referencia, camino_reparar(categoria))
+
+        print(f"  {c}")
+        for nombre, func, serie in [('astype(str) + to_numeric', camino_str, objeto),
+                                    ('reparar_decimales (object)', camino_reparar, objeto),
+                                    ('reparar_decimales (category)', camino_reparar, categoria)]:
+            segundos, pico = medir(func, serie, args.repeat)
+            print(f"    {nombre:30s} {segundos:8.3f} s  pico {pico:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: parseo de la columna 'date' de la campaña.
+
+Compara el camino original (Series.apply(parse_fecha_es) + pd.to_datetime) con
+parse_fecha_es_serie (vectorizado) sobre fechas sintéticas en español, y verifica
+que ambos producen exactamente el mismo resultado.
+
+Uso:
+    python -m benchmarks.bench_fechas --rows 1000000 --repeat 3
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.cleaning_campaing import MESES_ES, parse_fecha_es, parse_fecha_es_serie
+
+
+def generar_fechas(n: int, frac_invalidas: float = 0.01, seed: int = 0) -> pd.Series:
+    """Genera n fechas 'dd-mes-aaaa' (2012-2014) con una fracción de valores inválidos y NaN."""
+    rng = np.random.default_rng(seed)
+    meses = np.array(list(MESES_ES))
+    fechas = pd.Series(
+        [f"{d}-{m}-{a}" for d, m, a in zip(rng.integers(1, 29, n),
+                                           meses[rng.integers(0, 12, n)],
+                                           rng.integers(2012, 2015, n))],
+        name='date', dtype=object)
+    malas = rng.random(n) < frac_invalidas
+    fechas[malas] = rng.choice(['31-febrero-2013', 'sin fecha', '5-may-2014', np.nan], malas.sum())
+    return fechas
+
+
+def camino_apply(fechas: pd.Series) -> pd.Series:
+    return pd.to_datetime(fechas.apply(parse_fecha_es), format='%Y-%m-%d', errors='coerce')
+
+
+def medir(func, fechas: pd.Series, repeat: int) -> float:
+    tiempos = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(fechas)
+        tiempos.append(time.perf_counter() - t0)
+    return min(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    fechas = generar_fechas(args.rows)
+    pd.testing.assert_series_equal(camino_apply(fechas), parse_fecha_es_serie(fechas))
+
+    t_apply = medir(camino_apply, fechas, args.repeat)
+    t_vect = medir(parse_fecha_es_serie, fechas, args.repeat)
+    print(f"Filas: {args.rows:,}")
+    print(f"  apply(parse_fecha_es) + to_datetime: {t_apply:8.3f} s")
+    print(f"  parse_fecha_es_serie (vectorizado):  {t_vect:8.3f} s")
+    print(f"  Aceleración: {t_apply / t_vect:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
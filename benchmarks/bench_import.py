@@ -0,0 +1,93 @@
+"""
+Benchmark: tiempo de importación del paquete src.
+
+Mide en un intérprete nuevo por medición el tiempo de `import src` y de cada submódulo
+(con pandas y numpy ya importados, para aislar el coste propio del proyecto) y comprueba que:
+- `import src` no carga pandas, numpy ni ningún submódulo (API perezosa de src/__init__.py);
+- ningún submódulo carga dependencias opcionales pesadas al importarse (IPython, matplotlib,
+  seaborn, pyarrow.parquet): se importan en el primer uso;
+- el mapa de nombres de src/__init__.py coincide con el __all__ de cada submódulo.
+Termina con código 1 si alguna comprobación falla o si un import supera --max-ms, para usarlo
+como guarda frente a regresiones en los workers batch de corta duración.
+
+Uso:
+    python -m benchmarks.bench_import --repeat 5 --max-ms 50
+"""
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import src
+
+PESADOS = ['IPython', 'matplotlib', 'seaborn', 'pyarrow.parquet']
+
+# Se ejecuta en un intérprete nuevo: importa el módulo y devuelve el tiempo y los módulos cargados
+_MEDICION = """
+import json, sys, time
+{previos}
+t0 = time.perf_counter()
+import {modulo}
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({{'ms': ms, 'cargados': [m for m in {vigilados!r} if m in sys.modules]}}))
+"""
+
+
+def medir_import(modulo: str, previos: str, vigilados: list, repeat: int) -> dict:
+    """Mejor tiempo (ms) de `import modulo` en `repeat` intérpretes nuevos y módulos vigilados cargados."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    codigo = _MEDICION.format(previos=previos, modulo=modulo, vigilados=vigilados)
+    mediciones = []
+    for _ in range(repeat):
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=raiz, check=True,
+                                capture_output=True, text=True).stdout
+        mediciones.append(json.loads(salida.strip().splitlines()[-1]))
+    return {'ms': min(m['ms'] for m in mediciones), 'cargados': mediciones[0]['cargados']}
+
+
+def comprobar_api() -> list:
+    """Diferencias entre src._API y el __all__ de cada submódulo."""
+    errores = []
+    for submodulo in sorted(set(src._API.values())):
+        exportados = set(getattr(importlib.import_module(f"src.{submodulo}"), '__all__', []))
+        exportados.discard(submodulo)
+        mapeados = {nombre for nombre, m in src._API.items() if m == submodulo}
+        if exportados != mapeados:
+            errores.append(f"src.{submodulo}: __all__ y src._API difieren en {sorted(exportados ^ mapeados)}")
+    return errores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-ms', type=float, default=50.0,
+                        help='tiempo máximo por import, sin contar pandas/numpy')
+    args = parser.parse_args()
+
+    errores = comprobar_api()
+    base = medir_import('pandas, numpy', '', [], args.repeat)
+    print(f"import pandas, numpy (referencia): {base['ms']:8.1f} ms")
+
+    submodulos = [f"src.{m}" for m in src._SUBMODULOS]
+    paquete = medir_import('src', '', ['pandas', 'numpy'] + submodulos + PESADOS, args.repeat)
+    print(f"  {'src':30s} {paquete['ms']:8.1f} ms")
+    if paquete['cargados']:
+        errores.append(f"import src carga {paquete['cargados']}")
+
+    for modulo in submodulos:
+        resultado = medir_import(modulo, 'import pandas, numpy', PESADOS, args.repeat)
+        print(f"  {modulo:30s} {resultado['ms']:8.1f} ms")
+        if resultado['cargados']:
+            errores.append(f"import {modulo} carga {resultado['cargados']}")
+        if resultado['ms'] > args.max_ms:
+            errores.append(f"import {modulo} tarda {resultado['ms']:.1f} ms (> {args.max_ms} ms)")
+
+    for error in errores:
+        print(f"ERROR: {error}")
+    sys.exit(1 if errores else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Benchmark: pipeline completo de limpieza y EDA sobre datos sintéticos.
+
+Mide tiempo (mínimo de --repeat ejecuciones) y pico de memoria (tracemalloc) de cada etapa:
+clean_campaign_df, clean_column_names, run_checks, analisis_exploratorio,
+calcular_tasa_proporciones (una vez por variable) y unir_perfil_cliente. Con --modo csv
+mide además clean_campaign_csv (streaming) sobre un CSV sintético escrito por bloques, que
+es la forma de llegar a decenas de millones de filas.
+
+Los resultados se guardan en JSON y, si se indica --baseline, se comparan con una ejecución
+anterior: las etapas más lentas que baseline * (1 + tolerancia) se marcan como regresión y
+el script termina con código 1. El pico de memoria se compara igual, con su propia
+tolerancia (--tolerancia-memoria), y un baseline con otro número de filas se rechaza.
+
+Uso:
+    python -m benchmarks.bench_pipeline --rows 1000000 --repeat 3
+    python -m benchmarks.bench_pipeline --rows 1000000 --baseline benchmarks/resultados/base.json --guardar-baseline
+    python -m benchmarks.bench_pipeline --rows 1000000 --baseline benchmarks/resultados/base.json
+    python -m benchmarks.bench_pipeline --rows 50000000 --modo csv --sin-memoria
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import src.cleaning_campaing as cc
+import src.data_cleaning as dc
+from src.analisis_exploratorio import analisis_exploratorio, calcular_tasa_proporciones
+from src.join_clientes import unir_perfil_cliente
+from benchmarks.generador import escribir_csv, generar_campaign, generar_clientes
+
+VARIABLES = ['education', 'marital', 'job', 'contact', 'poutcome', 'contact_year']
+
+
+def medir(func, repeat: int) -> float:
+    tiempos = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        tiempos.append(time.perf_counter() - t0)
+    return min(tiempos)
+
+
+def pico_memoria(func) -> float:
+    """Pico de memoria asignada (MB) durante una ejecución de func, según tracemalloc."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        inicial = tracemalloc.get_traced_memory()[0]
+        func()
+        return (tracemalloc.get_traced_memory()[1] - inicial) / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def etapas_memoria(rows: int):
+    """Etapas en memoria: (nombre, función) sobre datos generados una sola vez."""
+    raw = generar_campaign(rows)
+    clientes = dc.clean_column_names(generar_clientes(rows // 2, ids=raw['id']), verbose=False)
+    limpio = dc.clean_column_names(cc.clean_campaign_df(raw), verbose=False)
+    return [
+        ('clean_campaign_df', lambda: cc.clean_campaign_df(raw)),
+        ('clean_column_names', lambda: dc.clean_column_names(raw, verbose=False)),
+        ('run_checks', lambda: dc.run_checks(limpio, posibles_cat=['contact', 'poutcome'], mostrar=False)),
+        ('analisis_exploratorio', lambda: analisis_exploratorio(limpio, 'df_campaign_clean', mostrar=False)),
+        ('calcular_tasa_proporciones', lambda: [calcular_tasa_proporciones(limpio, v) for v in VARIABLES]),
+        ('unir_perfil_cliente', lambda: unir_perfil_cliente(limpio, clientes)),
+    ]
+
+
+def etapas_csv(rows: int, carpeta: str):
+    """Etapa de streaming sobre un CSV sintético escrito por bloques en carpeta."""
+    entrada = escribir_csv(os.path.join(carpeta, 'bank-additional.csv'), rows)
+    salida = os.path.join(carpeta, 'df_campaign_clean.csv')
+    return [('clean_campaign_csv', lambda: cc.clean_campaign_csv(entrada, salida))]
+
+
+def comparar(resultados: dict, baseline: dict, tolerancia: float, tolerancia_memoria: float) -> list:
+    """Imprime la comparación por etapa (tiempo y pico de memoria) y devuelve las que empeoran."""
+    regresiones = []
+    print(f"\nComparación con baseline ({baseline.get('filas', '?'):,} filas, tolerancia "
+          f"{tolerancia:.0%} en tiempo y {tolerancia_memoria:.0%} en memoria):")
+    for nombre, actual in resultados['etapas'].items():
+        base = baseline.get('etapas', {}).get(nombre)
+        if base is None:
+            print(f"  {nombre:28s} sin baseline")
+            continue
+        ratio = actual['segundos'] / base['segundos'] if base['segundos'] else np.inf
+        marca = 'REGRESIÓN' if ratio > 1 + tolerancia else 'ok'
+        print(f"  {nombre:28s} {base['segundos']:8.3f} s → {actual['segundos']:8.3f} s  ({ratio:5.2f}x)  {marca}")
+        # Sin pico en alguna de las dos ejecuciones (--sin-memoria) no se compara la memoria
+        if actual.get('pico_mb') is not None and base.get('pico_mb') is not None:
+            ratio_mb = actual['pico_mb'] / base['pico_mb'] if base['pico_mb'] else np.inf
+            marca_mb = 'REGRESIÓN' if ratio_mb > 1 + tolerancia_memoria else 'ok'
+            print(f"  {'':28s} {base['pico_mb']:8.1f} MB → {actual['pico_mb']:7.1f} MB ({ratio_mb:5.2f}x)  {marca_mb}")
+            marca = 'ok' if marca == marca_mb == 'ok' else 'REGRESIÓN'
+        if marca != 'ok':
+            regresiones.append(nombre)
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--modo', choices=['memoria', 'csv', 'ambos'], default='memoria')
+    parser.add_argument('--sin-memoria', action='store_true', help='no medir el pico de memoria')
+    parser.add_argument('--salida', default=None,
+                        help='JSON de resultados (por defecto benchmarks/resultados/pipeline_<rows>.json)')
+    parser.add_argument('--baseline', default=None, help='JSON de una ejecución anterior')
+    parser.add_argument('--guardar-baseline', action='store_true', help='guarda esta ejecución como baseline')
+    parser.add_argument('--tolerancia', type=float, default=0.25)
+    parser.add_argument('--tolerancia-memoria', type=float, default=0.10,
+                        help='tolerancia del pico de memoria (tracemalloc varía poco entre ejecuciones)')
+    args = parser.parse_args()
+
+    resultados = {
+        'filas': args.rows,
+        'repeat': args.repeat,
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'entorno': {'python': sys.version.split()[0], 'pandas': pd.__version__, 'numpy': np.__version__,
+                    'plataforma': platform.platform(), 'cpus': os.cpu_count()},
+        'etapas': {},
+    }
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        etapas = []
+        if args.modo in ('memoria', 'ambos'):
+            etapas += etapas_memoria(args.rows)
+        if args.modo in ('csv', 'ambos'):
+            etapas += etapas_csv(args.rows, carpeta)
+
+        print(f"Filas: {args.rows:,}")
+        for nombre, func in etapas:
+            segundos = medir(func, args.repeat)
+            pico = None if args.sin_memoria else pico_memoria(func)
+            resultados['etapas'][nombre] = {'segundos': segundos, 'pico_mb': pico}
+            memoria = '' if pico is None else f"  pico {pico:9.1f} MB"
+            print(f"  {nombre:28s} {segundos:8.3f} s{memoria}")
+
+    salida = args.salida or os.path.join('benchmarks', 'resultados', f'pipeline_{args.rows}.json')
+    os.makedirs(os.path.dirname(salida) or '.', exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, indent=2)
+    print(f"\nResultados guardados en {salida}")
+
+    if args.baseline is None:
+        return
+    if args.guardar_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2)
+        print(f"Baseline guardado en {args.baseline}")
+        return
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('filas') != resultados['filas']:
+        sys.exit(f"El baseline {args.baseline} es de {baseline.get('filas')} filas y esta ejecución de "
+                 f"{resultados['filas']}: no son comparables (usar el mismo --rows)")
+    if comparar(resultados, baseline, args.tolerancia, args.tolerancia_memoria):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
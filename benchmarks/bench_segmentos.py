@@ -0,0 +1,81 @@
+"""
+Benchmark: tasas de conversión por muchas definiciones de segmento.
+
+Compara el flujo del notebook (pd.cut por cada banda numérica y calcular_tasa_proporciones
+una vez por segmento) con tasas_por_segmentos en el proceso actual y en un pool de procesos
+con memoria compartida, y verifica que las tasas coinciden.
+
+Uso:
+    python -m benchmarks.bench_segmentos --rows 2000000 --repeat 3 --procesos 4
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_tasas import generar_perfil, medir
+from src.analisis_exploratorio import calcular_tasa_proporciones, tasas_por_segmentos
+
+BANDAS = {
+    'edad': ('age', [0, 25, 35, 45, 55, 65, 120]),
+    'ingresos': ('ingresos', [0, 15_000, 30_000, 60_000, 120_000, np.inf]),
+    'antiguedad': ('antiguedad_años', [0, 1, 2, 5, 10, 50]),
+    'duracion': ('duration', [0, 60, 180, 300, 600, 5_000]),
+}
+CATEGORICAS = ['education', 'marital', 'job', 'contact', 'poutcome', 'contact_year']
+
+
+def generar_datos(n: int, seed: int = 0) -> pd.DataFrame:
+    """generar_perfil más las variables numéricas que se agrupan en bandas."""
+    rng = np.random.default_rng(seed + 1)
+    df = generar_perfil(n, seed)
+    df['age'] = rng.integers(18, 95, n).astype('float64')
+    df['ingresos'] = rng.gamma(2.0, 20_000, n)
+    df['antiguedad_años'] = rng.uniform(0, 20, n)
+    df['duration'] = rng.exponential(250, n)
+    return df
+
+
+def segmentos() -> dict:
+    definiciones = {c: c for c in CATEGORICAS}
+    definiciones.update({nombre: {'columna': col, 'bins': bins} for nombre, (col, bins) in BANDAS.items()})
+    definiciones.update({f"{a}_x_{b}": (a, b) for a in BANDAS for b in ['education', 'job', 'marital']})
+    return definiciones
+
+
+def bucle_notebook(df: pd.DataFrame) -> dict:
+    tablas = {c: calcular_tasa_proporciones(df, c) for c in CATEGORICAS}
+    for nombre, (col, bins) in BANDAS.items():
+        tablas[nombre] = calcular_tasa_proporciones(df.assign(**{nombre: pd.cut(df[col], bins)}), nombre)
+    return tablas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--procesos', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    df = generar_datos(args.rows)
+    definiciones = segmentos()
+    tabla = tasas_por_segmentos(df, definiciones, n_procesos=1)
+    pd.testing.assert_frame_equal(tabla, tasas_por_segmentos(df, definiciones, n_procesos=args.procesos))
+    for nombre, esperado in bucle_notebook(df).items():
+        obtenido = tabla[tabla['segmento'] == nombre]
+        np.testing.assert_array_equal(esperado['exitos'].to_numpy(), obtenido['exitos'].to_numpy())
+        np.testing.assert_array_equal(esperado['total'].to_numpy(), obtenido['total'].to_numpy())
+
+    t_bucle = medir(lambda: bucle_notebook(df), args.repeat)
+    t_serie = medir(lambda: tasas_por_segmentos(df, definiciones, n_procesos=1), args.repeat)
+    t_pool = medir(lambda: tasas_por_segmentos(df, definiciones, n_procesos=args.procesos), args.repeat)
+    n_sin_cruces = len(CATEGORICAS) + len(BANDAS)
+    print(f"Filas: {args.rows:,}  Segmentos: {len(definiciones)} ({len(definiciones) - n_sin_cruces} cruces)")
+    print(f"  Bucle pd.cut + calcular_tasa_proporciones ({n_sin_cruces} seg.): {t_bucle:8.3f} s")
+    print(f"  tasas_por_segmentos, 1 proceso:                     {t_serie:8.3f} s")
+    print(f"  tasas_por_segmentos, {args.procesos} procesos:                    {t_pool:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: round trip CSV frente a Parquet (src.storage) de un dataset procesado.
+
+Genera un DataFrame con la forma de df_campaign_clean (category, Int64, datetime64),
+lo guarda y lo vuelve a cargar con ambos formatos, e informa de tiempos, tamaño en disco
+y de cuántas columnas conservan su dtype. También mide la carga con proyección y filtro
+(contact_year == 2014).
+
+Uso:
+    python -m benchmarks.bench_storage --rows 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src import storage
+
+
+def generar_campaign_limpio(n: int, seed: int = 0) -> pd.DataFrame:
+    """DataFrame sintético con los dtypes que produce clean_campaign_df + clean_column_names."""
+    rng = np.random.default_rng(seed)
+    fechas = np.datetime64('2012-01-01') + rng.integers(0, 3 * 365, n).astype('timedelta64[D]')
+    df = pd.DataFrame({
+        'age': rng.integers(18, 90, n),
+        'job': pd.Categorical(rng.choice(['admin.', 'blue-collar', 'technician', 'services'], n)),
+        'education': pd.Categorical(rng.choice(['university.degree', 'high.school', 'basic.9y'], n)),
+        'default': pd.Categorical(rng.integers(0, 2, n)),
+        'duration': rng.integers(0, 2000, n),
+        'pdays': np.where(rng.random(n) < 0.9, np.nan, rng.integers(0, 30, n)),
+        'euribor3m': rng.choice([4.857, 1.313, 4.962, 0.7], n),
+        'y': (rng.random(n) < 0.11).astype(int),
+        'date': pd.to_datetime(fechas).astype('datetime64[ns]'),
+    })
+    df['contact_month'] = pd.Categorical(df['date'].dt.month.astype('Int64'))
+    df['contact_year'] = pd.Categorical(df['date'].dt.year.astype('Int64'))
+    return df.sort_values('date', ignore_index=True)
+
+
+def cronometrar(func):
+    t0 = time.perf_counter()
+    resultado = func()
+    return resultado, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = generar_campaign_limpio(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_csv = os.path.join(tmp, 'df.csv')
+        _, t_csv_w = cronometrar(lambda: df.to_csv(ruta_csv, index=False))
+        df_csv, t_csv_r = cronometrar(lambda: pd.read_csv(ruta_csv))
+
+        ruta_pq, t_pq_w = cronometrar(lambda: storage.save_dataset(df, 'df', ruta=tmp))
+        df_pq, t_pq_r = cronometrar(lambda: storage.load_dataset('df', ruta=tmp))
+        df_f, t_pq_f = cronometrar(lambda: storage.load_dataset(
+            'df', ruta=tmp, columns=['y', 'age', 'contact_year'], filters=[('contact_year', '==', 2014)]))
+
+        def dtypes_ok(otro):
+            return sum(otro[c].dtype == df[c].dtype for c in df.columns)
+
+        print(f"Filas: {args.rows:,}  Columnas: {df.shape[1]}")
+        print(f"  CSV     escritura {t_csv_w:7.3f} s  lectura {t_csv_r:7.3f} s  "
+              f"{os.path.getsize(ruta_csv) / 1e6:8.1f} MB  dtypes conservados {dtypes_ok(df_csv)}/{df.shape[1]}")
+        print(f"  Parquet escritura {t_pq_w:7.3f} s  lectura {t_pq_r:7.3f} s  "
+              f"{os.path.getsize(ruta_pq) / 1e6:8.1f} MB  dtypes conservados {dtypes_ok(df_pq)}/{df.shape[1]}")
+        print(f"  Parquet 3 columnas + contact_year == 2014: {t_pq_f:7.3f} s ({len(df_f):,} filas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: tasas de conversión por variable.
+
+Compara el bucle del notebook (calcular_tasa_proporciones una vez por variable) con
+calcular_tasas_multiples sobre todas las variables a la vez, y verifica que las tablas
+coinciden.
+
+Uso:
+    python -m benchmarks.bench_tasas --rows 1000000 --repeat 3
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.analisis_exploratorio import calcular_tasa_proporciones, calcular_tasas_multiples
+
+VARIABLES = ['segmento_edad', 'education', 'marital', 'job', 'contact', 'poutcome', 'contact_year']
+
+
+def generar_perfil(n: int, seed: int = 0) -> pd.DataFrame:
+    """DataFrame sintético con las variables demográficas de df_perfil_cliente."""
+    rng = np.random.default_rng(seed)
+    edad = rng.integers(18, 90, n)
+    df = pd.DataFrame({
+        'segmento_edad': pd.cut(edad, bins=[0, 25, 35, 45, 55, 65, 120],
+                                labels=['18-25', '26-35', '36-45', '46-55', '56-65', '65+']),
+        'education': pd.Categorical(rng.choice(['basic.4y', 'basic.6y', 'basic.9y', 'high.school',
+                                                'professional.course', 'university.degree'], n)),
+        'marital': pd.Categorical(rng.choice(['married', 'single', 'divorced'], n)),
+        'job': rng.choice(['admin.', 'blue-collar', 'technician', 'services', 'management',
+                           'retired', 'entrepreneur', 'self-employed', 'housemaid',
+                           'unemployed', 'student'], n),
+        'contact': rng.choice(['cellular', 'telephone'], n),
+        'poutcome': rng.choice(['nonexistent', 'failure', 'success'], n),
+        'contact_year': pd.Categorical(pd.array(rng.integers(2012, 2015, n), dtype='Int64')),
+        'y': pd.array((rng.random(n) < 0.11).astype(int), dtype='Int8'),
+    })
+    return df
+
+
+def medir(func, repeat: int) -> float:
+    tiempos = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        tiempos.append(time.perf_counter() - t0)
+    return min(tiempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = generar_perfil(args.rows)
+    lote = calcular_tasas_multiples(df, VARIABLES)
+    for v in VARIABLES:
+        pd.testing.assert_frame_equal(calcular_tasa_proporciones(df, v),
+                                      lote[v].drop(columns=['ic_inferior', 'ic_superior']))
+
+    t_bucle = medir(lambda: {v: calcular_tasa_proporciones(df, v) for v in VARIABLES}, args.repeat)
+    t_lote = medir(lambda: calcular_tasas_multiples(df, VARIABLES), args.repeat)
+    t_pares = medir(lambda: calcular_tasas_multiples(df, VARIABLES, combinaciones=True), args.repeat)
+    print(f"Filas: {args.rows:,}  Variables: {len(VARIABLES)}")
+    print(f"  Bucle calcular_tasa_proporciones: {t_bucle:8.3f} s")
+    print(f"  calcular_tasas_multiples:         {t_lote:8.3f} s  ({t_bucle / t_lote:.1f}x)")
+    print(f"  ... + {len(VARIABLES) * (len(VARIABLES) - 1) // 2} cruces por pares:      {t_pares:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: variables derivadas de df_perfil_cliente.
+
+Compara el código del notebook (replace + to_numeric de 'y', pd.cut para segmento_edad y resta
+de pd.to_datetime para la antigüedad) con construir_variables en frío y con la caché llena,
+verifica que los valores coinciden y muestra la memoria de las columnas resultantes.
+
+Uso:
+    python -m benchmarks.bench_variables --rows 1000000 --repeat 3
+"""
+import argparse
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_tasas import medir
+from src.variables_derivadas import BINS_EDAD, ORDEN_EDAD, CacheVariables, construir_variables
+
+DERIVADAS = ['y', 'segmento_edad', 'antiguedad_dias', 'antiguedad_años']
+
+
+def generar_perfil(n: int, seed: int = 0) -> pd.DataFrame:
+    """Columnas fuente de df_perfil_cliente ('y' ya recodificada por clean_campaign_df)."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 95, n),
+        'date': pd.Timestamp('2012-05-01') + pd.to_timedelta(rng.integers(0, 900, n), unit='D'),
+        'dt_customer': pd.Timestamp('2005-01-01') + pd.to_timedelta(rng.integers(0, 2500, n), unit='D'),
+        'y': (rng.random(n) < 0.11).astype('float64'),
+    })
+    df.loc[df.index[::97], 'dt_customer'] = pd.NaT
+    return df
+
+
+def notebook(df: pd.DataFrame) -> pd.DataFrame:
+    """Celdas del análisis demográfico del notebook."""
+    df = df.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        df['y'] = pd.to_numeric(df['y'].replace({'yes': 1, 'no': 0, 'si': 1, 'sí': 1}),
+                                errors='coerce').astype('Int8')
+    segmento = pd.cut(pd.to_numeric(df['age'], errors='coerce'), bins=BINS_EDAD, labels=ORDEN_EDAD)
+    df['segmento_edad'] = pd.Categorical(segmento, categories=ORDEN_EDAD, ordered=True)
+    df['antiguedad_dias'] = (pd.to_datetime(df['date'], errors='coerce')
+                             - pd.to_datetime(df['dt_customer'], errors='coerce')).dt.days
+    df['antiguedad_años'] = df['antiguedad_dias'] / 365.25
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = generar_perfil(args.rows)
+    esperado, obtenido = notebook(df), construir_variables(df)
+    for c in DERIVADAS:
+        pd.testing.assert_series_equal(esperado[c].astype(obtenido[c].dtype), obtenido[c])
+
+    cache = CacheVariables()
+    construir_variables(df, cache=cache)
+    t_notebook = medir(lambda: notebook(df), args.repeat)
+    t_frio = medir(lambda: construir_variables(df), args.repeat)
+    t_cache = medir(lambda: construir_variables(df, cache=cache), args.repeat)
+    mb = lambda d: d[DERIVADAS].memory_usage(deep=True, index=False).sum() / 1e6
+    print(f"Filas: {args.rows:,}  Variables: {len(DERIVADAS)}")
+    print(f"  Notebook (pd.cut, to_datetime, replace): {t_notebook:8.3f} s  {mb(esperado):7.1f} MB")
+    print(f"  construir_variables:                     {t_frio:8.3f} s  {mb(obtenido):7.1f} MB"
+          f"  ({t_notebook / t_frio:.1f}x)")
+    print(f"  construir_variables con caché:           {t_cache:8.3f} s"
+          f"  ({t_notebook / t_cache:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Generador sintético de datos con la forma de los ficheros en bruto del proyecto.
+
+- generar_campaign(n): como bank-additional.csv — decimales con coma en las columnas macro,
+  fechas 'dd-mes-aaaa' en español (con algunas inválidas), pdays == 999 como centinela,
+  binarias con valores '0.0'/'1.0'/'unknown'/NaN, NaN en age/education, columnas
+  geográficas y 'id' UUID.
+- generar_clientes(n): como customer-details.xlsx ya concatenado (year, Income, Kidhome,
+  Teenhome, Dt_Customer, NumWebVisitsMonth, ID), con ids compartidos con la campaña.
+- escribir_csv(...): escribe cualquiera de los dos por bloques, para tamaños que no caben
+  en memoria (de 10k a 50M filas).
+
+Todo es determinista dada la semilla y no necesita red ni los datos reales.
+"""
+import numpy as np
+import pandas as pd
+
+from src.cleaning_campaing import MESES_ES
+
+_HEX = np.frombuffer(b"0123456789abcdef", dtype="uint8")
+_POSICIONES_GUION = [8, 13, 18, 23]
+
+
+def uuids(n: int, seed: int = 0) -> np.ndarray:
+    """n UUID v4 en texto canónico (vectorizado, sin llamar a uuid.uuid4 por fila)."""
+    rng = np.random.default_rng(seed)
+    octetos = rng.integers(0, 256, size=(n, 16), dtype="uint8")
+    octetos[:, 6] = (octetos[:, 6] & 0x0F) | 0x40
+    octetos[:, 8] = (octetos[:, 8] & 0x3F) | 0x80
+    digitos = np.empty((n, 32), dtype="uint8")
+    digitos[:, 0::2] = _HEX[octetos >> 4]
+    digitos[:, 1::2] = _HEX[octetos & 0x0F]
+    texto = np.insert(digitos, [8, 12, 16, 20], ord('-'), axis=1)
+    return np.ascontiguousarray(texto).view('S36').ravel().astype(str).astype(object)
+
+
+def _con_nulos(valores: np.ndarray, frac: float, rng) -> np.ndarray:
+    valores = valores.astype(object)
+    valores[rng.random(len(valores)) < frac] = np.nan
+    return valores
+
+
+def generar_campaign(n: int, seed: int = 0, inicio: int = 0) -> pd.DataFrame:
+    """
+    DataFrame con la forma de bank-additional.csv (antes de clean_campaign_df).
+    inicio: primer valor del índice (para generar bloques consecutivos).
+    """
+    rng = np.random.default_rng(seed)
+    meses = np.array(list(MESES_ES), dtype=object)
+    fechas = (rng.integers(1, 29, n).astype(str).astype(object) + '-'
+              + meses[rng.integers(0, 12, n)] + '-'
+              + rng.integers(2012, 2015, n).astype(str).astype(object))
+    malas = rng.random(n) < 0.01
+    fechas[malas] = rng.choice(np.array(['31-febrero-2013', 'sin fecha', np.nan], dtype=object), malas.sum())
+
+    df = pd.DataFrame({
+        'age': np.where(rng.random(n) < 0.05, np.nan, rng.integers(18, 90, n)),
+        'job': _con_nulos(rng.choice(['admin.', 'blue-collar', 'technician', 'services', 'management',
+                                      'retired', 'entrepreneur', 'self-employed', 'housemaid',
+                                      'unemployed', 'student'], n), 0.01, rng),
+        'marital': _con_nulos(rng.choice(['married', 'single', 'divorced'], n), 0.01, rng),
+        'education': _con_nulos(rng.choice(['university.degree', 'high.school', 'basic.9y',
+                                            'professional.course', 'basic.4y', 'basic.6y'], n), 0.05, rng),
+        'default': rng.choice(np.array(['0.0', '1.0', 'unknown', np.nan], dtype=object), n, p=[.78, .01, .2, .01]),
+        'housing': rng.choice(np.array(['0.0', '1.0', 'unknown', np.nan], dtype=object), n, p=[.45, .52, .02, .01]),
+        'loan': rng.choice(np.array(['0.0', '1.0', 'unknown', np.nan], dtype=object), n, p=[.82, .15, .02, .01]),
+        'contact': rng.choice(['cellular', 'telephone'], n),
+        'duration': rng.integers(0, 2000, n),
+        'campaign': rng.integers(1, 10, n),
+        'pdays': np.where(rng.random(n) < 0.96, 999, rng.integers(0, 28, n)),
+        'previous': rng.integers(0, 3, n),
+        'poutcome': rng.choice(['nonexistent', 'failure', 'success'], n, p=[.86, .1, .04]),
+        'emp.var.rate': rng.choice([1.1, 1.4, -0.1, -1.8, -2.9], n),
+        'cons.price.idx': _con_nulos(rng.choice(['93,994', '94,465', '93,918', '92,893', '93,2'], n), 0.02, rng),
+        'cons.conf.idx': _con_nulos(rng.choice(['-36,4', '-41,8', '-42,7', '-46,2'], n), 0.02, rng),
+        'euribor3m': _con_nulos(rng.choice(['4,857', '4,962', '1,313', '0,7', '4,191'], n), 0.02, rng),
+        'nr.employed': _con_nulos(rng.choice(['5191', '5228,1', '5099,1', '5017,5'], n), 0.02, rng),
+        'y': rng.choice(['no', 'yes'], n, p=[.89, .11]),
+        'date': fechas,
+        'latitude': rng.uniform(36, 43, n),
+        'longitude': rng.uniform(-9, 3, n),
+        'id': uuids(n, seed),
+    }, index=pd.RangeIndex(inicio, inicio + n))
+    return df
+
+
+def generar_clientes(n: int, seed: int = 0, ids=None) -> pd.DataFrame:
+    """
+    DataFrame con la forma de customer-details.xlsx tras concatenar las hojas anuales
+    (antes de clean_column_names). ids: UUID a reutilizar (ej. los de la campaña).
+    """
+    rng = np.random.default_rng(seed + 1)
+    if ids is None:
+        ids = uuids(n, seed + 1)
+    ids = np.asarray(ids, dtype=object)[:n]
+    dias = rng.integers(0, 3 * 365, len(ids))
+    return pd.DataFrame({
+        'year': rng.choice(['2012', '2013', '2014'], len(ids)),
+        'Income': rng.integers(1_000, 200_000, len(ids)),
+        'Kidhome': rng.integers(0, 3, len(ids)),
+        'Teenhome': rng.integers(0, 3, len(ids)),
+        'Dt_Customer': (np.datetime64('2012-01-01') + dias).astype('datetime64[ns]'),
+        'NumWebVisitsMonth': rng.integers(0, 30, len(ids)),
+        'ID': ids,
+    })
+
+
+def escribir_csv(ruta: str, n: int, tipo: str = 'campaign', chunksize: int = 1_000_000,
+                 seed: int = 0) -> str:
+    """Escribe n filas sintéticas en CSV por bloques (memoria acotada por chunksize)."""
+    if tipo not in ('campaign', 'clientes'):
+        raise ValueError("tipo debe ser 'campaign' o 'clientes'")
+    for i, inicio in enumerate(range(0, n, chunksize)):
+        filas = min(chunksize, n - inicio)
+        if tipo == 'campaign':
+            bloque = generar_campaign(filas, seed=seed + i, inicio=inicio)
+        else:
+            bloque = generar_clientes(filas, seed=seed + i)
+        bloque.to_csv(ruta, mode='w' if i == 0 else 'a', header=(i == 0), index=(tipo == 'campaign'))
+    return ruta
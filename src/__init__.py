@@ -1,5 +1,116 @@
 """
 Módulo de limpieza y análisis exploratorio de datos para el proyecto EDA Marketing Bancario.
+
+La API pública de los submódulos se expone desde `src` con carga perezosa: `import src` no
+importa pandas ni ningún submódulo; el primer acceso a `src.run_checks` (o
+`from src import run_checks`) importa solo src.data_cleaning y sus dependencias.
 """
+import importlib
+
+__version__ = "1.0.0"
+
+# Nombre público -> submódulo que lo define (mismo contenido que el __all__ de cada submódulo;
+# benchmarks/bench_import.py comprueba que siguen sincronizados)
+_API = {
+    # analisis_exploratorio (la función analisis_exploratorio se accede como
+    # src.analisis_exploratorio.analisis_exploratorio: el nombre corresponde al submódulo)
+    "report_structure": "analisis_exploratorio",
+    "get_categorical_columns": "analisis_exploratorio",
+    "categorical_summary": "analisis_exploratorio",
+    "perfil_columnas": "analisis_exploratorio",
+    "perfil_json": "analisis_exploratorio",
+    "guardar_perfil": "analisis_exploratorio",
+    "calcular_tasa_proporciones": "analisis_exploratorio",
+    "calcular_tasas_multiples": "analisis_exploratorio",
+    "tasas_por_segmentos": "analisis_exploratorio",
+    "es_categorica": "analisis_exploratorio",
+    "es_numerica": "analisis_exploratorio",
+    "valor_json": "analisis_exploratorio",
+    "informe_desde_perfil": "analisis_exploratorio",
+    "tabla_categoricas": "analisis_exploratorio",
+    "codigos_bandas": "analisis_exploratorio",
+    # cache_perfiles
+    "huella_columna": "cache_perfiles",
+    "CachePerfiles": "cache_perfiles",
+    # cleaning_campaing
+    "clean_campaign_df": "cleaning_campaing",
+    "parse_fecha_es": "cleaning_campaing",
+    "parse_fecha_es_serie": "cleaning_campaing",
+    "estadisticas_campaign": "cleaning_campaing",
+    "clean_campaign_csv": "cleaning_campaing",
+    "ajustar_imputador_campaign": "cleaning_campaing",
+    "leer_campaign_csv": "cleaning_campaing",
+    # data_cleaning
+    "ejecutar_plan": "data_cleaning",
+    "coerce_to_category": "data_cleaning",
+    "impute_median": "data_cleaning",
+    "impute_mode": "data_cleaning",
+    "optimizar_tipos": "data_cleaning",
+    "reparar_decimales": "data_cleaning",
+    "run_checks": "data_cleaning",
+    "clean_column_names": "data_cleaning",
+    "valor_moda": "data_cleaning",
+    "nombres_normalizados": "data_cleaning",
+    "a_float_decimal": "data_cleaning",
+    # eda_por_bloques
+    "leer_por_bloques": "eda_por_bloques",
+    "perfil_por_bloques": "eda_por_bloques",
+    "analisis_exploratorio_por_bloques": "eda_por_bloques",
+    "categorical_summary_por_bloques": "eda_por_bloques",
+    # imputacion
+    "Imputador": "imputacion",
+    # ingestion
+    "load_customer_details": "ingestion",
+    "columnas_customer_details": "ingestion",
+    "hash_fichero": "ingestion",
+    "cargar_fuentes": "ingestion",
+    "FuentesCrudas": "ingestion",
+    "hash_con_indice": "ingestion",
+    # instrumentacion
+    "InformeEjecucion": "instrumentacion",
+    "ejecutar_etapas": "instrumentacion",
+    # join_clientes
+    "codificar_ids": "join_clientes",
+    "construir_indice": "join_clientes",
+    "guardar_indice": "join_clientes",
+    "cargar_indice": "join_clientes",
+    "unir_perfil_cliente": "join_clientes",
+    # perfiles
+    "SketchCuantiles": "perfiles",
+    "PerfilDatos": "perfiles",
+    # pipeline
+    "Nodo": "pipeline",
+    "CacheNodos": "pipeline",
+    "PipelinePerfil": "pipeline",
+    # storage
+    "save_dataset": "storage",
+    "load_dataset": "storage",
+    "columnas_dataset": "storage",
+    "iter_dataset": "storage",
+    # variables_derivadas
+    "ESPEC_PERFIL": "variables_derivadas",
+    "construir_variables": "variables_derivadas",
+    "CacheVariables": "variables_derivadas",
+    "columnas_fuente": "variables_derivadas",
+}
+
+_SUBMODULOS = sorted(set(_API.values()) | {"plotting"})
+
+__all__ = sorted(_API) + _SUBMODULOS
+
+
+def __getattr__(nombre: str):
+    """Importa el submódulo (o el submódulo que define el nombre) en el primer acceso."""
+    if nombre in _API:
+        valor = getattr(importlib.import_module(f"{__name__}.{_API[nombre]}"), nombre)
+    elif nombre in _SUBMODULOS:
+        valor = importlib.import_module(f"{__name__}.{nombre}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    # Los accesos siguientes ya no pasan por __getattr__
+    globals()[nombre] = valor
+    return valor
+
 
-__version__ = "1.0.0"
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
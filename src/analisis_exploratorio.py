@@ -1,8 +1,8 @@
 # src/analisis_exploratorio.py
+import json
 import pandas as pd
 import numpy as np
-from IPython.display import display
-from typing import List, Dict, Union
+from typing import Any, List, Dict, Union
 """
 Módulo: analisis_exploratorio.py
 ======================================================
@@ -20,11 +20,12 @@ Este módulo está diseñado para:
 FUNCIONES DISPONIBLES EN ESTE MÓDULO:
 ------------------------------------------------------
 
-1) report_structure(df, show_head=5)
+1) report_structure(df, show_head=5, mostrar=True)
    - Imprime y devuelve información básica del DataFrame: dimensiones, tipos de datos y primeras filas.
    - Argumentos:
        df: DataFrame a analizar.
        show_head (int): filas de ejemplo a mostrar.
+       mostrar (bool): si False no imprime ni renderiza nada.
    - Retorna: dict con 'shape', 'dtypes' y 'head'.
 
 2) get_categorical_columns(df)
@@ -34,18 +35,78 @@ FUNCIONES DISPONIBLES EN ESTE MÓDULO:
    - Devuelve un DataFrame resumen con número de valores únicos y los top N valores y sus cuentas
      para cada columna categórica detectada en el DataFrame.
 
-4) analisis_exploratorio(df, nombre_df="DataFrame", mostrar_head=5, round_decimals=2)
+4) perfil_columnas(df, columnas=None, top_n=3, max_valores=11, cache=None)
+   - Motor de profiling: calcula en una sola pasada por columna, sin copiar el DataFrame,
+     todas las estadísticas del informe (conteos, faltantes, cardinalidad, top N,
+     media/desviación/cuantiles).
+   - cache: src.cache_perfiles.CachePerfiles para reutilizar las columnas que no han cambiado.
+   - Retorna: dict {columna: dict de estadísticas}.
+
+5) analisis_exploratorio(df, nombre_df="DataFrame", mostrar_head=5, round_decimals=2, mostrar=True,
+                         cache=None)
    - Función principal que organiza y muestra:
      - Estructura básica (report_structure)
      - Resumen de variables categóricas (categorical_summary)
      - Resumen de variables numéricas (describe)
      - Tabla de valores faltantes con porcentajes
+   - Con mostrar=False no imprime ni carga IPython (modo batch).
    - Retorna un dict con los resultados intermedios (estructura, listas de columnas, missing, etc.).
 
+6) perfil_json(df, nombre_df="DataFrame", top_n=3, cache=None)
+   - Perfil compacto y serializable (solo tipos JSON) con forma, dtypes y estadísticas por columna.
+   - No imprime nada; es lo que devuelve run_checks(call_analisis=True, mostrar=False).
+
+7) guardar_perfil(perfil, ruta)
+   - Escribe un perfil de perfil_json en disco como JSON (UTF-8).
+
+8) calcular_tasa_proporciones(df, variable)
+   - Tasa de suscripción (y=1) por categoría de una variable: fracasos, exitos, total, tasa_exito.
+
+9) calcular_tasas_multiples(df, variables, combinaciones=None, nivel_confianza=0.95)
+   - Igual que calcular_tasa_proporciones pero para muchas variables (y pares de variables)
+     a la vez, agregando sobre códigos de categoría con np.bincount.
+   - Añade intervalo de confianza de Wilson (ic_inferior, ic_superior, en %).
+   - Retorna: dict {variable o (var1, var2): DataFrame}. Benchmark: `python -m benchmarks.bench_tasas`.
+
+10) tasas_por_segmentos(df, segmentos, nivel_confianza=0.95, n_procesos=None)
+   - Tasas con intervalo de Wilson para muchas definiciones de segmento en una sola llamada:
+     columnas categóricas, bandas numéricas {'columna', 'bins', 'labels'} y cruces de dos segmentos.
+   - Codifica cada variable una vez y reparte los segmentos en un pool de procesos que lee los
+     códigos desde memoria compartida.
+   - Retorna: DataFrame ordenado [segmento, valor_1, valor_2, fracasos, exitos, total, tasa_exito,
+     ic_inferior, ic_superior]. Benchmark: `python -m benchmarks.bench_segmentos`.
+
+11) es_categorica(dtype) / es_numerica(dtype)
+   - Criterio de tipo de los perfiles: categórica = object o category; numérica = como
+     select_dtypes(include=[np.number]), sin bool. Lo comparten src.perfiles y src.eda_por_bloques.
+
+12) valor_json(valor)
+   - Convierte un escalar numpy/pandas a un tipo JSON (NaN/NaT → None, resto → str).
+   - Se usa en perfil_json, src.perfiles y src.imputacion para serializar a disco.
+
+13) informe_desde_perfil(perfil, estructura, nombre_df, round_decimals, mostrar)
+   - Genera el informe de analisis_exploratorio a partir de un perfil ya calculado (perfil_columnas
+     o src.eda_por_bloques.perfil_por_bloques) y la estructura {'shape', 'dtypes', 'head'}.
+
+14) tabla_categoricas(perfil)
+   - Tabla de categorical_summary (n_unique, top_values, top_counts) a partir de un perfil.
+
+15) codigos_bandas(serie, bins, labels=None, right=True)
+   - Bandas numéricas como pd.cut pero devolviendo códigos int64 (-1 = fuera de rango o NaN) y
+     las etiquetas; lo usan tasas_por_segmentos y src.variables_derivadas.
+
 ------------------------------------------------------
 BUENAS PRÁCTICAS/TIPS:
 ------------------------------------------------------
 - Llama a analisis_exploratorio(df) tras cargar un DataFrame para una inspección rápida.
+- En scripts o jobs batch usa mostrar=False / perfil_json: IPython solo se importa si hay algo que mostrar.
+- Si el informe se repite sobre el mismo DataFrame tras pequeños cambios, pasar cache=CachePerfiles():
+  solo se recalculan las columnas modificadas.
+- Para ficheros de data/processed/ que no caben en memoria, src.eda_por_bloques genera el mismo informe
+  leyendo por bloques.
+- En tasas_por_segmentos las bandas se definen con bins/labels (como pd.cut): no hace falta crear
+  columnas auxiliares con pd.cut en el DataFrame. En scripts lanzados en Windows/macOS (procesos
+  'spawn') la llamada debe ir bajo if __name__ == '__main__'; en notebooks no hace falta.
 - Este módulo se centra en reporting; NO debe mutar el DataFrame de entrada.
 - Para transformaciones (coerciones, imputaciones), utiliza src.data_cleaning, para utiliza visualizaciones src.plotting.
 
@@ -63,28 +124,55 @@ __all__ = [
     "report_structure",
     "get_categorical_columns",
     "categorical_summary",
+    "perfil_columnas",
+    "perfil_json",
+    "guardar_perfil",
+    "calcular_tasa_proporciones",
+    "calcular_tasas_multiples",
+    "tasas_por_segmentos",
+    "es_categorica",
+    "es_numerica",
+    "valor_json",
+    "informe_desde_perfil",
+    "tabla_categoricas",
+    "codigos_bandas",
 ]
 
-def report_structure(df: pd.DataFrame, show_head: int = 5) -> Dict:
+CUANTILES_DESCRIBE = [0.25, 0.5, 0.75]
+
+def display(obj) -> None:
+    """Renderiza obj con IPython.display; IPython se importa solo cuando se usa."""
+    from IPython.display import display as ipython_display
+    ipython_display(obj)
+
+def _sin_salida(*args, **kwargs) -> None:
+    """Sustituto de print/display en modo silencioso."""
+
+def report_structure(df: pd.DataFrame, show_head: int = 5, mostrar: bool = True) -> Dict:
     """Imprime y devuelve información básica: shape, dtypes y primeras filas.
     args:
         df (pd.DataFrame): DataFrame a analizar.
         show_head (int): número de filas a mostrar del head.
+        mostrar (bool): si False no imprime ni renderiza nada.
     returns:
         Dict: diccionario con 'shape', 'dtypes' y 'head'."""
-        
     info = {
         "shape": df.shape,
         "dtypes": df.dtypes,
         "head": df.head(show_head)
     }
-    print("1) ESTRUCTURA BÁSICA")
-    print("-" * 40)
-    print(f"Dimensiones: {info['shape']}")
-    print("\nTipos de datos:")
-    print(info["dtypes"])
-    print("\nPrimeras filas:")
-    display(info["head"])
+    return _mostrar_estructura(info, mostrar)
+
+def _mostrar_estructura(info: Dict, mostrar: bool) -> Dict:
+    """Sección 1 del informe a partir de {'shape', 'dtypes', 'head'}."""
+    salida, render = (print, display) if mostrar else (_sin_salida, _sin_salida)
+    salida("1) ESTRUCTURA BÁSICA")
+    salida("-" * 40)
+    salida(f"Dimensiones: {info['shape']}")
+    salida("\nTipos de datos:")
+    salida(info["dtypes"])
+    salida("\nPrimeras filas:")
+    render(info["head"])
     return info
 
 def get_categorical_columns(df: pd.DataFrame) -> List[str]:
@@ -109,27 +197,114 @@ def categorical_summary(df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
             - 'top_values': lista de top N valores
             - 'top_counts': lista de cuentas correspondientes
     """
-    cat_cols = get_categorical_columns(df)
-    rows = []
-    for c in cat_cols:
-        vc = df[c].value_counts(dropna=False)
-        top_values = vc.index[:top_n].tolist()
-        top_counts = vc.values[:top_n].tolist()
-        rows.append({
-            "column": c,
-            "n_unique": int(df[c].nunique(dropna=False)),
-            "top_values": top_values,
-            "top_counts": top_counts
-        })
+    perfil = perfil_columnas(df, columnas=get_categorical_columns(df), top_n=top_n)
+    return tabla_categoricas(perfil)
+
+def es_categorica(dtype) -> bool:
+    """True si el dtype se trata como categórico en los perfiles (object o category)."""
+    return pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+
+def es_numerica(dtype) -> bool:
+    """True si el dtype se trata como numérico en los perfiles.
+    Mismo criterio que select_dtypes(include=[np.number]): excluye bool."""
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+def _perfil_columna(serie: pd.Series, top_n: int = 3, max_valores: int = 11) -> Dict:
+    """Estadísticas de una columna para perfil_columnas."""
+    total = len(serie)
+    if es_categorica(serie.dtype):
+        vc = serie.value_counts(dropna=False)
+        missing = int(vc[vc.index.isna()].sum())
+        # En category, value_counts incluye categorías sin uso (con cuenta 0)
+        n_unique = int((vc > 0).sum())
+        return {
+            "tipo": "categorica",
+            "count": total - missing,
+            "missing": missing,
+            "n_unique": n_unique,
+            "top_values": vc.index[:top_n].tolist(),
+            "top_counts": vc.values[:top_n].tolist(),
+            "value_counts": vc if n_unique <= max_valores else None,
+        }
+    if es_numerica(serie.dtype):
+        valores = serie.to_numpy(dtype="float64", na_value=np.nan)
+        validos = valores[~np.isnan(valores)]
+        n = len(validos)
+        cuantiles = (np.quantile(validos, [0.0] + CUANTILES_DESCRIBE + [1.0])
+                     if n else np.full(len(CUANTILES_DESCRIBE) + 2, np.nan))
+        estadisticas = {
+            "tipo": "numerica",
+            "count": n,
+            "missing": total - n,
+            "mean": validos.mean() if n else np.nan,
+            "std": validos.std(ddof=1) if n > 1 else np.nan,
+            "min": cuantiles[0],
+        }
+        for q, valor in zip(CUANTILES_DESCRIBE, cuantiles[1:-1]):
+            estadisticas[f"{q:.0%}"] = valor
+        estadisticas["max"] = cuantiles[-1]
+        return estadisticas
+    missing = int(serie.isna().sum())
+    return {"tipo": "otra", "count": total - missing, "missing": missing}
+
+def perfil_columnas(df: pd.DataFrame, columnas: List[str] = None,
+                    top_n: int = 3, max_valores: int = 11, cache=None) -> Dict[str, Dict]:
+    """
+    Motor de profiling del informe EDA: una sola pasada por columna y sin copias del DataFrame.
+    - Categóricas (object/category): un único value_counts(dropna=False) del que salen
+      cardinalidad, top N, faltantes y, si hay pocos valores, la tabla completa.
+    - Numéricas: un único array float64 de la columna del que salen count, media,
+      desviación y cuantiles (mismos valores que describe()).
+    - Resto (fechas, bool...): conteo de faltantes.
+    args:
+        df (pd.DataFrame): DataFrame a analizar (no se modifica).
+        columnas (List[str]): columnas a perfilar; None = todas.
+        top_n (int): número de valores top a guardar en categóricas.
+        max_valores (int): cardinalidad máxima para guardar la tabla de frecuencias completa.
+        cache (CachePerfiles): si se indica, reutiliza los perfiles de columnas sin cambios
+            (ver src.cache_perfiles).
+    returns:
+        Dict[str, Dict]: {columna: estadísticas}; la clave 'tipo' indica
+            'categorica', 'numerica' u 'otra'.
+    """
+    columnas = df.columns if columnas is None else columnas
+    perfil = {}
+    for c in columnas:
+        if cache is None:
+            perfil[c] = _perfil_columna(df[c], top_n, max_valores)
+        else:
+            perfil[c] = cache.perfil(df[c], lambda s: _perfil_columna(s, top_n, max_valores),
+                                     top_n=top_n, max_valores=max_valores)
+    return perfil
+
+def tabla_categoricas(perfil: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Formato de categorical_summary a partir de un perfil.
+    args:
+        perfil (Dict): {columna: estadísticas}, de perfil_columnas o perfil_por_bloques.
+    returns:
+        pd.DataFrame: 'n_unique', 'top_values' y 'top_counts' por columna categórica.
+    """
+    rows = [{"column": c, "n_unique": p["n_unique"], "top_values": p["top_values"],
+             "top_counts": p["top_counts"]}
+            for c, p in perfil.items() if p["tipo"] == "categorica"]
     if rows:
         return pd.DataFrame(rows).set_index('column')
     else:
         return pd.DataFrame(columns=['n_unique', 'top_values', 'top_counts'])
 
+def _tabla_describe(perfil: Dict[str, Dict]) -> pd.DataFrame:
+    """Equivalente a df.select_dtypes(np.number).describe().T a partir de un perfil."""
+    campos = ["count", "mean", "std", "min"] + [f"{q:.0%}" for q in CUANTILES_DESCRIBE] + ["max"]
+    filas = {c: [p[k] for k in campos] for c, p in perfil.items() if p["tipo"] == "numerica"}
+    return pd.DataFrame.from_dict(filas, orient="index", columns=campos, dtype="float64")
+
 def analisis_exploratorio(df: pd.DataFrame,
                           nombre_df: str = "DataFrame",
                           mostrar_head: int = 5,
-                          round_decimals: int = 2) -> Dict:
+                          round_decimals: int = 2,
+                          mostrar: bool = True,
+                          cache=None) -> Dict:
     """
     Función principal de reporting para EDA.
     Llama a helpers (report_structure, categorical_summary) y muestra:
@@ -143,59 +318,139 @@ def analisis_exploratorio(df: pd.DataFrame,
         nombre_df (str): nombre descriptivo del DataFrame.
         mostrar_head (int): filas a mostrar en estructura.
         round_decimals (int): decimales para resumen numérico.
+        mostrar (bool): si False no imprime ni renderiza (ni importa IPython).
+        cache (CachePerfiles): reutiliza las estadísticas de columnas sin cambios.
     returns:
         Dict: diccionario con resultados intermedios.  
     """
-    print(f"ANÁLISIS EXPLORATORIO DE {nombre_df.upper()}")
-    print("=" * 50)
+    estructura = {"shape": df.shape, "dtypes": df.dtypes, "head": df.head(mostrar_head)}
+    # perfil de todas las columnas en una pasada (sin copias del DataFrame)
+    perfil = perfil_columnas(df, top_n=3, cache=cache)
+    return informe_desde_perfil(perfil, estructura, nombre_df, round_decimals, mostrar)
+
+def informe_desde_perfil(perfil: Dict[str, Dict], estructura: Dict, nombre_df: str,
+                         round_decimals: int, mostrar: bool) -> Dict:
+    """
+    Informe de analisis_exploratorio a partir de un perfil y la estructura del DataFrame
+    (compartido por el modo en memoria y el modo por bloques).
+    args:
+        perfil (Dict): {columna: estadísticas}, de perfil_columnas o perfil_por_bloques.
+        estructura (Dict): {'shape', 'dtypes', 'head'} como report_structure.
+        nombre_df (str): nombre para el informe.
+        round_decimals (int): decimales para resumen numérico.
+        mostrar (bool): si False no imprime ni renderiza (ni importa IPython).
+    returns:
+        Dict: mismas claves que analisis_exploratorio.
+    """
+    salida, render = (print, display) if mostrar else (_sin_salida, _sin_salida)
+    salida(f"ANÁLISIS EXPLORATORIO DE {nombre_df.upper()}")
+    salida("=" * 50)
 
     resultados = {}
     # estructura básica
-    resultados['structure'] = report_structure(df, show_head=mostrar_head)
+    resultados['structure'] = _mostrar_estructura(estructura, mostrar)
+    n_filas, n_columnas = estructura['shape']
 
     # categóricas
-    cat_cols = get_categorical_columns(df)
+    cat_cols = [c for c, p in perfil.items() if p["tipo"] == "categorica"]
     resultados['categorical_columns'] = cat_cols
     if cat_cols:
-        print("\n2) VARIABLES CATEGÓRICAS")
-        print("-" * 40)
-        print("Columnas categóricas:", cat_cols)
-        resultados['categorical_summary'] = categorical_summary(df, top_n=3)
-        display(resultados['categorical_summary'])
+        salida("\n2) VARIABLES CATEGÓRICAS")
+        salida("-" * 40)
+        salida("Columnas categóricas:", cat_cols)
+        resultados['categorical_summary'] = tabla_categoricas(perfil)
+        render(resultados['categorical_summary'])
         # mostrar top values concisos para cardinalidad pequeña
         for col in cat_cols:
-            n_unique = df[col].nunique(dropna=False)
-            print(f"\n- {col}: {n_unique} valores únicos")
+            n_unique = perfil[col]["n_unique"]
+            salida(f"\n- {col}: {n_unique} valores únicos")
             if n_unique <= 11:
-                display(df[col].value_counts(dropna=False))
+                render(perfil[col]["value_counts"])
 
     # numéricas
-    numericas = df.select_dtypes(include=[np.number])
-    resultados['numeric_columns'] = numericas.columns.tolist()
-    if not numericas.empty:
-        print("\n3) VARIABLES NUMÉRICAS")
-        print("-" * 40)
-        print("Columnas numéricas:", resultados['numeric_columns'])
-        display(numericas.describe().T.round(round_decimals))
+    resultados['numeric_columns'] = [c for c, p in perfil.items() if p["tipo"] == "numerica"]
+    if resultados['numeric_columns']:
+        salida("\n3) VARIABLES NUMÉRICAS")
+        salida("-" * 40)
+        salida("Columnas numéricas:", resultados['numeric_columns'])
+        render(_tabla_describe(perfil).round(round_decimals))
 
     # faltantes
-    print("\n4) VALORES FALTANTES")
-    print("-" * 40)
-    missing = df.isnull().sum()
-    missing_pct = (missing / len(df) * 100).round(2)
+    salida("\n4) VALORES FALTANTES")
+    salida("-" * 40)
+    missing = pd.Series({c: p["missing"] for c, p in perfil.items()}, index=estructura['dtypes'].index,
+                        dtype="int64")
+    missing_pct = (missing / n_filas * 100).round(2)
     miss_df = pd.DataFrame({'missing_count': missing, 'missing_pct': missing_pct})
     resultados['missing'] = miss_df
-    display(miss_df[miss_df['missing_count'] > 0].sort_values('missing_pct', ascending=False))
+    render(miss_df[miss_df['missing_count'] > 0].sort_values('missing_pct', ascending=False))
 
     # resumen
-    print("\n5) RESUMEN")
-    print("-" * 40)
-    print(f"Total registros: {len(df)}")
-    print(f"Total columnas: {df.shape[1]}")
+    salida("\n5) RESUMEN")
+    salida("-" * 40)
+    salida(f"Total registros: {n_filas}")
+    salida(f"Total columnas: {n_columnas}")
 
     return resultados
 
 
+def valor_json(valor: Any) -> Any:
+    """Convierte escalares numpy/pandas a tipos JSON (NaN/NaT → None, resto → str)."""
+    if valor is None or (np.ndim(valor) == 0 and pd.isna(valor)):
+        return None
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, (int, np.integer)):
+        return int(valor)
+    if isinstance(valor, (float, np.floating)):
+        return float(valor)
+    return valor if isinstance(valor, str) else str(valor)
+
+def perfil_json(df: pd.DataFrame, nombre_df: str = "DataFrame", top_n: int = 3, cache=None) -> Dict:
+    """
+    Perfil compacto y serializable del DataFrame para modo batch (no imprime nada).
+    Usa perfil_columnas y convierte todo a tipos JSON; las tablas de frecuencias
+    completas solo se incluyen para columnas de baja cardinalidad.
+    args:
+        df (pd.DataFrame): DataFrame a analizar.
+        nombre_df (str): nombre descriptivo del DataFrame.
+        top_n (int): número de valores top por columna categórica.
+        cache (CachePerfiles): reutiliza las estadísticas de columnas sin cambios.
+    returns:
+        Dict: {'nombre', 'n_filas', 'n_columnas', 'dtypes', 'columnas': {columna: estadísticas}}.
+    """
+    columnas = {}
+    for c, p in perfil_columnas(df, top_n=top_n, cache=cache).items():
+        entrada = {}
+        for k, v in p.items():
+            if k == "value_counts":
+                if v is not None:
+                    entrada[k] = {str(valor_json(i)): int(n) for i, n in v.items()}
+            elif isinstance(v, list):
+                entrada[k] = [valor_json(x) for x in v]
+            else:
+                entrada[k] = valor_json(v)
+        columnas[str(c)] = entrada
+    return {
+        "nombre": nombre_df,
+        "n_filas": int(len(df)),
+        "n_columnas": int(df.shape[1]),
+        "dtypes": {str(c): str(t) for c, t in df.dtypes.items()},
+        "columnas": columnas,
+    }
+
+def guardar_perfil(perfil: Dict, ruta: str) -> str:
+    """Guarda un perfil de perfil_json como JSON.
+    args:
+        perfil (Dict): perfil serializable.
+        ruta (str): fichero destino.
+    returns:
+        str: ruta del fichero escrito."""
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(perfil, f, ensure_ascii=False, indent=2)
+    return ruta
+
+
 def calcular_tasa_proporciones(df: pd.DataFrame, variable: str) -> pd.DataFrame:
     """
     Calcula tasas de suscripción (y=1) por categoría.
@@ -236,4 +491,320 @@ def calcular_tasa_proporciones(df: pd.DataFrame, variable: str) -> pd.DataFrame:
         resultado['exitos'].astype(float) / resultado['total'].astype(float)
     ) * 100
     
-    return resultado.reset_index(drop=True)
\ No newline at end of file
+    return resultado.reset_index(drop=True)
+
+def _codigos_categoria(serie: pd.Series):
+    """Códigos enteros (-1 = NaN) y categorías ordenadas como en pd.crosstab."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return serie.cat.codes.to_numpy(dtype="int64"), serie.cat.categories
+    codigos, categorias = pd.factorize(serie, sort=True)
+    return codigos.astype("int64"), categorias
+
+
+def _valores_tabla(serie: pd.Series, categorias, indices: np.ndarray):
+    """Columna de categorías del resultado con el mismo dtype que usaría crosstab."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return pd.Categorical.from_codes(indices, dtype=serie.dtype)
+    return categorias.take(indices)
+
+
+def _clase_y(y: pd.Series) -> np.ndarray:
+    """Clase de cada fila: 0 = fracaso, 1 = éxito, 2 = otro valor de 'y', 3 = 'y' faltante."""
+    y = pd.to_numeric(y, errors='coerce').to_numpy(dtype="float64", na_value=np.nan)
+    return np.select([y == 0, y == 1, np.isnan(y)], [0, 1, 3], default=2).astype("int64")
+
+
+def _conteos_celdas(codigos: List[np.ndarray], tamanos: List[int], clase_y: np.ndarray):
+    """
+    Fracasos y éxitos por celda de una o varias variables codificadas (-1 = NaN).
+    Retorna (celdas, fracasos, exitos): código combinado (mixed radix) de cada celda con al
+    menos una fila con 'y' informada, como en pd.crosstab.
+    """
+    codigo = codigos[0].astype("int64", copy=False)
+    for c, n in zip(codigos[1:], tamanos[1:]):
+        codigo = np.where((codigo >= 0) & (c >= 0), codigo * n + c, -1)
+    n_celdas = int(np.prod(tamanos))
+
+    if n_celdas > 4 * len(codigo) + 1024:
+        # Cruce de alta cardinalidad: se compactan los códigos para no reservar celdas vacías
+        valido = codigo >= 0
+        celdas_usadas, codigo_valido = np.unique(codigo[valido], return_inverse=True)
+        codigo = np.full(len(codigo), -1, dtype="int64")
+        codigo[valido] = codigo_valido
+        n_celdas = len(celdas_usadas)
+    else:
+        celdas_usadas = np.arange(n_celdas)
+
+    # Un único bincount por tabla: celda x clase de 'y' (la celda extra recoge los NaN)
+    codigo = np.where(codigo >= 0, codigo, n_celdas)
+    conteos = np.bincount(codigo * 4 + clase_y, minlength=(n_celdas + 1) * 4).reshape(-1, 4)[:n_celdas]
+    posiciones = np.flatnonzero(conteos[:, :3].sum(axis=1))
+    return celdas_usadas[posiciones], conteos[posiciones, 0], conteos[posiciones, 1]
+
+
+def _con_intervalo_wilson(resultado: pd.DataFrame, z: float) -> pd.DataFrame:
+    """Añade tasa_exito e intervalo de Wilson (en %) a partir de 'exitos' y 'total'."""
+    total = resultado['total'].to_numpy(dtype="float64")
+    # Intervalo de Wilson (válido también con tasas 0 o 1 y muestras pequeñas)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = resultado['exitos'].to_numpy(dtype="float64") / total
+        resultado['tasa_exito'] = p * 100
+        centro = (p + z ** 2 / (2 * total)) / (1 + z ** 2 / total)
+        margen = z * np.sqrt(p * (1 - p) / total + z ** 2 / (4 * total ** 2)) / (1 + z ** 2 / total)
+    resultado['ic_inferior'] = (centro - margen) * 100
+    resultado['ic_superior'] = (centro + margen) * 100
+    return resultado
+
+
+def calcular_tasas_multiples(df: pd.DataFrame,
+                             variables: List[str],
+                             combinaciones: Union[bool, List[tuple], None] = None,
+                             nivel_confianza: float = 0.95) -> Dict:
+    """
+    Versión por lotes de calcular_tasa_proporciones para muchas variables a la vez.
+    Convierte 'y' una sola vez y, para cada variable (o par de variables), agrega
+    éxitos y fracasos sobre los códigos de categoría con np.bincount en lugar de
+    construir un pd.crosstab por llamada. Añade el intervalo de confianza de Wilson.
+    
+    Args:
+        df: DataFrame con columna 'y' (0/1) y las variables a analizar
+        variables: Lista de columnas categóricas
+        combinaciones: True para todos los pares de variables, o lista de pares
+            (var1, var2) a cruzar; None para no cruzar
+        nivel_confianza: Nivel del intervalo de confianza (ej. 0.95)
+    
+    Returns:
+        Dict {variable o (var1, var2): DataFrame} con columnas
+        [variable(s), fracasos, exitos, total, tasa_exito, ic_inferior, ic_superior];
+        tasas e intervalos en porcentaje, como calcular_tasa_proporciones.
+    
+    Raises:
+        ValueError: Si falta alguna columna requerida
+    
+    Example:
+        >>> tasas = calcular_tasas_multiples(df, ['education', 'marital'], combinaciones=True)
+        >>> tasas[('education', 'marital')].sort_values('tasa_exito', ascending=False)
+    """
+    from itertools import combinations
+    from statistics import NormalDist
+
+    if combinaciones is True:
+        combinaciones = list(combinations(variables, 2))
+    combinaciones = [tuple(par) for par in (combinaciones or [])]
+
+    # Validaciones
+    faltantes = [v for v in dict.fromkeys(list(variables) + [v for par in combinaciones for v in par])
+                 if v not in df.columns]
+    if faltantes:
+        raise ValueError(f"Columnas {faltantes} no existen. Columnas disponibles: {df.columns.tolist()}")
+    if 'y' not in df.columns:
+        raise ValueError("DataFrame debe contener columna 'y' (variable objetivo)")
+
+    clase_y = _clase_y(df['y'])
+    z = NormalDist().inv_cdf(0.5 + nivel_confianza / 2)
+
+    codigos = {v: _codigos_categoria(df[v])
+               for v in dict.fromkeys(list(variables) + [v for par in combinaciones for v in par])}
+
+    def agregar(claves: List[str]) -> pd.DataFrame:
+        tamanos = [len(codigos[v][1]) for v in claves]
+        celdas, fracasos, exitos = _conteos_celdas([codigos[v][0] for v in claves], tamanos, clase_y)
+
+        resultado = pd.DataFrame()
+        resto = celdas
+        for v, n in reversed(list(zip(claves, tamanos))):
+            resultado[v] = _valores_tabla(df[v], codigos[v][1], resto % n)
+            resto = resto // n
+        resultado = resultado[claves]
+        resultado['fracasos'] = fracasos
+        resultado['exitos'] = exitos
+        resultado['total'] = resultado['fracasos'] + resultado['exitos']
+        return _con_intervalo_wilson(resultado, z)
+
+    tasas = {v: agregar([v]) for v in variables}
+    for par in combinaciones:
+        tasas[par] = agregar(list(par))
+    return tasas
+
+
+# Por debajo de este número de filas el arranque del pool cuesta más que los bincount
+_MIN_FILAS_PROCESOS = 500_000
+# Matriz de códigos compartida en cada proceso del pool (la rellena _adjuntar_codigos)
+_CODIGOS_COMPARTIDOS: Dict[str, Any] = {}
+
+
+def codigos_bandas(serie: pd.Series, bins, labels=None, right: bool = True):
+    """
+    Códigos (-1 = fuera de rango o NaN) y etiquetas de las bandas, con la semántica de pd.cut.
+    args:
+        serie (pd.Series): valores numéricos (el texto no numérico cuenta como NaN).
+        bins: bordes crecientes de las bandas.
+        labels: etiquetas de las bandas; None = intervalos, como pd.cut.
+        right (bool): bandas cerradas por la derecha (a, b] o, si False, [a, b).
+    returns:
+        Tuple[np.ndarray, pd.Index]: códigos int64 por fila y etiquetas por banda.
+    """
+    bordes = np.asarray(bins, dtype="float64")
+    if bordes.ndim != 1 or len(bordes) < 2 or np.any(np.diff(bordes) <= 0):
+        raise ValueError(f"bins debe ser una lista creciente de al menos 2 bordes: {bins}")
+    n_bandas = len(bordes) - 1
+    if labels is None:
+        etiquetas = pd.IntervalIndex.from_breaks(bins, closed='right' if right else 'left')
+    elif len(labels) != n_bandas:
+        raise ValueError(f"labels debe tener {n_bandas} etiquetas, una por banda")
+    else:
+        etiquetas = pd.Index(labels)
+    x = pd.to_numeric(serie, errors='coerce').to_numpy(dtype="float64", na_value=np.nan)
+    # (a, b] -> searchsorted por la izquierda; [a, b) -> por la derecha. Los NaN quedan al final.
+    codigos = np.searchsorted(bordes, x, side='left' if right else 'right') - 1
+    codigos[(codigos < 0) | (codigos >= n_bandas)] = -1
+    return codigos, etiquetas
+
+
+def _adjuntar_codigos(nombre: str, forma: tuple) -> None:
+    """Inicializador del pool: abre la matriz de códigos en memoria compartida (solo lectura)."""
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=nombre)
+    matriz = np.ndarray(forma, dtype="int32", buffer=shm.buf)
+    matriz.flags.writeable = False
+    _CODIGOS_COMPARTIDOS['shm'] = shm
+    _CODIGOS_COMPARTIDOS['matriz'] = matriz
+
+
+def _contar_segmento(matriz: np.ndarray, filas: List[int], tamanos: List[int]):
+    """Conteos de un segmento: filas de la matriz de códigos a cruzar; la última fila es clase_y."""
+    return _conteos_celdas([matriz[f] for f in filas], tamanos, matriz[-1])
+
+
+def _contar_segmento_compartido(filas: List[int], tamanos: List[int]):
+    return _contar_segmento(_CODIGOS_COMPARTIDOS['matriz'], filas, tamanos)
+
+
+def tasas_por_segmentos(df: pd.DataFrame,
+                        segmentos: Dict[str, Any],
+                        nivel_confianza: float = 0.95,
+                        n_procesos: int = None) -> pd.DataFrame:
+    """
+    Tasas de suscripción (y=1) para muchas definiciones de segmento en una sola tabla.
+    Codifica cada variable una sola vez (categorías o bandas numéricas con np.searchsorted,
+    sin pd.cut), guarda los códigos en una matriz int32 y evalúa cada segmento con un
+    np.bincount, repartiendo los segmentos entre procesos que leen la matriz desde memoria
+    compartida sin copiarla.
+    
+    Args:
+        df: DataFrame con columna 'y' (0/1) y las variables de los segmentos
+        segmentos: Dict {nombre: definición}, donde la definición es
+            - 'columna': variable categórica (como calcular_tasa_proporciones)
+            - {'columna': 'age', 'bins': [0, 25, 35, 120], 'labels': None, 'right': True}:
+              bandas numéricas con la semántica de pd.cut (por defecto intervalos (a, b])
+            - ('nombre_a', 'nombre_b'): cruce de dos segmentos; cada elemento es otro
+              nombre de segmentos (no un cruce) o una columna categórica
+        nivel_confianza: Nivel del intervalo de confianza de Wilson (ej. 0.95)
+        n_procesos: Procesos del pool (None = os.cpu_count()); con 1, o con menos de
+            500.000 filas o un solo segmento, se calcula en el proceso actual
+    
+    Returns:
+        DataFrame ordenado con columnas [segmento, valor_1, valor_2, fracasos, exitos, total,
+        tasa_exito, ic_inferior, ic_superior]; valor_2 es NaN salvo en los cruces.
+        Tasas e intervalos en porcentaje.
+    
+    Raises:
+        ValueError: Si falta alguna columna requerida o una definición no es válida
+    
+    Example:
+        >>> tasas = tasas_por_segmentos(df, {
+        ...     'segmento_edad': 'segmento_edad',
+        ...     'antiguedad': {'columna': 'antiguedad_años', 'bins': [0, 1, 2, 5, 50]},
+        ...     'edad_x_educacion': ('segmento_edad', 'education'),
+        ... })
+        >>> tasas[tasas['segmento'] == 'antiguedad']
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    from statistics import NormalDist
+
+    if 'y' not in df.columns:
+        raise ValueError("DataFrame debe contener columna 'y' (variable objetivo)")
+
+    # Definiciones base (columna o bandas) que hay que codificar, una sola vez cada una
+    bases: Dict[str, Any] = {}
+
+    def base(nombre: str, definicion: Any) -> str:
+        if isinstance(definicion, str):
+            definicion = {'columna': definicion}
+        if not isinstance(definicion, dict) or 'columna' not in definicion:
+            raise ValueError(f"Definición de segmento '{nombre}' no válida: {definicion!r}")
+        if definicion['columna'] not in df.columns:
+            raise ValueError(f"Columna '{definicion['columna']}' no existe. "
+                             f"Columnas disponibles: {df.columns.tolist()}")
+        bases.setdefault(nombre, definicion)
+        return nombre
+
+    tareas: Dict[str, List[str]] = {}
+    for nombre, definicion in segmentos.items():
+        if isinstance(definicion, tuple):
+            if len(definicion) != 2:
+                raise ValueError(f"El cruce '{nombre}' debe tener exactamente dos elementos")
+            claves = []
+            for elemento in definicion:
+                if isinstance(segmentos.get(elemento), tuple):
+                    raise ValueError(f"El cruce '{nombre}' no puede incluir otro cruce ('{elemento}')")
+                claves.append(base(elemento, segmentos.get(elemento, elemento)))
+            tareas[nombre] = claves
+        else:
+            tareas[nombre] = [base(nombre, definicion)]
+
+    # Matriz de códigos: una fila por definición base y una última fila con la clase de 'y'
+    fila = {nombre: i for i, nombre in enumerate(bases)}
+    etiquetas = {}
+    matriz = np.empty((len(bases) + 1, len(df)), dtype="int32")
+    for nombre, definicion in bases.items():
+        serie = df[definicion['columna']]
+        if 'bins' in definicion:
+            codigos, etiquetas[nombre] = codigos_bandas(serie, definicion['bins'], definicion.get('labels'),
+                                                        definicion.get('right', True))
+        else:
+            codigos, etiquetas[nombre] = _codigos_categoria(serie)
+        matriz[fila[nombre]] = codigos
+    matriz[-1] = _clase_y(df['y'])
+
+    argumentos = {nombre: ([fila[c] for c in claves], [len(etiquetas[c]) for c in claves])
+                  for nombre, claves in tareas.items()}
+    n_procesos = min(n_procesos or os.cpu_count() or 1, len(tareas))
+    if n_procesos <= 1 or len(df) < _MIN_FILAS_PROCESOS:
+        conteos = {nombre: _contar_segmento(matriz, *args) for nombre, args in argumentos.items()}
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=matriz.nbytes)
+        try:
+            np.ndarray(matriz.shape, dtype=matriz.dtype, buffer=shm.buf)[:] = matriz
+            del matriz
+            with ProcessPoolExecutor(max_workers=n_procesos, initializer=_adjuntar_codigos,
+                                     initargs=(shm.name, (len(bases) + 1, len(df)))) as pool:
+                futuros = {nombre: pool.submit(_contar_segmento_compartido, *args)
+                           for nombre, args in argumentos.items()}
+                conteos = {nombre: futuro.result() for nombre, futuro in futuros.items()}
+        finally:
+            shm.close()
+            shm.unlink()
+
+    tablas = []
+    for nombre, claves in tareas.items():
+        celdas, fracasos, exitos = conteos[nombre]
+        tamanos = argumentos[nombre][1]
+        tabla = pd.DataFrame({'segmento': nombre}, index=range(len(celdas)))
+        valores, resto = [], celdas
+        for c, n in reversed(list(zip(claves, tamanos))):
+            valores.insert(0, np.asarray(etiquetas[c].astype(object).take(resto % n)))
+            resto = resto // n
+        tabla['valor_1'] = valores[0]
+        tabla['valor_2'] = valores[1] if len(valores) > 1 else np.nan
+        tabla['fracasos'] = fracasos
+        tabla['exitos'] = exitos
+        tablas.append(tabla)
+
+    columnas = ['segmento', 'valor_1', 'valor_2', 'fracasos', 'exitos']
+    resultado = pd.concat(tablas, ignore_index=True) if tablas else pd.DataFrame(columns=columnas)
+    resultado['valor_2'] = resultado['valor_2'].astype(object)
+    resultado['total'] = resultado['fracasos'] + resultado['exitos']
+    return _con_intervalo_wilson(resultado, NormalDist().inv_cdf(0.5 + nivel_confianza / 2))
@@ -0,0 +1,143 @@
+# src/cache_perfiles.py
+import hashlib
+import os
+from collections import OrderedDict
+
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, Optional
+"""
+Módulo: cache_perfiles.py
+======================================================
+
+Memoización de las estadísticas por columna del EDA (perfil_columnas).
+
+Este módulo está diseñado para:
+- Evitar recalcular el informe completo de analisis_exploratorio / run_checks(call_analisis=True)
+  cuando se vuelve a llamar sobre el mismo DataFrame tras pequeños cambios.
+- Identificar cada columna por una huella de su contenido (bytes de la columna o
+  pd.util.hash_pandas_object en texto, por bloques o sobre una muestra) junto con su nombre,
+  dtype y los argumentos de la llamada:
+  si cambia una columna solo se recalculan las estadísticas de esa columna.
+- Acotar la memoria con un LRU de perfiles por columna y, opcionalmente, guardarlos en disco.
+
+------------------------------------------------------
+CLASES Y FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) huella_columna(serie, muestra=None, bloque=1_000_000)
+   - Hash del contenido de la columna (más nombre, dtype y longitud).
+   - muestra: si se indica, solo se hashean ese número de filas equiespaciadas.
+   - Retorna: str hexadecimal.
+
+2) CachePerfiles(max_entradas=4096, cache_dir=None, muestra=None)
+   - cache.perfil(serie, calcular, **parametros): perfil de la columna desde la caché o
+     calculado con calcular(serie) y guardado.
+   - cache.aciertos, cache.fallos, cache.limpiar().
+   - Se pasa como cache=... a perfil_columnas, analisis_exploratorio, perfil_json y run_checks.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- La huella de columnas numéricas, fechas y category es casi gratuita (bytes o códigos); en
+  columnas de texto cuesta un hash por valor, que en identificadores únicos (UUID) es del
+  orden del propio perfil.
+- Con muestra=N la huella es más barata pero un cambio en filas no muestreadas no se detecta:
+  usarla solo si los cambios afectan a columnas enteras (recodificar, imputar, convertir tipos).
+- La carpeta cache_dir se puede borrar sin riesgo; el LRU en memoria no la limita.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+import src.data_cleaning as dc
+from src.cache_perfiles import CachePerfiles
+cache = CachePerfiles(cache_dir='../data/cache/perfiles/')
+resultados = dc.run_checks(df_campaign_clean, call_analisis=True, cache=cache)
+df_campaign_clean['age'] = df_campaign_clean['age'].clip(upper=90)
+resultados = dc.run_checks(df_campaign_clean, call_analisis=True, cache=cache)  # solo recalcula 'age'
+"""
+
+__all__ = [
+    "huella_columna",
+    "CachePerfiles",
+]
+
+
+def _bytes_columna(serie: pd.Series) -> np.ndarray:
+    """Array cuyo contenido identifica los valores de la columna."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Códigos + hash de las categorías: no se hashea cada valor de texto
+        categorias = pd.util.hash_pandas_object(serie.cat.categories, index=False).to_numpy()
+        return np.concatenate([categorias.view(np.uint8), serie.cat.codes.to_numpy().view(np.uint8)])
+    if isinstance(serie.dtype, np.dtype) and serie.dtype.kind in 'biufcmM':
+        # Tipos numpy: los bytes de la columna ya son su contenido
+        return np.ascontiguousarray(serie.to_numpy()).view(np.uint8)
+    # Texto/objetos y extensiones: hash por valor (categorize=False evita factorizar
+    # columnas de alta cardinalidad como los UUID)
+    return pd.util.hash_pandas_object(serie, index=False, categorize=False).to_numpy().view(np.uint8)
+
+
+def huella_columna(serie: pd.Series, muestra: Optional[int] = None, bloque: int = 1_000_000) -> str:
+    """
+    Huella del contenido de una columna para usarla como clave de caché.
+    args:
+        serie (pd.Series): columna a identificar.
+        muestra (int): número de filas equiespaciadas a hashear (None = todas).
+        bloque (int): filas por bloque al hashear (acota la memoria temporal).
+    returns:
+        str: hash hexadecimal de nombre, dtype, longitud y valores.
+    """
+    h = hashlib.sha1(f"{serie.name!r}|{serie.dtype!r}|{len(serie)}".encode(), usedforsecurity=False)
+    if muestra is not None and len(serie) > muestra:
+        serie = serie.iloc[np.linspace(0, len(serie) - 1, muestra).astype(np.int64)]
+    for inicio in range(0, len(serie), bloque):
+        h.update(_bytes_columna(serie.iloc[inicio:inicio + bloque]))
+    return h.hexdigest()
+
+
+class CachePerfiles:
+    """Perfiles por columna indexados por huella + parámetros: LRU en memoria y pickle en disco."""
+
+    def __init__(self, max_entradas: int = 4096, cache_dir: Optional[str] = None,
+                 muestra: Optional[int] = None):
+        self.max_entradas = max_entradas
+        self.cache_dir = cache_dir
+        self.muestra = muestra
+        self.memoria: "OrderedDict[str, Dict]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def clave(self, serie: pd.Series, **parametros) -> str:
+        """Clave de la columna: huella del contenido + parámetros de la llamada."""
+        argumentos = '|'.join(f"{k}={parametros[k]!r}" for k in sorted(parametros))
+        digest = hashlib.sha1(argumentos.encode(), usedforsecurity=False).hexdigest()[:16]
+        return f"{huella_columna(serie, self.muestra)}_{digest}"
+
+    def perfil(self, serie: pd.Series, calcular: Callable[[pd.Series], Dict], **parametros) -> Dict:
+        """Perfil de la columna desde la caché (memoria, luego disco) o calculado con calcular."""
+        clave = self.clave(serie, **parametros)
+        if clave in self.memoria:
+            self.memoria.move_to_end(clave)
+            self.aciertos += 1
+            return self.memoria[clave]
+        ruta = None if self.cache_dir is None else os.path.join(self.cache_dir, f"perfil_{clave}.pkl")
+        if ruta is not None and os.path.exists(ruta):
+            perfil = pd.read_pickle(ruta)
+            self.aciertos += 1
+        else:
+            perfil = calcular(serie)
+            self.fallos += 1
+            if ruta is not None:
+                pd.to_pickle(perfil, ruta)
+        self.memoria[clave] = perfil
+        while len(self.memoria) > self.max_entradas:
+            self.memoria.popitem(last=False)
+        return perfil
+
+    def limpiar(self) -> None:
+        """Vacía la caché en memoria (los ficheros de cache_dir se conservan)."""
+        self.memoria.clear()
+        self.aciertos = 0
+        self.fallos = 0
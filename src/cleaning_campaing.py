@@ -1,7 +1,11 @@
 # src/cleaning_campaing.py
+import warnings
+
 import pandas as pd
 import numpy as np
 import src.data_cleaning as dc
+from src.imputacion import Imputador
+from src.instrumentacion import InformeEjecucion, ejecutar_etapas
 """
 Módulo: cleaning_campaign.py
 ======================================================
@@ -17,12 +21,31 @@ Este módulo está diseñado para:
 ------------------------------------------------------
 FUNCIONES DISPONIBLES EN ESTE MÓDULO:
 ------------------------------------------------------
-1) clean_campaign_df(df_campaign_original)
+1) clean_campaign_df(df_campaign_original, estadisticas=None, optimizar=False, informe=None, callback=None)
     - Función principal que aplica la secuencia completa de limpieza y transformación del DataFrame de la campaña bancaria.
     - Pasos incluidos: corrección de separadores, conversión a `datetime`, recodificación de `pdays` y target `y`, imputación y tipado categórico.
     - Argumentos:
         df_campaign_original (pd.DataFrame): DataFrame original (sin modificar) con los datos de la campaña.
+      optimizar (bool): si True, reduce los dtypes al final con data_cleaning.optimizar_tipos.
+      informe / callback: métricas por etapa (tiempo, memoria, filas afectadas, NaN introducidos), ver src.instrumentacion.
     - Retorna: pd.DataFrame limpio y listo para análisis/modelado.
+2) parse_fecha_es(fecha)
+    - Parsea un único valor 'dd-mes-aaaa' (mes en español) a texto ISO 'aaaa-mm-dd' o NaN.
+3) parse_fecha_es_serie(fechas)
+    - Versión vectorizada para una columna completa: devuelve directamente datetime64[ns] (NaT si no es válida).
+    - Es la que usa clean_campaign_df; benchmark en `python -m benchmarks.bench_fechas`.
+4) estadisticas_campaign(ruta_csv, chunksize=100_000)
+    - Primera pasada por bloques: medianas exactas de las columnas macro y 'age', y moda de 'education'.
+    - Retorna: dict con los valores de imputación globales (se pasa a clean_campaign_df(estadisticas=...)).
+5) clean_campaign_csv(ruta_csv, ruta_salida, chunksize=100_000, normalizar_nombres=True)
+    - Modo streaming: limpia bank-additional.csv por bloques y escribe el CSV procesado de forma incremental.
+    - Memoria pico acotada por chunksize; resultado idéntico a limpiar el fichero completo.
+6) ajustar_imputador_campaign(df_campaign_original)
+    - Aprende sobre el histórico los valores de imputación de clean_campaign_df y las categorías de las columnas categóricas.
+    - Retorna: src.imputacion.Imputador (se guarda con .guardar y se pasa a clean_campaign_df(estadisticas=...)).
+7) leer_campaign_csv(ruta_csv, decimal=None)
+    - Lee bank-additional.csv con las columnas macro como category: la coma decimal se repara una vez por valor distinto.
+    - decimal=',' delega la coma decimal en pd.read_csv (solo si todo el fichero usa coma decimal).
 ------------------------------------------------------
 BUENAS PRÁCTICAS/TIPS:
 ------------------------------------------------------
@@ -34,95 +57,393 @@ EJEMPLO DE USO EN NOTEBOOK:
 ------------------------------------------------------
 import cleaning_campaign as cc
 import pandas as pd
-# Suponiendo que df_campaign ya está cargado
+# Suponiendo que df_campaign ya está cargado (o df_campaign = cc.leer_campaign_csv('../data/raw/bank-additional.csv'))
 df_campaign_clean = cc.clean_campaign_df(df_campaign)
 print(df_campaign_clean.head())
+# Ficheros grandes: limpieza por bloques directamente a disco
+cc.clean_campaign_csv('../data/raw/bank-additional.csv', '../data/processed/df_campaign_clean.csv')
+# Lotes nuevos con los valores de relleno y categorías del histórico
+imp = cc.ajustar_imputador_campaign(df_campaign)
+imp.guardar('../data/processed/imputador_campaign.json')
+df_lote_clean = cc.clean_campaign_df(df_lote, estadisticas=imp)
 
 """
 
-def clean_campaign_df(df_campaign_original):
+__all__ = [
+    "clean_campaign_df",
+    "parse_fecha_es",
+    "parse_fecha_es_serie",
+    "estadisticas_campaign",
+    "clean_campaign_csv",
+    "ajustar_imputador_campaign",
+    "leer_campaign_csv",
+]
+
+COLUMNAS_MACRO = ['cons.price.idx', 'cons.conf.idx', 'euribor3m', 'nr.employed']
+
+CATEGORICAS_CAMPAIGN = ['job', 'marital', 'education', 'contact_month', 'contact_year',
+                        'default', 'housing', 'loan']
+
+COLUMNAS_BINARIAS = ['default', 'housing', 'loan']
+
+COLUMNAS_GEO = ['lat', 'latitude', 'longitude', 'long']
+
+# Etapas de clean_campaign_df, en orden ('optimizacion' solo con optimizar=True)
+ETAPAS_CAMPAIGN = ('decimales', 'fechas', 'recodificacion', 'imputacion', 'binarias',
+                   'categorias', 'geo', 'optimizacion')
+
+MESES_ES = {'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6,
+            'julio': 7, 'agosto': 8, 'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12}
+
+# Límites de datetime64[ns] a resolución de día (fuera de ellos el parseo da NaT)
+_FECHA_MIN = np.datetime64('1677-09-22', 'D')
+_FECHA_MAX = np.datetime64('2262-04-11', 'D')
+
+
+def _reparar_decimales(serie: pd.Series) -> pd.Series:
+    """Sustituye la coma decimal por punto y convierte a float (NaN si no es numérico)."""
+    return dc.a_float_decimal(serie)[0]
+
+
+def _dtype_lectura(read_csv_kwargs: dict) -> dict:
+    """Argumentos de pd.read_csv con las columnas macro como category (texto una vez por valor)."""
+    dtype = read_csv_kwargs.get('dtype')
+    if dtype is None or isinstance(dtype, dict):
+        dtype = {**{c: 'category' for c in COLUMNAS_MACRO}, **(dtype or {})}
+    return {**read_csv_kwargs, 'dtype': dtype}
+
+
+def leer_campaign_csv(ruta_csv, decimal=None, **read_csv_kwargs) -> pd.DataFrame:
     """
-    Limpia y transforma el DataFrame de campañas bancarias (df_campaign).
-    Asegura tipos correctos para 'age' (int) y variables macro (float) 
-    y gestiona NaNs y valores especiales como 999 en 'pdays'.
+    Lee bank-additional.csv preparando las columnas macro para una reparación rápida.
+    Con decimal=None las columnas macro se leen como category: cada valor distinto se guarda
+    una sola vez y clean_campaign_df las convierte a float por categoría. Con decimal=','
+    el propio lector de pandas interpreta la coma decimal (solo si todas las columnas
+    decimales del fichero usan coma; si no, las que usan punto se leerían como texto).
     Args:
-        df_campaign_original (pd.DataFrame): DataFrame original con datos de la campaña.
+        ruta_csv: ruta a bank-additional.csv.
+        decimal (str, opcional): separador decimal para pd.read_csv.
+        **read_csv_kwargs: argumentos extra para pd.read_csv (por defecto index_col=0).
     Returns:
-        pd.DataFrame: DataFrame limpio y listo para análisis/modelado.
+        pd.DataFrame: datos en bruto para clean_campaign_df.
     """
-    df = df_campaign_original.copy()
-    
-    # 1. Limpiar separadores decimales, convertir a FLOAT, e IMPUTAR MEDIANA (Manual)
-    num_float = ['cons.price.idx', 'cons.conf.idx', 'euribor3m', 'nr.employed']
-    for c in num_float:
+    read_csv_kwargs.setdefault('index_col', 0)
+    if decimal is not None:
+        return pd.read_csv(ruta_csv, decimal=decimal, **read_csv_kwargs)
+    return pd.read_csv(ruta_csv, **_dtype_lectura(read_csv_kwargs))
+
+
+def parse_fecha_es(fecha):
+    """
+    Parsea una fecha en formato 'dd-mes-aaaa' con el mes en español (ej. '5-mayo-2014').
+    Versión escalar (una llamada por fila); se conserva como referencia y para el benchmark.
+    Args:
+        fecha: valor de la columna 'date'.
+    Returns:
+        str | float: fecha ISO 'aaaa-mm-dd' o np.nan si el valor no es válido.
+    """
+    if pd.isna(fecha): return np.nan
+    partes = str(fecha).strip().split('-')
+    if len(partes) != 3: return np.nan
+    try:
+        dia = int(partes[0])
+        mes = MESES_ES[partes[1].lower()]
+        anio = int(partes[2])
+        return f"{anio}-{mes:02d}-{dia:02d}"
+    except Exception:
+        return np.nan
+
+
+def parse_fecha_es_serie(fechas: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de parse_fecha_es que devuelve directamente datetime64[ns].
+    Factoriza la columna (las fechas se repiten mucho), separa una sola vez los valores
+    únicos, traduce el mes con una búsqueda en MESES_ES y construye las fechas con
+    aritmética datetime64. Los valores mal formados o fuera de calendario quedan como NaT,
+    igual que con parse_fecha_es + pd.to_datetime(errors='coerce').
+    Args:
+        fechas (pd.Series): columna 'date' original.
+    Returns:
+        pd.Series: serie datetime64[ns] con el mismo índice y nombre.
+    """
+    codigos, unicos = pd.factorize(fechas, use_na_sentinel=True)
+    partes = (pd.Series(unicos, dtype=object).astype(str).str.strip()
+              .str.split('-', expand=True).reindex(columns=range(4)).astype(object))
+    valido = partes[[0, 1, 2]].notna().all(axis=1) & partes[3].isna()
+
+    enteros = {}
+    for i in (0, 2):
+        es_entero = partes[i].str.fullmatch(r'\s*[+-]?\d+\s*', na=False).astype(bool)
+        valido &= es_entero
+        enteros[i] = partes[i].where(es_entero).map(int, na_action='ignore')
+    mes = partes[1].str.lower().map(MESES_ES)
+    valido &= mes.notna()
+
+    # Días de calendario y años representables en datetime64[ns]; el resto da NaT
+    valido &= enteros[0].between(1, 31) & enteros[2].between(1677, 2262)
+    dia = enteros[0].where(valido, 1).to_numpy(dtype='int64')
+    mes = mes.where(valido, 1).to_numpy(dtype='int64')
+    anio = enteros[2].where(valido, 1970).to_numpy(dtype='int64')
+
+    inicio_mes = ((anio - 1970) * 12 + (mes - 1)).astype('datetime64[M]')
+    dias_mes = ((inicio_mes + 1).astype('datetime64[D]') - inicio_mes.astype('datetime64[D]')).astype('int64')
+    resultado = inicio_mes.astype('datetime64[D]') + (dia - 1)
+    valido = (valido.to_numpy() & (dia <= dias_mes)
+              & (resultado >= _FECHA_MIN) & (resultado <= _FECHA_MAX))
+    resultado = np.where(valido, resultado, np.datetime64('NaT')).astype('datetime64[ns]')
+
+    # Expandir de valores únicos a filas (código -1 = NaN original)
+    salida = np.append(resultado, np.datetime64('NaT', 'ns'))[codigos]
+    return pd.Series(salida, index=fechas.index, name=fechas.name)
+
+
+def _mediana_imputacion(df, c, estadisticas):
+    """
+    Mediana con la que imputar c: la del propio lote si estadisticas es None y, si no, la
+    precalculada. Nunca se mezclan: con estadísticas ajustadas, una mediana ausente es un
+    error (KeyError) y una mediana NaN (sin valores al ajustar) se avisa y no imputa.
+    """
+    if estadisticas is None:
+        return df[c].median()
+    if c not in estadisticas:
+        raise KeyError(f"Las estadísticas de imputación no tienen la mediana de '{c}': "
+                       "recalcularlas con estadisticas_campaign o ajustar_imputador_campaign")
+    valor = estadisticas[c]
+    if valor is None or pd.isna(valor):
+        warnings.warn(f"La mediana precalculada de '{c}' es NaN (sin valores al ajustar): "
+                      "sus NaN no se imputan", stacklevel=2)
+        return np.nan
+    return valor
+
+
+def _etapa_decimales(df, estadisticas, informe=None):
+    """1. Limpiar separadores decimales, convertir a FLOAT, e IMPUTAR MEDIANA (Manual)"""
+    # 1.1 Limpieza y conversión a FLOAT (solo las celdas de texto pasan por el parseo)
+    df, reparacion = dc.reparar_decimales(df, COLUMNAS_MACRO, inplace=True)
+    if informe is not None:
+        informe.detalles['nan_coercionados'] = reparacion['nan_coercionados'].to_dict()
+    for c in COLUMNAS_MACRO:
         if c in df.columns:
-            # 1.1 Limpieza y conversión a FLOAT
-            df[c] = df[c].astype(str).str.replace(',', '.', regex=False)
-            df[c] = pd.to_numeric(df[c], errors='coerce')
-            
             # 1.2 Imputación de NaNs de FLOAT (Manual con valor escalar)
             if df[c].isnull().any():
-                median_val = df[c].median()
-                df[c] = df[c].fillna(median_val)
-    
-    # 2. Parsear y convertir columna 'date' (SIN CAMBIOS)
-    meses_es = {'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6,
-                'julio': 7, 'agosto': 8, 'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12}
-    def parse_fecha_es(fecha):
-        if pd.isna(fecha): return np.nan
-        partes = str(fecha).strip().split('-')
-        if len(partes) != 3: return np.nan
-        try:
-            dia = int(partes[0])
-            mes = meses_es[partes[1].lower()]
-            anio = int(partes[2])
-            return f"{anio}-{mes:02d}-{dia:02d}"
-        except Exception:
-            return np.nan
-            
+                median_val = _mediana_imputacion(df, c, estadisticas)
+                if not pd.isna(median_val):
+                    df[c] = df[c].fillna(median_val)
+    return df
+
+
+def _etapa_fechas(df):
+    """2. Parsear y convertir columna 'date' (vectorizado, ver parse_fecha_es_serie)"""
     if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'].apply(parse_fecha_es), format='%Y-%m-%d', errors='coerce')
+        df['date'] = parse_fecha_es_serie(df['date'])
         df['contact_month'] = df['date'].dt.month.astype('Int64')
         df['contact_year'] = df['date'].dt.year.astype('Int64')
+    return df
+
 
-    # 3. Recodificar target 'y', 'pdays', y preparar binarias
+def _etapa_recodificacion(df):
+    """3. Recodificar target 'y', 'pdays', y preparar binarias"""
     if 'y' in df.columns:
         df['y'] = df['y'].map({'yes':1, 'no':0})
     if 'pdays' in df.columns:
         df['previous_contact'] = (df['pdays'] < 999).astype(int)
         df.loc[df['pdays'] == 999, 'pdays'] = np.nan
         
-    for col in ['default', 'housing', 'loan']:
+    for col in COLUMNAS_BINARIAS:
         if col in df.columns:
             df[col] = df[col].astype(str).str.split(',').str[0]
             df[col] = df[col].replace({'nan': '0', 'unknown': '0', '0.0': '0', '1.0': '1'}).fillna('0')
+    return df
 
-    # 4. Imputaciones y Conversión a INT
-    
+
+def _etapa_imputacion(df, estadisticas):
+    """4. Imputaciones y Conversión a INT"""
     # A. Imputación MANUAL de 'age' (MEDIANA ESCALAR y Conversión a INT)
     if 'age' in df.columns:
         if df['age'].isnull().any():
             # **CORRECCIÓN DEL IntCastingNaNError**
-            age_median = df['age'].median() # <-- Usamos mediana para obtener un escalar
+            age_median = _mediana_imputacion(df, 'age', estadisticas)
+            if pd.isna(age_median):
+                raise ValueError("No hay mediana de 'age' para imputar: la precalculada es NaN "
+                                 "o, sin estadísticas, todas las edades del lote son NaN")
             df['age'] = df['age'].fillna(age_median)
         df['age'] = df['age'].astype(int) 
 
-    # B. Imputación por moda (solo 'education' en este punto)
-    df = dc.impute_mode(df, ['education']) 
-    
-    # 5. CONVERSIÓN FINAL DE BINARIAS A INT
-    for col in ['default', 'housing', 'loan']:
+    # B. Imputación por moda (solo 'education' en este punto). df ya es una copia: inplace
+    if estadisticas is None:
+        df = dc.impute_mode(df, ['education'], inplace=True)
+    elif 'education' in df.columns and estadisticas.get('education') is not None:
+        df['education'] = df['education'].fillna(estadisticas['education'])
+    return df
+
+
+def _etapa_binarias(df):
+    """5. CONVERSIÓN FINAL DE BINARIAS A INT"""
+    for col in COLUMNAS_BINARIAS:
         if col in df.columns:
             df[col] = df[col].astype(int) 
+    return df
 
-    # 6. Forzar tipo category a columnas categóricas conocidas
-    cats = ['job','marital','education','contact_month','contact_year','default','housing','loan']
-    cats = [c for c in cats if c in df.columns]
-    df = dc.coerce_to_category(df, cats)
-    
-    # 7. Eliminar columnas geográficas incorrectas (descontextualizadas)
-    for c in ['lat', 'latitude', 'longitude', 'long']:
-        if c in df.columns:
-            df = df.drop(columns=c)
-    
-    return df
\ No newline at end of file
+
+def _etapa_categorias(df, imputador):
+    """6. Forzar tipo category a columnas categóricas conocidas"""
+    cats = [c for c in CATEGORICAS_CAMPAIGN if c in df.columns]
+    df = dc.coerce_to_category(df, cats, inplace=True)
+    if imputador is not None:
+        df = imputador.transform(df, inplace=True)
+    return df
+
+
+def _etapa_geo(df):
+    """7. Eliminar columnas geográficas incorrectas (descontextualizadas)"""
+    geo = [c for c in COLUMNAS_GEO if c in df.columns]
+    if geo:
+        df = df.drop(columns=geo)
+    return df
+
+
+def clean_campaign_df(df_campaign_original, estadisticas=None, optimizar=False,
+                      informe=None, callback=None):
+    """
+    Limpia y transforma el DataFrame de campañas bancarias (df_campaign).
+    Asegura tipos correctos para 'age' (int) y variables macro (float) 
+    y gestiona NaNs y valores especiales como 999 en 'pdays'.
+    Se ejecuta como una secuencia de etapas con nombre (ETAPAS_CAMPAIGN) que pueden medirse
+    con src.instrumentacion.
+    Args:
+        df_campaign_original (pd.DataFrame): DataFrame original con datos de la campaña.
+        estadisticas (dict o Imputador, opcional): valores de imputación precalculados
+            (ver estadisticas_campaign). Si es None se calculan sobre el propio DataFrame.
+            Con un Imputador (ver ajustar_imputador_campaign) se usan además sus categorías:
+            los valores no vistos quedan como NaN. Con estadísticas no se recurre a la mediana
+            del lote: si falta la de una columna con NaN se lanza KeyError.
+        optimizar (bool): si True, reduce los dtypes al final con dc.optimizar_tipos
+            (age/binarias a uint8, macro a float32 cuando es exacto, texto a category).
+        informe (InformeEjecucion, opcional): recibe las métricas de cada etapa (tiempo,
+            memoria pico, filas afectadas, NaN introducidos); en informe.detalles['nan_coercionados']
+            quedan los valores macro no numéricos convertidos a NaN (antes de imputar).
+        callback (callable, opcional): función llamada con el dict de métricas de cada etapa;
+            si no se pasa informe se crea uno interno.
+    Returns:
+        pd.DataFrame: DataFrame limpio y listo para análisis/modelado.
+    """
+    df = df_campaign_original.copy()
+    imputador = estadisticas if isinstance(estadisticas, Imputador) else None
+    if imputador is not None:
+        estadisticas = imputador.valores
+    if informe is None and callback is not None:
+        informe = InformeEjecucion('clean_campaign_df')
+    if informe is not None and callback is not None:
+        informe.callback = callback
+
+    etapas = [
+        ('decimales', lambda d: _etapa_decimales(d, estadisticas, informe), COLUMNAS_MACRO),
+        ('fechas', _etapa_fechas, ['date', 'contact_month', 'contact_year']),
+        ('recodificacion', _etapa_recodificacion, ['y', 'pdays', 'previous_contact'] + COLUMNAS_BINARIAS),
+        ('imputacion', lambda d: _etapa_imputacion(d, estadisticas), ['age', 'education']),
+        ('binarias', _etapa_binarias, COLUMNAS_BINARIAS),
+        ('categorias', lambda d: _etapa_categorias(d, imputador), CATEGORICAS_CAMPAIGN),
+        ('geo', _etapa_geo, COLUMNAS_GEO),
+    ]
+    # 8. (Opcional) Tipos compactos
+    if optimizar:
+        etapas.append(('optimizacion', lambda d: dc.optimizar_tipos(d, inplace=True)[0], None))
+
+    return ejecutar_etapas(df, etapas, informe)
+
+
+def ajustar_imputador_campaign(df_campaign_original) -> Imputador:
+    """
+    Aprende sobre el histórico los valores de imputación que usa clean_campaign_df
+    (medianas macro y de 'age' sobre los datos en bruto, moda de 'education') y las
+    categorías de CATEGORICAS_CAMPAIGN tras la limpieza.
+    Args:
+        df_campaign_original (pd.DataFrame): histórico de campañas en bruto.
+    Returns:
+        Imputador: se pasa a clean_campaign_df(estadisticas=...) para limpiar lotes nuevos.
+    """
+    valores = {c: _reparar_decimales(df_campaign_original[c]).median()
+               for c in COLUMNAS_MACRO if c in df_campaign_original.columns}
+    if 'age' in df_campaign_original.columns:
+        valores['age'] = df_campaign_original['age'].median()
+    if 'education' in df_campaign_original.columns:
+        valores['education'] = dc.valor_moda(df_campaign_original['education'])
+
+    imputador = Imputador(categorias=CATEGORICAS_CAMPAIGN).fit(clean_campaign_df(df_campaign_original))
+    imputador.valores = {c: v for c, v in valores.items() if v is not None and not pd.isna(v)}
+    return imputador
+
+
+def _mediana_desde_conteos(conteos: pd.Series) -> float:
+    """Mediana exacta (misma regla que Series.median) a partir de una tabla valor → frecuencia."""
+    conteos = conteos[conteos > 0].sort_index()
+    n = int(conteos.sum())
+    if n == 0:
+        return np.nan
+    acumulado = conteos.cumsum().to_numpy()
+    valores = conteos.index.to_numpy(dtype=float)
+    bajo = valores[np.searchsorted(acumulado, (n - 1) // 2 + 1)]
+    alto = valores[np.searchsorted(acumulado, n // 2 + 1)]
+    return (bajo + alto) / 2
+
+
+def estadisticas_campaign(ruta_csv, chunksize: int = 100_000, **read_csv_kwargs) -> dict:
+    """
+    Primera pasada del modo streaming: calcula los valores de imputación globales
+    (mediana de cada columna macro y de 'age', moda de 'education') leyendo el CSV por bloques.
+    Solo mantiene tablas de frecuencias por valor distinto, así que la memoria depende de la
+    cardinalidad de estas columnas y no del número de filas; el resultado es exacto.
+    Args:
+        ruta_csv: ruta a bank-additional.csv.
+        chunksize (int): filas por bloque.
+        **read_csv_kwargs: argumentos extra para pd.read_csv.
+    Returns:
+        dict: {columna: valor de imputación} para COLUMNAS_MACRO, 'age' y 'education'.
+    """
+    # Solo se leen las columnas necesarias; el índice no interviene en las estadísticas
+    read_csv_kwargs.pop('index_col', None)
+    columnas = COLUMNAS_MACRO + ['age', 'education']
+    conteos = {c: pd.Series(dtype='int64') for c in columnas}
+    for chunk in pd.read_csv(ruta_csv, chunksize=chunksize,
+                             usecols=lambda c: c in columnas, **_dtype_lectura(read_csv_kwargs)):
+        for c in columnas:
+            if c not in chunk.columns:
+                continue
+            serie = _reparar_decimales(chunk[c]) if c in COLUMNAS_MACRO else chunk[c]
+            conteos[c] = conteos[c].add(serie.value_counts(dropna=True), fill_value=0)
+
+    estadisticas = {c: _mediana_desde_conteos(conteos[c]) for c in COLUMNAS_MACRO + ['age']}
+    # Misma regla que Series.mode(): mayor frecuencia y, en empate, el menor valor
+    edu = conteos['education']
+    estadisticas['education'] = min(edu.index[edu == edu.max()]) if not edu.empty else None
+    return estadisticas
+
+
+def clean_campaign_csv(ruta_csv, ruta_salida, chunksize: int = 100_000,
+                       normalizar_nombres: bool = True, **read_csv_kwargs) -> dict:
+    """
+    Modo streaming de clean_campaign_df para ficheros que no caben en memoria.
+    Hace una primera pasada con estadisticas_campaign y después limpia cada bloque con
+    clean_campaign_df(estadisticas=...) y lo añade al CSV de salida, por lo que el resultado
+    coincide con limpiar el fichero completo y la memoria pico queda acotada por chunksize.
+    Args:
+        ruta_csv: ruta a bank-additional.csv.
+        ruta_salida: ruta del CSV limpio (se sobrescribe).
+        chunksize (int): filas por bloque.
+        normalizar_nombres (bool): si True aplica dc.clean_column_names (como en el notebook).
+        **read_csv_kwargs: argumentos extra para pd.read_csv (por defecto index_col=0).
+    Returns:
+        dict: {'filas': filas escritas, 'estadisticas': valores de imputación, 'ruta': ruta_salida}.
+    """
+    read_csv_kwargs.setdefault('index_col', 0)
+    estadisticas = estadisticas_campaign(ruta_csv, chunksize=chunksize, **read_csv_kwargs)
+
+    filas = 0
+    for i, chunk in enumerate(pd.read_csv(ruta_csv, chunksize=chunksize, **_dtype_lectura(read_csv_kwargs))):
+        limpio = clean_campaign_df(chunk, estadisticas=estadisticas)
+        if normalizar_nombres:
+            limpio = dc.clean_column_names(limpio, verbose=False)
+        limpio.to_csv(ruta_salida, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        filas += len(limpio)
+
+    return {'filas': filas, 'estadisticas': estadisticas, 'ruta': ruta_salida}
@@ -38,21 +38,73 @@ FUNCIONES DISPONIBLES EN ESTE MÓDULO:
        inplace: Si True, modifica el df original.
    - Retorna: DataFrame con imputaciones aplicadas.
 
-4) run_checks(df, posibles_cat=None, inplace=False, call_analisis=False)
+4) optimizar_tipos(df, columnas=None, umbral_categoria=0.5, permitir_float32=True, inplace=False)
+   - Reduce cada columna al tipo más pequeño que conserva sus valores.
+   - Enteros → int8/uint8/int16/... según su rango (también los nulables Int64 → Int8, ...).
+   - Float → float32 solo si todos sus valores se leen igual en float32 (mismos dígitos).
+   - Texto (object/string) → category si n_unique / n_filas <= umbral_categoria.
+   - Retorna: (DataFrame optimizado, informe por columna con dtypes y bytes ahorrados).
+
+5) run_checks(df, posibles_cat=None, inplace=False, call_analisis=False, mostrar=True,
+              optimizar=False, cache=None)
    - Wrapper que combina transformaciones y puede llamar a analisis_exploratorio.
    - Argumentos:
        df: DataFrame a procesar.
        posibles_cat: Lista de columnas a convertir a category.
        inplace: Si True, modifica el df original.
        call_analisis: Si True, llama a analisis_exploratorio para reporting.
+       mostrar: Si False, no imprime nada y 'analisis' es un perfil JSON (perfil_json).
+       optimizar: Si True, aplica optimizar_tipos y guarda su informe en 'optimizacion'.
+       cache: CachePerfiles (src.cache_perfiles) para no recalcular columnas sin cambios.
    - Retorna: Dict con resultados y DataFrame procesado.
 
+6) ejecutar_plan(df, plan, inplace=False, n_jobs=None, procesos=False)
+   - Ejecuta un plan declarativo: lista de pasos (accion, columnas) con accion en
+     'category', 'median' o 'mode'.
+   - Copia el DataFrame una sola vez y procesa las columnas en paralelo (hilos).
+   - procesos=True manda las columnas object a un pool de procesos (en hilos no escalan por
+     el GIL); solo compensa con millones de filas.
+   - La moda de columnas object/category se cuenta sobre códigos (factorize + bincount) y,
+     con 'mode' y 'category' en la misma columna, se factoriza una sola vez.
+   - Retorna: DataFrame con el plan aplicado.
+
+7) clean_column_names(df, verbose=True, inplace=False, colisiones='aviso')
+   - Normaliza los nombres de columnas a snake_case (mapeo memoizado por esquema).
+   - Detecta colisiones (dos columnas con el mismo nombre normalizado): warning,
+     ValueError (colisiones='error') o nada (colisiones='ignorar').
+   - inplace=True renombra sin copiar los datos.
+   - Retorna: DataFrame con columnas normalizadas.
+
+8) reparar_decimales(df, columnas, inplace=False)
+   - Convierte a float64 columnas numéricas leídas como texto con coma decimal ('93,994').
+   - Las columnas ya numéricas solo se pasan a float64; en las de texto/category la
+     conversión se hace una vez por valor distinto, no por fila.
+   - Retorna: (DataFrame, informe por columna con valores convertidos y NaN por coerción).
+
+9) valor_moda(serie)
+   - Moda de una columna (la de impute_mode): primer valor de Series.mode(dropna=True) o None.
+   - En object/category cuenta sobre códigos; la usan también src.imputacion y
+     src.cleaning_campaing para aprender la moda una vez y aplicarla a otros lotes.
+
+10) nombres_normalizados(columnas)
+   - Nombres que daría clean_column_names a un esquema (lista de columnas), sin el DataFrame.
+   - Retorna: lista de nombres normalizados en el mismo orden.
+
+11) a_float_decimal(serie)
+   - La conversión de reparar_decimales para una sola serie (coma decimal → float64).
+   - Retorna: (serie float64, nº de valores no nulos que quedan como NaN por no ser números).
+
 ------------------------------------------------------
 BUENAS PRÁCTICAS/TIPS:
 ------------------------------------------------------
 - Este módulo se centra en transformaciones (NO en reporting).
 - Para análisis exploratorio y visualización, usar src.analisis_exploratorio y src.plotting.
 - Las funciones son puras: si inplace=False, retornan nuevo DataFrame sin modificar el original.
+- coerce_to_category, impute_median e impute_mode son atajos de ejecutar_plan con un solo paso;
+  para varias transformaciones, un único plan evita copias intermedias.
+- ejecutar_plan(procesos=True) arranca procesos (~2 s con forkserver) y les copia cada columna
+  object: usarlo solo a partir de ~5M de filas y, en scripts, bajo if __name__ == '__main__'.
+  Los atajos y clean_campaign_df usan siempre hilos.
 - Preferir call_analisis=True en run_checks() si necesitas tanto transformación como reporting.
 
 ------------------------------------------------------
@@ -69,52 +121,347 @@ results = dc.run_checks(df,
                        posibles_cat=['education', 'marital'],
                        call_analisis=True)
 df_processed = results['df']
+
+# Varias transformaciones en un solo plan (una copia, columnas en paralelo)
+df_clean = dc.ejecutar_plan(df, [('mode', ['education']),
+                                 ('category', ['education', 'marital']),
+                                 ('median', ['age'])])
+
+# Columnas numéricas con coma decimal → float64 (y cuántos valores no eran números)
+df_num, informe = dc.reparar_decimales(df, ['euribor3m', 'nr.employed'])
+print(informe['nan_coercionados'])
+
+# Tipos compactos (memoria ahorrada por columna)
+df_compacto, informe = dc.optimizar_tipos(df_processed)
+print(informe['ahorro_bytes'].sum())
+
+# Modo batch: sin salida por pantalla, perfil serializable a disco
+from src.analisis_exploratorio import guardar_perfil
+results = dc.run_checks(df, call_analisis=True, mostrar=False)
+guardar_perfil(results['analisis'], 'perfil.json')
 """
 
+import os
+import re
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Sequence, Tuple
 
 __all__ = [
+    "ejecutar_plan",
     "coerce_to_category",
     "impute_median", 
     "impute_mode",
-    "run_checks"
+    "optimizar_tipos",
+    "reparar_decimales",
+    "run_checks",
+    "clean_column_names",
+    "valor_moda",
+    "nombres_normalizados",
+    "a_float_decimal",
 ]
 
-def coerce_to_category(df: pd.DataFrame, columns: List[str], inplace: bool = False) -> pd.DataFrame:
-    """Convierte columnas especificadas al tipo category."""
+# Acciones por columna del plan declarativo de ejecutar_plan
+ACCIONES_PLAN = ('category', 'median', 'mode')
+
+# Por debajo de este nº de filas el coste de los hilos supera al de procesar en serie
+_MIN_FILAS_PARALELO = 50_000
+
+
+def _codigo_moda(codigos: np.ndarray, valores: pd.Index, ordenados: bool) -> Optional[int]:
+    """Código del valor más frecuente (codigos sin nulos) o None si no hay valores.
+    Con empate: el primer código si valores está ordenado (category) o, si no, el del menor
+    valor, igual que Series.mode(dropna=True).iloc[0]."""
+    conteos = np.bincount(codigos, minlength=len(valores))
+    if not conteos.any():
+        return None
+    empatados = np.flatnonzero(conteos == conteos.max())
+    if ordenados or len(empatados) == 1:
+        return int(empatados[0])
+    candidatos = valores.take(empatados)
+    return int(empatados[candidatos.get_loc(pd.Series(candidatos).mode().iloc[0])])
+
+
+def valor_moda(serie: pd.Series):
+    """
+    Primer valor de Series.mode(dropna=True) (el menor en caso de empate) o None.
+    En columnas category y object se cuenta sobre códigos (np.bincount) en lugar de con
+    value_counts.
+    args:
+        serie (pd.Series): columna de la que calcular la moda.
+    returns:
+        valor más frecuente, o None si la columna no tiene valores no nulos.
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos = serie.cat.codes.to_numpy()
+        moda = _codigo_moda(codigos[codigos >= 0], serie.cat.categories, ordenados=True)
+        return None if moda is None else serie.cat.categories[moda]
+    if serie.dtype == object:
+        codigos, valores = pd.factorize(serie)
+        moda = _codigo_moda(codigos[codigos >= 0], valores, ordenados=False)
+        return None if moda is None else valores[moda]
+    mode = serie.mode(dropna=True)
+    return None if mode.empty else mode.iloc[0]
+
+
+def _aplicar_acciones_objeto(serie: pd.Series, acciones: List[str]) -> pd.Series:
+    """_aplicar_acciones para columnas object: factoriza una sola vez y tanto la moda como la
+    conversión a category trabajan sobre los códigos."""
+    codigos, valores = pd.factorize(serie)
+    categorica = False
+    relleno = None
+    for accion in acciones:
+        if accion == 'category' and not categorica:
+            # Categorical sobre los valores distintos: mismas categorías (y orden) que astype
+            por_valor = pd.Categorical(valores)
+            if len(valores):
+                codigos = np.where(codigos >= 0, por_valor.codes[codigos], -1)
+            valores = por_valor.categories
+            categorica = True
+        elif accion == 'mode':
+            nulos = codigos < 0
+            if nulos.any():
+                moda = _codigo_moda(codigos[~nulos], valores, ordenados=categorica)
+                if moda is not None:
+                    codigos = np.where(nulos, moda, codigos)
+                    relleno = valores[moda]
+        # 'median' no hace nada en columnas no numéricas
+    if categorica:
+        return pd.Series(pd.Categorical.from_codes(codigos, categories=valores),
+                         index=serie.index, name=serie.name)
+    return serie if relleno is None else serie.fillna(relleno)
+
+
+def _aplicar_acciones(serie: pd.Series, acciones: List[str]) -> pd.Series:
+    """Aplica en orden las acciones del plan a una columna y devuelve la columna resultante."""
+    if serie.dtype == object and 'mode' in acciones:
+        return _aplicar_acciones_objeto(serie, acciones)
+    for accion in acciones:
+        if accion == 'category':
+            serie = serie.astype('category')
+        elif accion == 'median':
+            if pd.api.types.is_numeric_dtype(serie) and serie.isna().any():
+                serie = serie.fillna(serie.median())
+        elif accion == 'mode':
+            if serie.isna().any():
+                valor = valor_moda(serie)
+                if valor is not None:
+                    serie = serie.fillna(valor)
+    return serie
+
+
+def ejecutar_plan(df: pd.DataFrame, plan: List[Tuple[str, List[str]]],
+                  inplace: bool = False, n_jobs: Optional[int] = None,
+                  procesos: bool = False) -> pd.DataFrame:
+    """
+    Ejecuta un plan declarativo de transformaciones por columna.
+    args:
+        df (pd.DataFrame): DataFrame a transformar.
+        plan (List[Tuple[str, List[str]]]): pasos (accion, columnas) con accion en ACCIONES_PLAN;
+            las columnas que no existen se ignoran. Cada columna recibe sus acciones en el
+            orden del plan.
+        inplace (bool): si True, modifica el df original; si no, se copia una sola vez.
+        n_jobs (int): columnas en paralelo (None = nº de CPUs, 1 = en serie).
+        procesos (bool): si True, las columnas object se procesan en un pool de procesos
+            (forkserver/spawn) en lugar de en hilos, donde factorize y astype('category')
+            retienen el GIL. Copia cada columna al proceso: solo compensa con millones de filas.
+    returns:
+        pd.DataFrame: DataFrame con el plan aplicado.
+    """
+    # Acciones agrupadas por columna (manteniendo el orden del plan)
+    por_columna: Dict[str, List[str]] = {}
+    for accion, columnas in plan:
+        if accion not in ACCIONES_PLAN:
+            raise ValueError(f"Acción desconocida '{accion}'. Opciones: {ACCIONES_PLAN}")
+        for c in columnas or []:
+            if c in df.columns:
+                por_columna.setdefault(c, []).append(accion)
+
     if not inplace:
         df = df.copy()
-    for c in columns or []:
-        if c in df.columns:
-            df[c] = df[c].astype('category')
+    if not por_columna:
+        return df
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs > 1 and len(por_columna) > 1 and len(df) >= _MIN_FILAS_PARALELO:
+        en_procesos = [c for c in por_columna if procesos and df[c].dtype == object]
+        pool_procesos = None
+        if en_procesos:
+            import multiprocessing
+            # Hay hilos en marcha: los procesos salen de un servidor limpio, no de fork
+            metodo = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            pool_procesos = ProcessPoolExecutor(max_workers=min(n_jobs, len(en_procesos)),
+                                                mp_context=multiprocessing.get_context(metodo))
+        try:
+            with ThreadPoolExecutor(max_workers=min(n_jobs, len(por_columna))) as hilos:
+                # Primero las columnas object, que son las más lentas
+                futuros = {c: pool_procesos.submit(_aplicar_acciones, df[c], por_columna[c]) for c in en_procesos}
+                futuros.update({c: hilos.submit(_aplicar_acciones, df[c], acciones)
+                                for c, acciones in por_columna.items() if c not in futuros})
+                nuevas = {c: futuros[c].result() for c in por_columna}
+        finally:
+            if pool_procesos is not None:
+                pool_procesos.shutdown()
+    else:
+        nuevas = {c: _aplicar_acciones(df[c], acciones) for c, acciones in por_columna.items()}
+
+    for c, serie in nuevas.items():
+        if serie is not df[c]:
+            df[c] = serie
     return df
 
+
+def coerce_to_category(df: pd.DataFrame, columns: List[str], inplace: bool = False) -> pd.DataFrame:
+    """Convierte columnas especificadas al tipo category."""
+    return ejecutar_plan(df, [('category', columns)], inplace=inplace)
+
 def impute_median(df: pd.DataFrame, columns: List[str], inplace: bool = False) -> pd.DataFrame:
     """Imputa la mediana en columnas numéricas especificadas."""
-    if not inplace:
-        df = df.copy()
-    for c in columns or []:
-        if c in df.columns and pd.api.types.is_numeric_dtype(df[c]):
-            df[c] = df[c].fillna(df[c].median())
-    return df
+    return ejecutar_plan(df, [('median', columns)], inplace=inplace)
 
 def impute_mode(df: pd.DataFrame, columns: List[str], inplace: bool = False) -> pd.DataFrame:
     """Imputa la moda en columnas especificadas."""
+    return ejecutar_plan(df, [('mode', columns)], inplace=inplace)
+
+def _entero_minimo(minimo, maximo, nulable: bool) -> str:
+    """Dtype entero más pequeño (con signo solo si hace falta) que contiene [minimo, maximo]."""
+    candidatos = ['uint8', 'uint16', 'uint32', 'uint64'] if minimo >= 0 else ['int8', 'int16', 'int32', 'int64']
+    for dtype in candidatos:
+        info = np.iinfo(dtype)
+        if info.min <= minimo and maximo <= info.max:
+            return dtype.capitalize().replace('Uint', 'UInt') if nulable else dtype
+    return None
+
+
+def _float32_exacto(valores: np.ndarray) -> bool:
+    """True si cada valor tiene la misma representación decimal más corta en float32 que en float64."""
+    unicos = np.unique(valores[~np.isnan(valores)])
+    return bool(np.array_equal(unicos.astype(np.float32).astype(str), unicos.astype(str)))
+
+
+def _tipo_compacto(serie: pd.Series, umbral_categoria: float, permitir_float32: bool):
+    """Dtype destino de una columna según su rango y cardinalidad (None = se deja igual)."""
+    dtype = serie.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+        return None
+    if pd.api.types.is_integer_dtype(dtype):
+        if serie.count() == 0:
+            return None
+        nuevo = _entero_minimo(serie.min(), serie.max(), nulable=isinstance(dtype, pd.api.extensions.ExtensionDtype))
+        return nuevo if nuevo is not None and np.dtype(nuevo.lower()).itemsize < np.dtype(str(dtype).lower()).itemsize else None
+    if pd.api.types.is_float_dtype(dtype):
+        if permitir_float32 and dtype == np.float64 and _float32_exacto(serie.to_numpy()):
+            return 'float32'
+        return None
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if len(serie) and serie.nunique(dropna=True) / len(serie) <= umbral_categoria:
+            return 'category'
+    return None
+
+
+def optimizar_tipos(df: pd.DataFrame, columnas: Optional[List[str]] = None,
+                    umbral_categoria: float = 0.5, permitir_float32: bool = True,
+                    inplace: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Reduce cada columna al dtype más pequeño que conserva sus valores.
+    args:
+        df (pd.DataFrame): DataFrame a optimizar.
+        columnas (List[str]): columnas a revisar; None revisa todas.
+        umbral_categoria (float): proporción máxima de valores únicos para pasar texto a category.
+        permitir_float32 (bool): si False, las columnas float se dejan en float64.
+        inplace (bool): si True, modifica el df original.
+    returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: DataFrame optimizado e informe indexado por columna
+            (dtype_original, dtype_nuevo, bytes_antes, bytes_despues, ahorro_bytes).
+    """
     if not inplace:
         df = df.copy()
-    for c in columns or []:
-        if c in df.columns:
-            mode = df[c].mode(dropna=True)
-            if not mode.empty:
-                df[c] = df[c].fillna(mode.iloc[0])
-    return df
+    filas = []
+    for c in columnas if columnas is not None else list(df.columns):
+        if c not in df.columns:
+            continue
+        nuevo = _tipo_compacto(df[c], umbral_categoria, permitir_float32)
+        if nuevo is None:
+            continue
+        antes = df[c].memory_usage(index=False, deep=True)
+        dtype_original = str(df[c].dtype)
+        df[c] = df[c].astype(nuevo)
+        despues = df[c].memory_usage(index=False, deep=True)
+        filas.append({'columna': c, 'dtype_original': dtype_original, 'dtype_nuevo': str(df[c].dtype),
+                      'bytes_antes': antes, 'bytes_despues': despues, 'ahorro_bytes': antes - despues})
+    informe = pd.DataFrame(filas, columns=['columna', 'dtype_original', 'dtype_nuevo',
+                                           'bytes_antes', 'bytes_despues', 'ahorro_bytes'])
+    return df, informe.set_index('columna')
+
+
+def a_float_decimal(serie: pd.Series) -> Tuple[pd.Series, int]:
+    """
+    Serie → float64 aceptando coma decimal; devuelve también cuántos valores no nulos quedan
+    como NaN por no ser numéricos. Mismo resultado que
+    pd.to_numeric(serie.astype(str).str.replace(',', '.'), errors='coerce'), pero el texto
+    solo se procesa una vez por valor distinto (categorías o pd.factorize) y las columnas
+    ya numéricas no pasan por texto.
+    args:
+        serie (pd.Series): columna numérica, de texto o category.
+    returns:
+        Tuple[pd.Series, int]: (serie float64, nº de valores no nulos convertidos a NaN).
+    """
+    if pd.api.types.is_numeric_dtype(serie) and not pd.api.types.is_bool_dtype(serie):
+        return serie.astype('float64'), 0
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos, unicos = serie.cat.codes.to_numpy(), serie.cat.categories
+    else:
+        codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+    texto = pd.Series(unicos, dtype=object).astype(str).str.replace(',', '.', regex=False)
+    convertidos = pd.to_numeric(texto, errors='coerce').to_numpy(dtype='float64')
+    # Código -1 (nulo original) → NaN añadido al final
+    valores = np.append(convertidos, np.nan)[codigos]
+    coercionados = int(np.count_nonzero(np.isnan(valores) & (codigos >= 0)))
+    return pd.Series(valores, index=serie.index, name=serie.name), coercionados
+
+
+def reparar_decimales(df: pd.DataFrame, columnas: List[str],
+                      inplace: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Convierte a float64 columnas numéricas con coma decimal ('93,994' → 93.994).
+    args:
+        df (pd.DataFrame): DataFrame a reparar.
+        columnas (List[str]): columnas a convertir (las ausentes se ignoran).
+        inplace (bool): si True, modifica el df original.
+    returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: DataFrame reparado e informe indexado por columna
+            (dtype_original, valores_convertidos, nan_coercionados).
+    """
+    if not inplace:
+        df = df.copy()
+    filas = []
+    for c in columnas:
+        if c not in df.columns:
+            continue
+        dtype_original = str(df[c].dtype)
+        numerica = pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])
+        convertidos = 0 if numerica else int(df[c].notna().sum())
+        df[c], coercionados = a_float_decimal(df[c])
+        filas.append({'columna': c, 'dtype_original': dtype_original,
+                      'valores_convertidos': convertidos, 'nan_coercionados': coercionados})
+    informe = pd.DataFrame(filas, columns=['columna', 'dtype_original', 'valores_convertidos', 'nan_coercionados'])
+    return df, informe.set_index('columna')
+
 
 def run_checks(df: pd.DataFrame, posibles_cat: Optional[List[str]] = None,
-               inplace: bool = False, call_analisis: bool = False) -> Dict:
+               inplace: bool = False, call_analisis: bool = False,
+               mostrar: bool = True, optimizar: bool = False, cache=None) -> Dict:
     """
     Wrapper que combina transformaciones y puede llamar a analisis_exploratorio.
+    Con mostrar=False (modo batch) no se imprime nada y 'analisis' es el perfil
+    serializable de perfil_json en lugar del informe interactivo.
+    Con optimizar=True se aplica optimizar_tipos y su informe queda en 'optimizacion'.
+    Con cache (src.cache_perfiles.CachePerfiles) el análisis reutiliza las estadísticas
+    de las columnas que no han cambiado desde la llamada anterior.
     Retorna dict con resultados y DataFrame procesado.
     """
     resultados = {}
@@ -125,11 +472,17 @@ def run_checks(df: pd.DataFrame, posibles_cat: Optional[List[str]] = None,
         df_out = coerce_to_category(df_out, posibles_cat, inplace=True)
         resultados['converted_to_category'] = posibles_cat
 
+    if optimizar:
+        df_out, resultados['optimizacion'] = optimizar_tipos(df_out, inplace=True)
+
     # Opcionalmente llamar a analisis_exploratorio para reporting
     if call_analisis:
         try:
-            from src.analisis_exploratorio import analisis_exploratorio
-            resultados['analisis'] = analisis_exploratorio(df_out)
+            from src.analisis_exploratorio import analisis_exploratorio, perfil_json
+            if mostrar:
+                resultados['analisis'] = analisis_exploratorio(df_out, cache=cache)
+            else:
+                resultados['analisis'] = perfil_json(df_out, cache=cache)
         except Exception as e:
             resultados['analisis_error'] = str(e)
 
@@ -150,7 +503,44 @@ if __name__ == "__main__":
                     call_analisis=True)
     print("\nColumnas convertidas:", res.get('converted_to_category', []))
     
-def clean_column_names(df, verbose=True):
+# Patrones de clean_column_names, compilados una sola vez
+_SEPARADORES_NOMBRE = str.maketrans({'.': '_', ' ': '_', '-': '_'})
+_RE_CARACTERES_NO_VALIDOS = re.compile(r'[^a-z0-9_]')
+_RE_GUIONES_REPETIDOS = re.compile(r'_+')
+
+
+def _normalizar_nombre(col: str) -> str:
+    """snake_case de un nombre de columna (ver clean_column_names)."""
+    nuevo_nombre = col.lower().translate(_SEPARADORES_NOMBRE)
+    nuevo_nombre = _RE_CARACTERES_NO_VALIDOS.sub('', nuevo_nombre)
+    nuevo_nombre = _RE_GUIONES_REPETIDOS.sub('_', nuevo_nombre)
+    return nuevo_nombre.strip('_')
+
+
+@lru_cache(maxsize=256)
+def _mapeo_columnas(columnas: Tuple) -> Tuple[Tuple[str, ...], Tuple]:
+    """Nombres normalizados de un esquema (tupla de columnas) y sus colisiones
+    ((destino, (origen1, origen2, ...)), ...). Se memoiza por esquema."""
+    nuevos = tuple(_normalizar_nombre(col) for col in columnas)
+    origenes: Dict[str, List] = {}
+    for col, nuevo in zip(columnas, nuevos):
+        origenes.setdefault(nuevo, []).append(col)
+    colisiones = tuple((nuevo, tuple(cols)) for nuevo, cols in origenes.items() if len(cols) > 1)
+    return nuevos, colisiones
+
+
+def nombres_normalizados(columnas: Sequence) -> List[str]:
+    """
+    Nombres que daría clean_column_names a un esquema, sin necesitar el DataFrame.
+    args:
+        columnas (Sequence): nombres de columna originales.
+    returns:
+        List[str]: nombres normalizados en el mismo orden.
+    """
+    return list(_mapeo_columnas(tuple(columnas))[0])
+
+
+def clean_column_names(df, verbose=True, inplace=False, colisiones='aviso'):
     """
     Normaliza los nombres de columnas siguiendo el estándar snake_case de PEP 8.
     
@@ -161,12 +551,20 @@ def clean_column_names(df, verbose=True):
     - Elimina guiones bajos duplicados
     - Elimina guiones bajos al inicio/final
     
+    El mapeo se calcula una vez por esquema (tupla de nombres) y se reutiliza en las
+    siguientes llamadas con las mismas columnas.
+    
     Parámetros:
     -----------
     df : pd.DataFrame
         DataFrame a normalizar
     verbose : bool, default=True
         Si True, muestra el mapeo de nombres antiguos → nuevos
+    inplace : bool, default=False
+        Si True, renombra las columnas de df sin copiar los datos y lo devuelve
+    colisiones : {'aviso', 'error', 'ignorar'}, default='aviso'
+        Qué hacer si dos columnas distintas se normalizan al mismo nombre:
+        emitir un warning, lanzar ValueError o no hacer nada
     
     Retorna:
     --------
@@ -182,38 +580,29 @@ def clean_column_names(df, verbose=True):
     Dt_Customer → dt_customer
     KidHome_ → kidhome
     """
-    import re
-    
-    # Diccionario para almacenar el mapeo
-    mapeo = {}
-    
-    for col in df.columns:
-        # 1. Convertir a minúsculas
-        nuevo_nombre = col.lower()
-        
-        # 2. Reemplazar puntos, espacios, guiones por guiones bajos
-        nuevo_nombre = nuevo_nombre.replace('.', '_')
-        nuevo_nombre = nuevo_nombre.replace(' ', '_')
-        nuevo_nombre = nuevo_nombre.replace('-', '_')
-        
-        # 3. Eliminar caracteres especiales (mantener solo letras, números y _)
-        nuevo_nombre = re.sub(r'[^a-z0-9_]', '', nuevo_nombre)
-        
-        # 4. Eliminar guiones bajos duplicados
-        nuevo_nombre = re.sub(r'_+', '_', nuevo_nombre)
-        
-        # 5. Eliminar guiones bajos al inicio/final
-        nuevo_nombre = nuevo_nombre.strip('_')
-        
-        mapeo[col] = nuevo_nombre
-    
-    # Renombrar columnas
-    df_normalizado = df.rename(columns=mapeo)
+    if colisiones not in ('aviso', 'error', 'ignorar'):
+        raise ValueError("colisiones debe ser 'aviso', 'error' o 'ignorar'")
+
+    columnas = tuple(df.columns)
+    nuevos, choques = _mapeo_columnas(columnas)
+
+    if choques and colisiones != 'ignorar':
+        detalle = '; '.join(f"{list(origen)} → {destino}" for destino, origen in choques)
+        if colisiones == 'error':
+            raise ValueError(f"Colisión de nombres de columnas: {detalle}")
+        warnings.warn(f"Colisión de nombres de columnas: {detalle}", stacklevel=2)
+
+    # Renombrar columnas (posicional: válido también con nombres repetidos)
+    if inplace:
+        df.columns = list(nuevos)
+        df_normalizado = df
+    else:
+        df_normalizado = df.set_axis(list(nuevos), axis=1)
     
     # Mostrar cambios si verbose=True
     if verbose:
         print("\n--- Normalización de Nombres de Columnas ---")
-        cambios = [(old, new) for old, new in mapeo.items() if old != new]
+        cambios = [(old, new) for old, new in zip(columnas, nuevos) if old != new]
         
         if cambios:
             for old, new in cambios:
@@ -222,4 +611,4 @@ def clean_column_names(df, verbose=True):
             print("  ✓ Todas las columnas ya cumplían el estándar snake_case")
     
     return df_normalizado
-    # df_limpio = clean_column_names(df_original)
\ No newline at end of file
+    # df_limpio = clean_column_names(df_original)
@@ -0,0 +1,189 @@
+# src/eda_por_bloques.py
+import os
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src import storage
+from src.analisis_exploratorio import es_numerica, informe_desde_perfil, tabla_categoricas
+from src.perfiles import PerfilDatos
+"""
+Módulo: eda_por_bloques.py
+======================================================
+
+Análisis exploratorio fuera de memoria (out-of-core) para los ficheros de data/processed/.
+
+Este módulo está diseñado para:
+- Generar el mismo informe que analisis_exploratorio / categorical_summary sobre un CSV o un
+  Parquet (guardado con storage.save_dataset) que no cabe en memoria, leyéndolo por bloques.
+- Acumular cada bloque en un perfil combinable (src.perfiles.PerfilDatos): conteos,
+  faltantes, frecuencias de categorías, media y desviación exactos.
+- Calcular los cuantiles de describe() de forma exacta mientras la columna tenga pocos valores
+  distintos y, si no, con el sketch de cuantiles de PerfilDatos.
+- Mantener la memoria acotada: un bloque de filas más, por columna, como mucho max_categorias
+  frecuencias y un sketch de capacidad tamano_muestra.
+
+------------------------------------------------------
+FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) leer_por_bloques(ruta, chunksize=100_000, columnas=None, **read_csv_kwargs)
+   - Itera los bloques de un CSV (pd.read_csv) o de un Parquet (storage.iter_dataset).
+
+2) perfil_por_bloques(ruta, columnas=None, chunksize=100_000, top_n=3, max_valores=11,
+                      max_categorias=100_000, tamano_muestra=100_000, semilla=0, **read_csv_kwargs)
+   - Perfil por columna con el formato de perfil_columnas y la estructura del fichero.
+   - Retorna: (perfil, estructura con 'shape', 'dtypes' y 'head').
+
+3) analisis_exploratorio_por_bloques(ruta, nombre_df=None, mostrar_head=5, round_decimals=2,
+                                     mostrar=True, chunksize=100_000, **kwargs)
+   - Mismo informe y mismo dict de resultados que analisis_exploratorio, más 'aproximado':
+     columnas cuyos cuantiles o n_unique son estimaciones.
+
+4) categorical_summary_por_bloques(ruta, top_n=3, chunksize=100_000, **kwargs)
+   - Equivalente a categorical_summary leyendo el fichero por bloques.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- El tipo de cada columna se decide con su primer bloque con algún valor no nulo. Si una
+  columna numérica trae texto más adelante pasa a categórica conservando sus frecuencias
+  (exactas mientras tenga menos de max_categorias valores distintos).
+- Este módulo solo lee y da formato: la acumulación y sus reglas de combinación están en
+  src.perfiles, así que el perfil de un fichero también puede guardarse y combinarse.
+- Media y desviación coinciden con describe() salvo redondeo en los últimos decimales.
+- Si una columna de texto supera max_categorias valores distintos, n_unique se estima
+  (k valores de hash mínimos) y las frecuencias top son aproximadas.
+- Para Parquet usar los ficheros de storage.save_dataset: se respetan category y fechas.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+from src.eda_por_bloques import analisis_exploratorio_por_bloques
+resultados = analisis_exploratorio_por_bloques('../data/processed/df_perfil_cliente.csv',
+                                               chunksize=500_000)
+resultados['aproximado']
+"""
+
+__all__ = [
+    "leer_por_bloques",
+    "perfil_por_bloques",
+    "analisis_exploratorio_por_bloques",
+    "categorical_summary_por_bloques",
+]
+
+
+def leer_por_bloques(ruta: str, chunksize: int = 100_000, columnas: Optional[List[str]] = None,
+                     **read_csv_kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Itera un fichero de datos por bloques de filas.
+    args:
+        ruta (str): CSV o Parquet (.parquet, guardado con storage.save_dataset).
+        chunksize (int): filas por bloque.
+        columnas (List[str]): columnas a leer; None lee todas.
+        **read_csv_kwargs: argumentos extra para pd.read_csv (solo CSV).
+    returns:
+        Iterator[pd.DataFrame]: bloques del fichero.
+    """
+    if ruta.endswith('.parquet'):
+        carpeta, fichero = os.path.split(ruta)
+        yield from storage.iter_dataset(fichero[:-len('.parquet')], ruta=carpeta or '.',
+                                        columns=columnas, batch_size=chunksize)
+        return
+    if columnas is not None:
+        read_csv_kwargs['usecols'] = columnas
+    yield from pd.read_csv(ruta, chunksize=chunksize, **read_csv_kwargs)
+
+
+def _dtype_combinado(actual, nuevo):
+    """dtype de la columna completa a partir de los dtypes de dos bloques."""
+    if actual == nuevo:
+        return actual
+    if es_numerica(actual) and es_numerica(nuevo):
+        return np.result_type(actual, nuevo)
+    return np.dtype(object)
+
+
+def perfil_por_bloques(ruta: str, columnas: Optional[List[str]] = None, chunksize: int = 100_000,
+                       top_n: int = 3, max_valores: int = 11, max_categorias: int = 100_000,
+                       tamano_muestra: int = 100_000, semilla: int = 0,
+                       mostrar_head: int = 5, **read_csv_kwargs) -> Tuple[Dict[str, Dict], Dict]:
+    """
+    Perfil por columna (formato de perfil_columnas) leyendo el fichero por bloques.
+    args:
+        ruta (str): CSV o Parquet de data/processed/.
+        columnas (List[str]): columnas a perfilar; None = todas.
+        chunksize (int): filas por bloque.
+        top_n (int): número de valores top en categóricas.
+        max_valores (int): cardinalidad máxima para guardar la tabla de frecuencias completa.
+        max_categorias (int): valores distintos a partir de los cuales se aproxima
+            (cuantiles del sketch en numéricas, n_unique estimado en categóricas).
+        tamano_muestra (int): capacidad k del sketch de cuantiles (SketchCuantiles).
+        semilla (int): semilla del sketch.
+        mostrar_head (int): filas del primer bloque que se guardan como 'head'.
+        **read_csv_kwargs: argumentos extra para pd.read_csv (ej. dtype, parse_dates).
+    returns:
+        Tuple[Dict, Dict]: (perfil {columna: estadísticas, con 'aproximado'},
+            estructura {'shape', 'dtypes', 'head'}).
+    """
+    perfil = PerfilDatos(k=tamano_muestra, max_distintos=max_categorias,
+                         max_categorias=max_categorias, semilla=semilla)
+    dtypes: Dict = {}
+    head = None
+    for bloque in leer_por_bloques(ruta, chunksize=chunksize, columnas=columnas, **read_csv_kwargs):
+        if head is None:
+            head = bloque.head(mostrar_head)
+            dtypes = {c: bloque[c].dtype for c in bloque.columns}
+        for c in dtypes:
+            dtypes[c] = _dtype_combinado(dtypes[c], bloque[c].dtype)
+        perfil.actualizar(bloque)
+
+    if head is None:
+        raise ValueError(f"El fichero '{ruta}' no tiene filas")
+    estructura = {"shape": (perfil.n_filas, len(dtypes)), "dtypes": pd.Series(dtypes, dtype=object),
+                  "head": head}
+    return perfil.perfil_columnas(top_n, max_valores), estructura
+
+
+def analisis_exploratorio_por_bloques(ruta: str, nombre_df: Optional[str] = None,
+                                      mostrar_head: int = 5, round_decimals: int = 2,
+                                      mostrar: bool = True, chunksize: int = 100_000,
+                                      **kwargs) -> Dict:
+    """
+    analisis_exploratorio sobre un fichero leído por bloques (memoria acotada).
+    args:
+        ruta (str): CSV o Parquet de data/processed/.
+        nombre_df (str): nombre para el informe; por defecto el nombre del fichero.
+        mostrar_head (int): filas a mostrar en estructura.
+        round_decimals (int): decimales para resumen numérico.
+        mostrar (bool): si False no imprime ni renderiza (ni importa IPython).
+        chunksize (int): filas por bloque.
+        **kwargs: argumentos de perfil_por_bloques (max_categorias, tamano_muestra, dtype...).
+    returns:
+        Dict: mismas claves que analisis_exploratorio más 'aproximado' (lista de columnas
+            con cuantiles o n_unique estimados).
+    """
+    if nombre_df is None:
+        nombre_df = os.path.splitext(os.path.basename(ruta))[0]
+    perfil, estructura = perfil_por_bloques(ruta, chunksize=chunksize, top_n=3,
+                                            mostrar_head=mostrar_head, **kwargs)
+    resultados = informe_desde_perfil(perfil, estructura, nombre_df, round_decimals, mostrar)
+    resultados['aproximado'] = [c for c, p in perfil.items() if p["aproximado"]]
+    return resultados
+
+
+def categorical_summary_por_bloques(ruta: str, top_n: int = 3, chunksize: int = 100_000,
+                                    **kwargs) -> pd.DataFrame:
+    """
+    categorical_summary sobre un fichero leído por bloques.
+    args:
+        ruta (str): CSV o Parquet de data/processed/.
+        top_n (int): número de valores top a incluir.
+        chunksize (int): filas por bloque.
+        **kwargs: argumentos de perfil_por_bloques.
+    returns:
+        pd.DataFrame: columnas 'n_unique', 'top_values' y 'top_counts' por columna categórica.
+    """
+    perfil, _ = perfil_por_bloques(ruta, chunksize=chunksize, top_n=top_n, **kwargs)
+    return tabla_categoricas(perfil)
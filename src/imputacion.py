@@ -0,0 +1,150 @@
+# src/imputacion.py
+import json
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from src.analisis_exploratorio import valor_json
+from src.data_cleaning import valor_moda
+"""
+Módulo: imputacion.py
+======================================================
+
+Imputación con estadísticos aprendidos una vez (fit) y aplicados a lotes nuevos (transform).
+
+Este módulo está diseñado para:
+- Aprender medianas, modas y vocabularios de categorías sobre el histórico completo.
+- Guardarlos en disco (JSON) y reutilizarlos al puntuar lotes nuevos de campaña, de modo que
+  un lote pequeño recibe los mismos valores de relleno y las mismas categorías que el
+  histórico en lugar de los de su propia muestra.
+- Aplicar el relleno en O(n) por columna (fillna + cast a un dtype fijo), sin ordenar datos.
+
+------------------------------------------------------
+CLASES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) Imputador(mediana=None, moda=None, categorias=None)
+   - Argumentos: listas de columnas a imputar por mediana, por moda y a convertir a category
+     con vocabulario fijo.
+   - imp.fit(df): aprende los valores de relleno (imp.valores) y las categorías (imp.categorias).
+   - imp.transform(df, inplace=False): rellena NaN y aplica las categorías aprendidas.
+     Los valores no vistos en el fit quedan como NaN y se cuentan en imp.no_vistos.
+   - imp.fit_transform(df): fit + transform.
+   - imp.guardar(ruta) / Imputador.cargar(ruta): persistencia en JSON.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- Mismas reglas que data_cleaning: la mediana solo se aplica a columnas numéricas y la moda
+  es el primer valor de Series.mode(dropna=True).
+- Para la campaña bancaria usar cleaning_campaing.ajustar_imputador_campaign, que aprende los
+  valores exactamente como los calcula clean_campaign_df.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+from src.imputacion import Imputador
+imp = Imputador(mediana=['age'], moda=['education'], categorias=['job', 'education']).fit(df_historico)
+imp.guardar('../data/processed/imputador.json')
+df_lote = Imputador.cargar('../data/processed/imputador.json').transform(df_lote_nuevo)
+"""
+
+__all__ = [
+    "Imputador",
+]
+
+
+class Imputador:
+    """
+    Imputador fit/transform con estadísticos persistentes.
+    valores: {columna: valor de relleno}; categorias: {columna: CategoricalDtype}.
+    """
+
+    def __init__(self, mediana: Optional[List[str]] = None, moda: Optional[List[str]] = None,
+                 categorias: Optional[List[str]] = None):
+        self.mediana = list(mediana or [])
+        self.moda = list(moda or [])
+        self.columnas_categoria = list(categorias or [])
+        self.valores: Dict[str, Any] = {}
+        self.categorias: Dict[str, pd.CategoricalDtype] = {}
+        self.no_vistos: Dict[str, int] = {}
+
+    def fit(self, df: pd.DataFrame) -> "Imputador":
+        """Aprende medianas, modas y categorías de df."""
+        self.valores = {}
+        for c in self.mediana:
+            if c in df.columns and pd.api.types.is_numeric_dtype(df[c]):
+                mediana = df[c].median()
+                if not pd.isna(mediana):
+                    self.valores[c] = mediana
+        for c in self.moda:
+            if c in df.columns:
+                moda = valor_moda(df[c])
+                if moda is not None:
+                    self.valores[c] = moda
+        self.categorias = {}
+        for c in self.columnas_categoria:
+            if c in df.columns:
+                serie = df[c] if isinstance(df[c].dtype, pd.CategoricalDtype) else df[c].astype('category')
+                self.categorias[c] = serie.dtype
+        return self
+
+    def transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """Rellena NaN con los valores aprendidos y aplica los vocabularios de categorías."""
+        if not inplace:
+            df = df.copy()
+        for c, valor in self.valores.items():
+            if c in df.columns and df[c].isna().any():
+                serie = df[c]
+                if isinstance(serie.dtype, pd.CategoricalDtype) and valor not in serie.cat.categories:
+                    serie = serie.cat.add_categories([valor])
+                df[c] = serie.fillna(valor)
+        self.no_vistos = {}
+        for c, dtype in self.categorias.items():
+            if c in df.columns:
+                presentes = df[c].notna().to_numpy()
+                df[c] = df[c].astype(dtype)
+                self.no_vistos[c] = int((presentes & df[c].isna().to_numpy()).sum())
+        return df
+
+    def fit_transform(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        return self.fit(df).transform(df, inplace=inplace)
+
+    def to_dict(self) -> Dict:
+        categorias = {}
+        for c, dtype in self.categorias.items():
+            cats = dtype.categories
+            categorias[str(c)] = {
+                "categories": [valor_json(v) for v in cats],
+                "categories_dtype": str(cats.dtype),
+                "ordered": bool(dtype.ordered),
+            }
+        return {
+            "mediana": self.mediana,
+            "moda": self.moda,
+            "categorias_columnas": self.columnas_categoria,
+            "valores": {str(c): valor_json(v) for c, v in self.valores.items()},
+            "categorias": categorias,
+        }
+
+    @classmethod
+    def from_dict(cls, datos: Dict) -> "Imputador":
+        imp = cls(datos["mediana"], datos["moda"], datos["categorias_columnas"])
+        imp.valores = dict(datos["valores"])
+        imp.categorias = {
+            c: pd.CategoricalDtype(pd.Index(info["categories"], dtype=info["categories_dtype"]),
+                                   ordered=info["ordered"])
+            for c, info in datos["categorias"].items()
+        }
+        return imp
+
+    def guardar(self, ruta: str) -> str:
+        """Guarda el imputador en JSON y devuelve la ruta."""
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return ruta
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "Imputador":
+        """Carga un imputador guardado con guardar."""
+        with open(ruta, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
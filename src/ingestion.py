@@ -0,0 +1,321 @@
+# src/ingestion.py
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src import storage
+"""
+Módulo: ingestion.py
+======================================================
+
+Carga de los datos en bruto de clientes (customer-details.xlsx) con caché en disco y carga
+concurrente de todas las fuentes (bank-additional.csv + customer-details.xlsx).
+
+Este módulo está diseñado para:
+- Leer todas las hojas del Excel ('2012', '2013', '2014') abriendo el libro una sola vez.
+- Concatenarlas con el año como clave en la columna 'year', igual que el notebook.
+- Guardar el resultado en una caché Parquet indexada por el hash del contenido del libro,
+  de modo que las siguientes ejecuciones no pasan por openpyxl mientras el fichero no cambie.
+- Cargar a la vez el CSV de campaña (en un hilo) y las hojas del libro (una por proceso), de
+  modo que el tiempo total se acerque al de la fuente más lenta y no a la suma de todas.
+
+------------------------------------------------------
+FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) load_customer_details(ruta_xlsx='../data/raw/customer-details.xlsx',
+                         hojas=('2012', '2013', '2014'), cache_dir='../data/cache/',
+                         usar_cache=True, columnas=None)
+   - Devuelve el DataFrame combinado de clientes (sin normalizar nombres de columnas).
+   - Si el hash del libro coincide con una entrada de la caché la carga desde Parquet.
+   - columnas: lee solo esas columnas de la caché (proyección).
+   - Retorna: pd.DataFrame con la columna 'year' y las columnas originales del Excel.
+
+2) columnas_customer_details(ruta_xlsx='../data/raw/customer-details.xlsx',
+                             hojas=('2012', '2013', '2014'), cache_dir='../data/cache/')
+   - Columnas del DataFrame combinado leyendo solo el esquema de la caché (la crea si falta).
+
+3) hash_fichero(ruta)
+   - SHA-256 del contenido de un fichero, leído por bloques.
+
+4) cargar_fuentes(ruta_campaign='../data/raw/bank-additional.csv',
+                  ruta_clientes='../data/raw/customer-details.xlsx',
+                  hojas=('2012', '2013', '2014'), cache_dir='../data/cache/',
+                  usar_cache=True, n_procesos=None, **read_csv_kwargs)
+   - Lee todas las fuentes en bruto a la vez: el CSV con cleaning_campaing.leer_campaign_csv
+     en un hilo y cada hoja del libro en un proceso (si no están en la caché Parquet).
+   - Retorna: FuentesCrudas.
+
+5) FuentesCrudas
+   - fuentes.campaign: DataFrame para clean_campaign_df.
+   - fuentes.clientes: concatenación de las hojas (igual que load_customer_details).
+   - fuentes.hojas: {hoja: DataFrame} antes de concatenar.
+   - fuentes.tabla(): segundos, filas y origen ('csv', 'excel', 'cache') de cada fuente;
+     fuentes.total_segundos: tiempo total de la carga.
+
+6) hash_con_indice(ruta, cache_dir)
+   - hash_fichero sin releer el fichero si su tamaño y fecha de modificación no han cambiado
+     (índice en cache_dir). Identifica el libro en la caché de clientes y las fuentes en
+     src.pipeline.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- Para no releer el libro en cada ejecución, el hash se recalcula solo si cambian el
+  tamaño o la fecha de modificación (mtime) del fichero.
+- La caché se puede borrar sin riesgo: se regenera en la siguiente carga.
+- cargar_fuentes solo compensa en frío (sin caché de clientes) y con varios núcleos: cada
+  proceso vuelve a abrir el libro (~1 s en customer-details.xlsx) y parsea solo su hoja, así que
+  con un único núcleo las hojas se leen en una sola apertura del libro, en paralelo con el CSV.
+- Los procesos de las hojas se crean con 'forkserver' ('spawn' en Windows), no con fork: en
+  scripts la llamada debe ir bajo if __name__ == '__main__'.
+- Benchmark frente a la carga secuencial en `python -m benchmarks.bench_carga`.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+import src.ingestion as ing
+import src.data_cleaning as dc
+import src.cleaning_campaing as cc
+df_customer_details = ing.load_customer_details()
+df_customer_details = dc.clean_column_names(df_customer_details, verbose=True)
+# Carga en frío de todas las fuentes a la vez
+fuentes = ing.cargar_fuentes()
+fuentes.tabla()
+df_campaign_clean = cc.clean_campaign_df(fuentes.campaign)
+df_customer_details = dc.clean_column_names(fuentes.clientes, verbose=True)
+"""
+
+__all__ = [
+    "load_customer_details",
+    "columnas_customer_details",
+    "hash_fichero",
+    "cargar_fuentes",
+    "FuentesCrudas",
+    "hash_con_indice",
+]
+
+HOJAS_CLIENTES = ('2012', '2013', '2014')
+
+# Fichero de la caché con {ruta absoluta: {size, mtime, hash}} para evitar rehashear
+_INDICE_CACHE = "indice_cache.json"
+
+
+def hash_fichero(ruta: str, bloque: int = 1 << 20) -> str:
+    """SHA-256 del contenido de un fichero.
+    args:
+        ruta (str): fichero a leer.
+        bloque (int): bytes leídos en cada iteración.
+    returns:
+        str: hash hexadecimal."""
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for trozo in iter(lambda: f.read(bloque), b''):
+            h.update(trozo)
+    return h.hexdigest()
+
+
+def _leer_indice(cache_dir: str) -> Dict:
+    try:
+        with open(os.path.join(cache_dir, _INDICE_CACHE), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def hash_con_indice(ruta: str, cache_dir: str) -> str:
+    """
+    hash_fichero reutilizando el último calculado si size y mtime no han cambiado.
+    args:
+        ruta (str): fichero a identificar.
+        cache_dir (str): carpeta de la caché donde se guarda el índice ruta -> (size, mtime, hash).
+    returns:
+        str: SHA-256 del contenido del fichero.
+    """
+    clave = os.path.abspath(ruta)
+    info = os.stat(ruta)
+    indice = _leer_indice(cache_dir)
+    previo = indice.get(clave)
+    if previo and previo['size'] == info.st_size and previo['mtime'] == info.st_mtime_ns:
+        return previo['hash']
+
+    digest = hash_fichero(ruta)
+    indice[clave] = {'size': info.st_size, 'mtime': info.st_mtime_ns, 'hash': digest}
+    with open(os.path.join(cache_dir, _INDICE_CACHE), 'w', encoding='utf-8') as f:
+        json.dump(indice, f, indent=2)
+    return digest
+
+
+def _leer_excel_clientes(ruta_xlsx: str, hojas: Sequence[str]) -> pd.DataFrame:
+    """Lee todas las hojas en una sola apertura del libro y las concatena con 'year'."""
+    por_hoja = pd.read_excel(ruta_xlsx, sheet_name=list(hojas), index_col=0)
+    return _concatenar_hojas(por_hoja, hojas)
+
+
+def _concatenar_hojas(por_hoja: Dict[str, pd.DataFrame], hojas: Sequence[str]) -> pd.DataFrame:
+    """Concatena las hojas con el nombre de cada una en la columna 'year'."""
+    df = pd.concat([por_hoja[h] for h in hojas], keys=list(hojas), axis=0)
+    df = df.reset_index(level=0)
+    return df.rename(columns={'level_0': 'year'})
+
+
+def _nombre_cache(ruta_xlsx: str, hojas: Sequence[str], cache_dir: str) -> str:
+    """Nombre del dataset de caché: hash del libro + hash de las hojas pedidas."""
+    digest = hash_con_indice(ruta_xlsx, cache_dir)
+    # La clave incluye las hojas pedidas: otra selección genera otra entrada
+    clave_hojas = hashlib.sha256('|'.join(hojas).encode()).hexdigest()[:8]
+    return f"customer_details_{digest[:16]}_{clave_hojas}"
+
+
+def load_customer_details(ruta_xlsx: str = '../data/raw/customer-details.xlsx',
+                          hojas: Sequence[str] = HOJAS_CLIENTES,
+                          cache_dir: Optional[str] = '../data/cache/',
+                          usar_cache: bool = True,
+                          columnas: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Carga customer-details.xlsx combinando sus hojas anuales, con caché Parquet.
+    args:
+        ruta_xlsx (str): ruta al libro Excel.
+        hojas (Sequence[str]): hojas a leer; su nombre se guarda en la columna 'year'.
+        cache_dir (str): carpeta de la caché (se crea si no existe).
+        usar_cache (bool): si False (o cache_dir es None) lee siempre el Excel.
+        columnas (List[str]): columnas a devolver; con la caché creada solo se leen esas.
+    returns:
+        pd.DataFrame: clientes de todas las hojas, con el mismo índice y columnas
+            que la concatenación del notebook (antes de clean_column_names).
+    """
+    if not usar_cache or cache_dir is None:
+        df = _leer_excel_clientes(ruta_xlsx, hojas)
+        return df if columnas is None else df[list(columnas)]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    nombre = _nombre_cache(ruta_xlsx, hojas, cache_dir)
+
+    if os.path.exists(os.path.join(cache_dir, f"{nombre}.parquet")):
+        return storage.load_dataset(nombre, ruta=cache_dir, columns=columnas)
+
+    df = _leer_excel_clientes(ruta_xlsx, hojas)
+    storage.save_dataset(df, nombre, ruta=cache_dir)
+    return df if columnas is None else df[list(columnas)]
+
+
+def columnas_customer_details(ruta_xlsx: str = '../data/raw/customer-details.xlsx',
+                              hojas: Sequence[str] = HOJAS_CLIENTES,
+                              cache_dir: str = '../data/cache/') -> List[str]:
+    """Columnas del DataFrame combinado de clientes, leídas del esquema de la caché
+    (si la caché no existe se crea cargando el libro una vez)."""
+    os.makedirs(cache_dir, exist_ok=True)
+    nombre = _nombre_cache(ruta_xlsx, hojas, cache_dir)
+    if not os.path.exists(os.path.join(cache_dir, f"{nombre}.parquet")):
+        load_customer_details(ruta_xlsx, hojas, cache_dir)
+    return storage.columnas_dataset(nombre, ruta=cache_dir)
+
+
+class FuentesCrudas:
+    """Datos en bruto de campaña y clientes cargados por cargar_fuentes, con el tiempo de cada fuente."""
+
+    def __init__(self, campaign: pd.DataFrame, clientes: pd.DataFrame,
+                 hojas: Optional[Dict[str, pd.DataFrame]], tiempos: List[Dict], total_segundos: float):
+        self.campaign = campaign
+        self.clientes = clientes
+        self._hojas = hojas
+        self.tiempos = tiempos
+        self.total_segundos = total_segundos
+
+    @property
+    def hojas(self) -> Dict[str, pd.DataFrame]:
+        """{hoja: DataFrame} antes de concatenar (desde la caché se separan por 'year')."""
+        if self._hojas is None:
+            self._hojas = {str(h): g.drop(columns='year') for h, g in self.clientes.groupby('year', sort=False)}
+        return self._hojas
+
+    def tabla(self) -> pd.DataFrame:
+        """DataFrame indexado por fuente con segundos, filas y origen."""
+        return pd.DataFrame(self.tiempos, columns=['fuente', 'segundos', 'filas', 'origen']).set_index('fuente')
+
+
+def _leer_hoja(ruta_xlsx: str, hoja: str) -> Tuple[pd.DataFrame, float]:
+    """Una hoja del libro y los segundos que ha tardado (se ejecuta en un proceso del pool)."""
+    inicio = time.perf_counter()
+    df = pd.read_excel(ruta_xlsx, sheet_name=hoja, index_col=0)
+    return df, time.perf_counter() - inicio
+
+
+def _leer_csv_campaign(ruta_csv: str, read_csv_kwargs: Dict) -> Tuple[pd.DataFrame, float]:
+    import src.cleaning_campaing as cc
+    inicio = time.perf_counter()
+    df = cc.leer_campaign_csv(ruta_csv, **read_csv_kwargs)
+    return df, time.perf_counter() - inicio
+
+
+def cargar_fuentes(ruta_campaign: str = '../data/raw/bank-additional.csv',
+                   ruta_clientes: str = '../data/raw/customer-details.xlsx',
+                   hojas: Sequence[str] = HOJAS_CLIENTES,
+                   cache_dir: Optional[str] = '../data/cache/',
+                   usar_cache: bool = True,
+                   n_procesos: Optional[int] = None,
+                   **read_csv_kwargs) -> FuentesCrudas:
+    """
+    Carga a la vez bank-additional.csv y las hojas de customer-details.xlsx.
+    args:
+        ruta_campaign (str): CSV de campaña (se lee con cleaning_campaing.leer_campaign_csv).
+        ruta_clientes (str): libro Excel de clientes.
+        hojas (Sequence[str]): hojas a leer; su nombre se guarda en la columna 'year'.
+        cache_dir (str): caché Parquet de clientes, la misma que load_customer_details.
+        usar_cache (bool): si False (o cache_dir es None) lee siempre el Excel.
+        n_procesos (int): procesos para las hojas (None = una por hoja, como máximo
+            os.cpu_count()); con 1 las hojas se leen en una sola apertura del libro en el
+            proceso actual.
+        **read_csv_kwargs: argumentos extra para leer el CSV.
+    returns:
+        FuentesCrudas: campaign y clientes idénticos a leer_campaign_csv y load_customer_details.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    inicio = time.perf_counter()
+    hojas = list(hojas)
+    tiempos: List[Dict] = []
+    por_hoja = None
+    with ThreadPoolExecutor(max_workers=1) as hilo:
+        # El CSV se lee en un hilo mientras el proceso principal reparte las hojas
+        futuro_campaign = hilo.submit(_leer_csv_campaign, ruta_campaign, read_csv_kwargs)
+
+        inicio_clientes = time.perf_counter()
+        nombre = None
+        if usar_cache and cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            nombre = _nombre_cache(ruta_clientes, hojas, cache_dir)
+        if nombre is not None and os.path.exists(os.path.join(cache_dir, f"{nombre}.parquet")):
+            clientes = storage.load_dataset(nombre, ruta=cache_dir)
+            origen = 'cache'
+        else:
+            n_procesos = min(n_procesos or os.cpu_count() or 1, len(hojas))
+            if n_procesos > 1:
+                # Con el hilo del CSV ya en marcha, fork podría copiar un lock tomado por ese
+                # hilo y bloquear al hijo: los procesos salen de un servidor limpio
+                metodo = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                with ProcessPoolExecutor(max_workers=n_procesos,
+                                         mp_context=multiprocessing.get_context(metodo)) as pool:
+                    futuros = {h: pool.submit(_leer_hoja, ruta_clientes, h) for h in hojas}
+                    por_hoja = {}
+                    for h, futuro in futuros.items():
+                        por_hoja[h], segundos = futuro.result()
+                        tiempos.append({'fuente': f"hoja {h}", 'segundos': segundos,
+                                        'filas': len(por_hoja[h]), 'origen': 'excel'})
+            else:
+                por_hoja = pd.read_excel(ruta_clientes, sheet_name=hojas, index_col=0)
+            clientes = _concatenar_hojas(por_hoja, hojas)
+            if nombre is not None:
+                storage.save_dataset(clientes, nombre, ruta=cache_dir)
+            origen = 'excel'
+        tiempos.insert(0, {'fuente': 'clientes', 'segundos': time.perf_counter() - inicio_clientes,
+                           'filas': len(clientes), 'origen': origen})
+
+        campaign, segundos = futuro_campaign.result()
+        tiempos.insert(0, {'fuente': 'campaign', 'segundos': segundos, 'filas': len(campaign), 'origen': 'csv'})
+    return FuentesCrudas(campaign, clientes, por_hoja, tiempos, time.perf_counter() - inicio)
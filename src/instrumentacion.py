@@ -0,0 +1,172 @@
+# src/instrumentacion.py
+import time
+import tracemalloc
+
+import pandas as pd
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+"""
+Módulo: instrumentacion.py
+======================================================
+
+Medición por etapas de los pipelines de limpieza (ej. clean_campaign_df).
+
+Este módulo está diseñado para:
+- Ejecutar un pipeline como una lista de etapas con nombre y medir cada una: tiempo,
+  incremento de memoria pico, filas afectadas y NaN introducidos.
+- Reunir las métricas en un informe de ejecución (InformeEjecucion) consultable como tabla.
+- Enviar las métricas de cada etapa a un callback (ej. el sistema de métricas del equipo).
+
+------------------------------------------------------
+CLASES Y FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) InformeEjecucion(nombre='pipeline', medir_memoria=False, callback=None)
+   - informe.etapas: lista de dicts, uno por etapa, con las claves
+       etapa, segundos, memoria_pico_mb, filas_afectadas, nan_introducidos.
+   - informe.tabla(): DataFrame con una fila por etapa.
+   - informe.detalles: datos extra que anotan las etapas (ej. nan_coercionados de clean_campaign_df).
+   - informe.total_segundos, informe.to_dict().
+   - callback(metricas): se llama al terminar cada etapa con su dict de métricas.
+
+2) ejecutar_etapas(df, etapas, informe=None)
+   - etapas: lista de (nombre, funcion(df) -> df, columnas que toca la etapa).
+   - Sin informe ejecuta las etapas en orden sin ningún coste de medición.
+   - Retorna: DataFrame resultante.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- filas_afectadas: filas en las que cambia algún valor de las columnas de la etapa
+  (comparando valores, no dtypes: pasar 'a' a category no cuenta; '0,7' → 0.7 sí).
+  Crear una columna cuenta sus valores no nulos; eliminarla, los que tenía.
+- nan_introducidos es neto: negativo cuando la etapa imputa más NaN de los que crea.
+- medir_memoria usa tracemalloc, que ralentiza la ejecución: medir tiempos y memoria en
+  ejecuciones separadas si se necesitan tiempos precisos.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+import src.cleaning_campaing as cc
+from src.instrumentacion import InformeEjecucion
+informe = InformeEjecucion('clean_campaign_df', medir_memoria=True, callback=print)
+df_campaign_clean = cc.clean_campaign_df(df_campaign, informe=informe)
+informe.tabla()
+"""
+
+__all__ = [
+    "InformeEjecucion",
+    "ejecutar_etapas",
+]
+
+Etapa = Tuple[str, Callable[[pd.DataFrame], pd.DataFrame], Optional[Sequence[str]]]
+
+
+class InformeEjecucion:
+    """Métricas por etapa de una ejecución de un pipeline."""
+
+    def __init__(self, nombre: str = 'pipeline', medir_memoria: bool = False,
+                 callback: Optional[Callable[[Dict], None]] = None):
+        self.nombre = nombre
+        self.medir_memoria = medir_memoria
+        self.callback = callback
+        self.etapas: List[Dict] = []
+        self.detalles: Dict[str, Dict] = {}
+
+    def registrar(self, metricas: Dict) -> None:
+        self.etapas.append(metricas)
+        if self.callback is not None:
+            self.callback(metricas)
+
+    @property
+    def total_segundos(self) -> float:
+        return float(sum(e['segundos'] for e in self.etapas))
+
+    def tabla(self) -> pd.DataFrame:
+        """DataFrame indexado por etapa con sus métricas."""
+        columnas = ['etapa', 'segundos', 'memoria_pico_mb', 'filas_afectadas', 'nan_introducidos']
+        return pd.DataFrame(self.etapas, columns=columnas).set_index('etapa')
+
+    def to_dict(self) -> Dict:
+        return {'nombre': self.nombre, 'total_segundos': self.total_segundos, 'etapas': list(self.etapas),
+                'detalles': dict(self.detalles)}
+
+
+def _valores_iguales(antes: pd.Series, despues: pd.Series) -> np.ndarray:
+    """Máscara de filas con el mismo valor (NaN == NaN), independientemente del dtype."""
+    a = antes.to_numpy(dtype=object, copy=True)
+    b = despues.to_numpy(dtype=object, copy=True)
+    nulos_a = pd.isna(a)
+    nulos_b = pd.isna(b)
+    # pd.NA no admite comparación booleana: los nulos se sustituyen antes de comparar
+    a[nulos_a] = None
+    b[nulos_b] = None
+    iguales = np.asarray(a == b, dtype=bool)
+    return (iguales & ~nulos_a & ~nulos_b) | (nulos_a & nulos_b)
+
+
+def _comparar(antes: Dict[str, pd.Series], df: pd.DataFrame, n_filas: int,
+              columnas: Sequence[str]) -> Tuple[int, int]:
+    """Filas afectadas y NaN introducidos en las columnas de una etapa."""
+    afectadas = np.zeros(n_filas, dtype=bool)
+    nan_antes = 0
+    nan_despues = 0
+    for c in columnas:
+        previa = antes.get(c)
+        actual = df[c] if c in df.columns else None
+        if previa is not None:
+            nan_antes += int(previa.isna().sum())
+        if actual is not None:
+            nan_despues += int(actual.isna().sum())
+        if previa is None and actual is not None:
+            afectadas |= actual.notna().to_numpy()
+        elif previa is not None and actual is None:
+            afectadas |= previa.notna().to_numpy()
+        elif previa is not None and len(previa) == len(actual) == n_filas:
+            afectadas |= ~_valores_iguales(previa, actual)
+    return int(afectadas.sum()), nan_despues - nan_antes
+
+
+def ejecutar_etapas(df: pd.DataFrame, etapas: List[Etapa],
+                    informe: Optional[InformeEjecucion] = None) -> pd.DataFrame:
+    """
+    Ejecuta las etapas en orden y, si se pasa un informe, registra sus métricas.
+    args:
+        df (pd.DataFrame): entrada de la primera etapa.
+        etapas (List[Etapa]): (nombre, funcion(df) -> df, columnas); columnas=None = todas.
+        informe (InformeEjecucion): destino de las métricas (opcional).
+    returns:
+        pd.DataFrame: salida de la última etapa.
+    """
+    for nombre, funcion, columnas in etapas:
+        if informe is None:
+            df = funcion(df)
+            continue
+
+        columnas = list(df.columns) if columnas is None else list(columnas)
+        # Copia de las columnas de la etapa: algunas etapas modifican df en el sitio
+        antes = {c: df[c].copy() for c in columnas if c in df.columns}
+        previas = set(df.columns)
+        n_filas = len(df)
+
+        propio_tracemalloc = informe.medir_memoria and not tracemalloc.is_tracing()
+        if propio_tracemalloc:
+            tracemalloc.start()
+        if informe.medir_memoria:
+            tracemalloc.reset_peak()
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        df = funcion(df)
+        segundos = time.perf_counter() - t0
+        memoria = None
+        if informe.medir_memoria:
+            memoria = (tracemalloc.get_traced_memory()[1] - memoria_inicial) / 2**20
+        if propio_tracemalloc:
+            tracemalloc.stop()
+
+        # Las columnas creadas por la etapa cuentan aunque no se hayan declarado
+        columnas += [c for c in df.columns if c not in previas and c not in columnas]
+        filas, nan = _comparar(antes, df, n_filas, [c for c in columnas if c in antes or c in df.columns])
+        informe.registrar({'etapa': nombre, 'segundos': segundos, 'memoria_pico_mb': memoria,
+                           'filas_afectadas': filas, 'nan_introducidos': nan})
+    return df
@@ -0,0 +1,265 @@
+# src/join_clientes.py
+import hashlib
+import os
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from src.cache_perfiles import huella_columna
+"""
+Módulo: join_clientes.py
+======================================================
+
+Construcción de df_perfil_cliente (campaña ⋈ detalles de cliente por 'id') mediante un índice
+de claves binarias en lugar de un pd.merge sobre cadenas UUID de 36 caracteres.
+
+Este módulo está diseñado para:
+- Codificar cada 'id' una sola vez como clave binaria de 128 bits (los 16 bytes del UUID).
+- Mantener un índice ordenado de la tabla de clientes que se puede guardar en disco y
+  reutilizar entre reconstrucciones del dataset maestro.
+- Hacer el inner join con búsquedas binarias sobre ese índice (mismas filas que
+  pd.merge(how='inner') salvo en los ids nulos, que aquí no emparejan), en el orden de las
+  filas de campaña.
+- Informar de ids de campaña sin cliente, clientes sin campaña, ids nulos e ids duplicados.
+
+------------------------------------------------------
+FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) codificar_ids(ids)
+   - Convierte una serie de ids a claves 'S16'. Los UUID canónicos (minúsculas) se decodifican
+     de forma vectorizada; cualquier otro texto (y el UUID nil) usa un digest MD5 de 16 bytes.
+   - Retorna: np.ndarray 'S16' (b'' para ids nulos).
+
+2) construir_indice(df_customer, columna='id')
+   - Índice ordenado de la tabla de clientes: dict con 'claves' (orden de filas), 'orden'
+     (ordenación estable), 'n_filas' y 'huella' (cache_perfiles.huella_columna de los ids).
+
+3) guardar_indice(indice, ruta) / cargar_indice(ruta)
+   - Persistencia del índice en formato .npz.
+
+4) unir_perfil_cliente(df_campaign, df_customer, columna='id', indice=None, ruta_indice=None,
+                       id_como_indice=True, max_ids=20)
+   - Inner join campaña ⋈ clientes a través del índice.
+   - Si se pasa ruta_indice, reutiliza el índice guardado si la huella de la columna id
+     coincide (sin volver a decodificar los UUID) o lo reconstruye y lo guarda.
+   - Retorna: (df_perfil_cliente, informe) con el informe de ids sin pareja y duplicados
+     (conteos exactos y, como mucho, max_ids ids de ejemplo por lista).
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- A diferencia de pd.merge, los ids nulos nunca emparejan entre sí: sus filas se descartan y se
+  cuentan aparte ('n_campaign_id_nulo', 'n_clientes_id_nulo'), no como ids sin pareja.
+- Las columnas comunes (distintas de 'id') reciben los sufijos '_x' / '_y', como en pd.merge.
+- El orden es siempre el de la campaña, con los clientes de un mismo id en su orden original
+  (el documentado para how='inner'). pandas 2.2 no lo respeta cuando un id tiene varios
+  clientes, así que para comparar con pd.merge conviene ordenar ambos resultados.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+import src.join_clientes as jc
+df_perfil_cliente, informe = jc.unir_perfil_cliente(
+    df_campaign_clean, df_customer_details, ruta_indice='../data/cache/indice_clientes.npz')
+print(informe['n_campaign_sin_cliente'], informe['n_ids_duplicados_clientes'])
+"""
+
+__all__ = [
+    "codificar_ids",
+    "construir_indice",
+    "guardar_indice",
+    "cargar_indice",
+    "unir_perfil_cliente",
+]
+
+# Posiciones de los guiones en un UUID canónico y de sus 32 dígitos hexadecimales
+_GUIONES = [8, 13, 18, 23]
+_HEX = [i for i in range(36) if i not in _GUIONES]
+
+# Tabla código de carácter → valor del dígito (solo 0-9 y a-f; el resto es inválido = 255)
+_NIBBLE = np.full(128, 255, dtype="uint8")
+_NIBBLE[np.frombuffer(b"0123456789", dtype="uint8")] = np.arange(10)
+_NIBBLE[np.frombuffer(b"abcdef", dtype="uint8")] = np.arange(10, 16)
+
+
+def codificar_ids(ids: pd.Series) -> np.ndarray:
+    """Convierte ids UUID en claves binarias de 16 bytes.
+    args:
+        ids (pd.Series): columna 'id'.
+    returns:
+        np.ndarray: claves dtype 'S16'; b'' para ids nulos."""
+    nulos = ids.isna().to_numpy()
+    texto = ids.astype(object).where(~nulos, '').astype(str).to_numpy()
+
+    # Códigos de cada carácter, una fila por id; la columna 37 detecta textos más largos
+    try:
+        puntos = texto.astype('S37').view('uint8').reshape(len(texto), 37)
+    except UnicodeEncodeError:
+        puntos = texto.astype('U37').view('uint32').reshape(len(texto), 37)
+    guiones_ok = (puntos[:, _GUIONES] == ord('-')).all(axis=1) & (puntos[:, 36] == 0)
+    digitos = puntos[:, _HEX]
+    nibbles = _NIBBLE[np.minimum(digitos, 127)]
+    valido = guiones_ok & (nibbles != 255).all(axis=1)
+
+    # Dos dígitos hexadecimales por byte: los 16 bytes del UUID en orden (big-endian)
+    octetos = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+    claves = np.ascontiguousarray(octetos).view('S16').ravel()
+    # b'' queda reservado a los nulos: el UUID nil va también por el digest
+    valido &= octetos.any(axis=1)
+
+    # Ids que no son UUID canónicos: digest del texto (mismo tamaño de clave)
+    for i in np.flatnonzero(~valido & ~nulos):
+        claves[i] = hashlib.md5(texto[i].encode('utf-8')).digest()
+    claves[nulos] = b''
+    return claves
+
+
+def _mitades(claves: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Las dos mitades de 64 bits (big-endian) de cada clave 'S16', como uint64."""
+    partes = np.ascontiguousarray(claves).view('>u8').reshape(len(claves), 2).astype('uint64')
+    return partes[:, 0], partes[:, 1]
+
+
+def _buscar(claves_ordenadas: np.ndarray, consulta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Rango [inicio, fin) de cada clave de consulta en el índice ordenado.
+    La búsqueda binaria se hace sobre la mitad alta (uint64); solo los rangos con más de un
+    candidato (duplicados o colisión de la mitad alta) se resuelven comparando los 16 bytes."""
+    alto_idx, bajo_idx = _mitades(claves_ordenadas)
+    alto, bajo = _mitades(consulta)
+    # Consultas ordenadas: cada búsqueda parte de la anterior y evita saltos aleatorios en memoria
+    orden = np.argsort(alto)
+    inicio = np.empty(len(alto), dtype="int64")
+    fin = np.empty(len(alto), dtype="int64")
+    inicio[orden] = np.searchsorted(alto_idx, alto[orden], side='left')
+    fin[orden] = np.searchsorted(alto_idx, alto[orden], side='right')
+    unico = (fin - inicio) == 1
+    fin[unico] = inicio[unico] + (bajo_idx[inicio[unico]] == bajo[unico])
+    ambiguo = np.flatnonzero((fin - inicio) > 1)
+    if len(ambiguo):
+        inicio[ambiguo] = np.searchsorted(claves_ordenadas, consulta[ambiguo], side='left')
+        fin[ambiguo] = np.searchsorted(claves_ordenadas, consulta[ambiguo], side='right')
+    return inicio, fin
+
+
+def construir_indice(df_customer: pd.DataFrame, columna: str = 'id') -> Dict:
+    """Índice ordenado de los ids de la tabla de clientes.
+    args:
+        df_customer (pd.DataFrame): tabla de clientes.
+        columna (str): columna con el id.
+    returns:
+        Dict: {'claves': claves en orden de filas, 'orden': ordenación estable, 'n_filas',
+            'huella': huella del contenido de la columna id}."""
+    claves = codificar_ids(df_customer[columna])
+    alto, bajo = _mitades(claves)
+    # Orden de bytes = orden de (alto, bajo) big-endian; lexsort es estable
+    return {"claves": claves, "orden": np.lexsort((bajo, alto)), "n_filas": len(claves),
+            "huella": huella_columna(df_customer[columna])}
+
+
+def guardar_indice(indice: Dict, ruta: str) -> str:
+    """Guarda el índice en .npz y devuelve la ruta."""
+    np.savez(ruta, claves=indice["claves"], orden=indice["orden"], n_filas=indice["n_filas"],
+             huella=indice["huella"])
+    return ruta
+
+
+def cargar_indice(ruta: str) -> Dict:
+    """Carga un índice guardado con guardar_indice."""
+    with np.load(ruta) as datos:
+        # Índices guardados sin huella (versiones anteriores) no se pueden validar: se reconstruyen
+        huella = str(datos["huella"]) if "huella" in datos.files else None
+        return {"claves": datos["claves"], "orden": datos["orden"], "n_filas": int(datos["n_filas"]),
+                "huella": huella}
+
+
+def _indice_valido(indice: Dict, df_customer: pd.DataFrame, columna: str) -> bool:
+    """Comprueba que el índice corresponde a df_customer comparando la huella de todos sus ids
+    (un hash por valor, sin decodificar los UUID); detecta también ids permutados entre filas."""
+    if indice["n_filas"] != len(df_customer) or indice.get("huella") is None:
+        return False
+    return indice["huella"] == huella_columna(df_customer[columna])
+
+
+def unir_perfil_cliente(df_campaign: pd.DataFrame, df_customer: pd.DataFrame,
+                        columna: str = 'id', indice: Optional[Dict] = None,
+                        ruta_indice: Optional[str] = None,
+                        id_como_indice: bool = True, max_ids: int = 20) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Inner join de campaña y clientes por id usando el índice ordenado de clientes.
+    Produce las mismas filas que pd.merge(df_campaign, df_customer, on=columna, how='inner'),
+    en el orden de df_campaign, salvo en los ids nulos: pd.merge empareja los nulos entre sí y
+    aquí se descartan (se cuentan en 'n_campaign_id_nulo' y 'n_clientes_id_nulo').
+    args:
+        df_campaign (pd.DataFrame): tabla izquierda (campaña limpia).
+        df_customer (pd.DataFrame): tabla derecha (detalles de cliente).
+        columna (str): columna de unión.
+        indice (Dict): índice ya construido de df_customer (opcional).
+        ruta_indice (str): .npz donde reutilizar/guardar el índice (opcional).
+        id_como_indice (bool): si True fija el id como índice sin nombre, como en el notebook.
+        max_ids (int): ids de ejemplo como máximo en las listas del informe.
+    returns:
+        Tuple[pd.DataFrame, Dict]: DataFrame unido e informe con
+            'n_campaign_sin_cliente' (filas), 'ids_campaign_sin_cliente' (muestra de ids
+            distintos), 'n_clientes_sin_campaign' (filas), 'n_campaign_id_nulo',
+            'n_clientes_id_nulo' (filas), 'n_ids_duplicados_clientes',
+            'n_ids_duplicados_campaign' (ids distintos repetidos) e 'ids_duplicados_clientes'
+            (muestra). Las filas con id nulo no cuentan como sin cliente / sin campaña.
+    """
+    if indice is None and ruta_indice is not None and os.path.exists(ruta_indice):
+        indice = cargar_indice(ruta_indice)
+        if not _indice_valido(indice, df_customer, columna):
+            indice = None
+    if indice is None:
+        indice = construir_indice(df_customer, columna)
+        if ruta_indice is not None:
+            guardar_indice(indice, ruta_indice)
+
+    claves_ordenadas = indice["claves"][indice["orden"]]
+    consulta = codificar_ids(df_campaign[columna])
+    consulta_nula = consulta == b''
+    inicio, fin = _buscar(claves_ordenadas, consulta)
+    # Los ids nulos (b'') no emparejan aunque haya clientes con id nulo
+    fin = np.where(consulta_nula, inicio, fin)
+    n_parejas = fin - inicio
+
+    # Expandir cada fila de campaña a todas sus parejas (en orden original de clientes)
+    filas_izq = np.repeat(np.arange(len(consulta)), n_parejas)
+    desplazamiento = np.arange(n_parejas.sum()) - np.repeat(np.cumsum(n_parejas) - n_parejas, n_parejas)
+    filas_der = indice["orden"][np.repeat(inicio, n_parejas) + desplazamiento]
+
+    izquierda = df_campaign.take(filas_izq).reset_index(drop=True)
+    derecha = df_customer.drop(columns=columna).take(filas_der).reset_index(drop=True)
+    comunes = izquierda.columns.intersection(derecha.columns).difference([columna])
+    izquierda = izquierda.rename(columns={c: f"{c}_x" for c in comunes})
+    derecha = derecha.rename(columns={c: f"{c}_y" for c in comunes})
+    df_perfil = pd.concat([izquierda, derecha], axis=1)
+    if id_como_indice:
+        df_perfil = df_perfil.set_index(columna)
+        df_perfil.index.name = None
+
+    # Informe de calidad de la unión
+    emparejados = np.zeros(len(claves_ordenadas), dtype=bool)
+    emparejados[np.repeat(inicio, n_parejas) + desplazamiento] = True
+    duplicado_cliente = np.zeros(len(claves_ordenadas), dtype=bool)
+    duplicado_cliente[1:] = (claves_ordenadas[1:] == claves_ordenadas[:-1]) & (claves_ordenadas[1:] != b'')
+    # Un id repetido k veces marca k-1 posiciones: las primeras de cada grupo son los ids distintos
+    primera_repeticion = duplicado_cliente.copy()
+    primera_repeticion[1:] &= ~duplicado_cliente[:-1]
+    ids_duplicados = df_customer[columna].iloc[indice["orden"][primera_repeticion]]
+    sin_cliente = (n_parejas == 0) & ~consulta_nula
+    cliente_nulo = claves_ordenadas == b''
+    alto, bajo = _mitades(consulta[~consulta_nula])
+    pares = pd.DataFrame({"alto": alto, "bajo": bajo})
+    informe = {
+        "n_campaign_sin_cliente": int(sin_cliente.sum()),
+        "ids_campaign_sin_cliente": df_campaign[columna][sin_cliente].drop_duplicates().head(max_ids).tolist(),
+        "n_clientes_sin_campaign": int((~emparejados & ~cliente_nulo).sum()),
+        "n_campaign_id_nulo": int(consulta_nula.sum()),
+        "n_clientes_id_nulo": int(cliente_nulo.sum()),
+        "n_ids_duplicados_clientes": int(primera_repeticion.sum()),
+        "ids_duplicados_clientes": ids_duplicados.head(max_ids).tolist(),
+        "n_ids_duplicados_campaign": int(pares[pares.duplicated()].drop_duplicates().shape[0]),
+    }
+    return df_perfil, informe
@@ -0,0 +1,511 @@
+# src/perfiles.py
+import json
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional
+
+from src.analisis_exploratorio import (CUANTILES_DESCRIBE, es_categorica, es_numerica,
+                                       tabla_categoricas, valor_json)
+"""
+Módulo: perfiles.py
+======================================================
+
+Perfiles de datos incrementales y combinables (mergeables) por partición.
+
+Este módulo está diseñado para:
+- Calcular un perfil por partición (hoja anual de clientes, lote de campaña) una sola vez.
+- Combinar perfiles de particiones sin volver a leer los datos: conteos, faltantes,
+  tablas de frecuencias, media/varianza exactas y cuantiles aproximados (sketch).
+- Guardar los perfiles en disco (JSON) y reconstruir el informe completo a partir de ellos,
+  de modo que añadir un año solo cuesta procesar ese año.
+
+------------------------------------------------------
+CLASES Y FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) SketchCuantiles(k=200)
+   - Sketch de cuantiles combinable (compactores tipo KLL): memoria O(k·log(n/k)).
+   - Exacto mientras no se supera la capacidad k; después, error de rango ~O(log(n/k)/k).
+
+2) PerfilDatos(k=200, max_distintos=None, max_categorias=None, semilla=0)
+   - PerfilDatos.desde_dataframe(df): perfil de una partición.
+   - perfil.actualizar(df): añade una partición al perfil.
+   - perfil.merge(otro) o perfil + otro: combina dos perfiles sin modificarlos.
+   - perfil.categorical_summary(top_n=3), perfil.describe(), perfil.missing():
+     tablas con el mismo formato que analisis_exploratorio.
+   - perfil.perfil_columnas(top_n=3, max_valores=11): dict con el formato de perfil_columnas,
+     más 'aproximado' por columna (lo usa eda_por_bloques).
+   - perfil.resultados(): dict con las claves de analisis_exploratorio (salvo 'structure').
+   - perfil.guardar(ruta) / PerfilDatos.cargar(ruta): persistencia en JSON.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- Conteos, faltantes, frecuencias, media y desviación son exactos tras combinar; los cuantiles
+  (25%, 50%, 75%) son aproximados cuando una columna supera k valores.
+- Las tablas de frecuencias son exactas salvo con max_categorias: evitar perfilar columnas de
+  identificadores (ej. 'id') o excluirlas con el argumento columnas.
+- Con max_distintos las numéricas con pocos valores distintos dan cuantiles exactos; con
+  max_categorias las categóricas de alta cardinalidad se podan y n_unique se estima (KMV).
+- Si una columna es numérica en una partición y de texto en otra, el perfil combinado la trata
+  como categórica (los números pasan a texto); una partición toda nula no fija el tipo.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+from src.perfiles import PerfilDatos
+perfiles = {anio: PerfilDatos.desde_dataframe(df_anio) for anio, df_anio in df_customer_details.groupby('year')}
+for anio, p in perfiles.items():
+    p.guardar(f'../reports/outputs/perfil_clientes_{anio}.json')
+total = sum(perfiles.values(), PerfilDatos())
+total.describe()
+"""
+
+__all__ = [
+    "SketchCuantiles",
+    "PerfilDatos",
+]
+
+
+class SketchCuantiles:
+    """
+    Sketch de cuantiles combinable basado en compactores (estilo KLL).
+    El nivel h guarda elementos con peso 2**h; cuando un nivel supera k elementos se ordena
+    y se promueve uno de cada dos al nivel siguiente.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.seed = seed
+        self.n = 0
+        self.niveles: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def actualizar(self, valores: np.ndarray) -> "SketchCuantiles":
+        """Añade valores (se ignoran los NaN)."""
+        valores = np.asarray(valores, dtype="float64")
+        valores = valores[~np.isnan(valores)]
+        self.n += len(valores)
+        self.niveles[0] = np.concatenate([self.niveles[0], valores])
+        self._compactar()
+        return self
+
+    def merge(self, otro: "SketchCuantiles") -> "SketchCuantiles":
+        """Nuevo sketch con los elementos de ambos."""
+        nuevo = SketchCuantiles(self.k, self.seed)
+        nuevo.n = self.n + otro.n
+        altura = max(len(self.niveles), len(otro.niveles))
+        nuevo.niveles = [
+            np.concatenate([s.niveles[h] for s in (self, otro) if h < len(s.niveles)])
+            for h in range(altura)
+        ]
+        nuevo._compactar()
+        return nuevo
+
+    def _compactar(self) -> None:
+        h = 0
+        while h < len(self.niveles):
+            nivel = self.niveles[h]
+            if len(nivel) > self.k:
+                nivel = np.sort(nivel)
+                # Con número impar de elementos uno se queda en el nivel actual
+                resto, nivel = nivel[:len(nivel) % 2], nivel[len(nivel) % 2:]
+                promovidos = nivel[self._rng.integers(0, 2)::2]
+                self.niveles[h] = resto
+                if h + 1 == len(self.niveles):
+                    self.niveles.append(np.empty(0))
+                self.niveles[h + 1] = np.concatenate([self.niveles[h + 1], promovidos])
+            h += 1
+
+    def cuantiles(self, qs: List[float]) -> np.ndarray:
+        """Cuantiles aproximados (exactos, con interpolación lineal, si no hubo compactación)."""
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        if len(self.niveles) == 1:
+            return np.quantile(self.niveles[0], qs)
+        valores = np.concatenate(self.niveles)
+        pesos = np.concatenate([np.full(len(nv), 2.0 ** h) for h, nv in enumerate(self.niveles)])
+        orden = np.argsort(valores, kind="stable")
+        valores, acumulado = valores[orden], np.cumsum(pesos[orden])
+        objetivo = np.asarray(qs) * (acumulado[-1] - 1) + 1
+        return valores[np.minimum(np.searchsorted(acumulado, objetivo), len(valores) - 1)]
+
+    def to_dict(self) -> Dict:
+        return {"k": self.k, "seed": self.seed, "n": self.n,
+                "niveles": [nv.tolist() for nv in self.niveles]}
+
+    @classmethod
+    def from_dict(cls, datos: Dict) -> "SketchCuantiles":
+        sketch = cls(datos["k"], datos.get("seed", 0))
+        sketch.n = datos["n"]
+        sketch.niveles = [np.asarray(nv, dtype="float64") for nv in datos["niveles"]]
+        return sketch
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Interpolación lineal con la misma fórmula que np.quantile (method='linear')."""
+    diferencia = b - a
+    return np.where(t >= 0.5, b - diferencia * (1 - t), a + diferencia * t)
+
+
+def _cuantiles_desde_conteos(valores: np.ndarray, conteos: np.ndarray, qs) -> np.ndarray:
+    """Cuantiles exactos (np.quantile lineal) a partir de valores ordenados y sus frecuencias."""
+    acumulado = np.cumsum(conteos)
+    n = acumulado[-1]
+    posicion = (n - 1) * np.asarray(qs, dtype="float64")
+    bajo = np.floor(posicion).astype("int64")
+    alto = np.minimum(bajo + 1, n - 1)
+    a = valores[np.searchsorted(acumulado, bajo, side='right')]
+    b = valores[np.searchsorted(acumulado, alto, side='right')]
+    return _lerp(a, b, posicion - bajo)
+
+
+def _hashes_minimos(valores: pd.Index, k: int) -> np.ndarray:
+    """Los k hashes de 64 bits más pequeños de los valores (ordenados, para el estimador KMV)."""
+    hashes = pd.util.hash_pandas_object(pd.Series(valores), index=False, categorize=False)
+    return np.unique(hashes.to_numpy())[:k]
+
+
+def _columna_vacia(tipo: str, k: int, semilla: int = 0) -> Dict:
+    col = {"tipo": tipo, "count": 0, "missing": 0}
+    if tipo == "categorica":
+        col.update({"frecuencias": pd.Series(dtype="int64"), "podado": False})
+    elif tipo == "numerica":
+        col.update({"mean": 0.0, "m2": 0.0, "min": np.nan, "max": np.nan,
+                    "sketch": SketchCuantiles(k, semilla),
+                    "frecuencias": pd.Series(dtype="int64", index=pd.Index([], dtype="float64"))})
+    return col
+
+
+def _a_categorica(col: Dict, max_categorias: Optional[int]) -> Dict:
+    """
+    Columna numérica como categórica (la columna trae texto en otra partición).
+    Con frecuencias por valor siguen siendo exactas; si no, salen de los pesos del sketch
+    y quedan marcadas como podadas (aproximadas).
+    """
+    frecuencias = col.get("frecuencias")
+    podado = frecuencias is None
+    if podado:
+        niveles = col["sketch"].niveles
+        pesos = np.concatenate([np.full(len(nv), 2 ** h) for h, nv in enumerate(niveles)])
+        frecuencias = pd.Series(pesos).groupby(np.concatenate(niveles)).sum()
+    # read_csv de la columna entera (con texto) deja los números como texto: '1', no '1.0'
+    indice = frecuencias.index
+    if len(indice) and (indice == np.floor(indice)).all():
+        indice = indice.astype("int64")
+    frecuencias = pd.Series(frecuencias.to_numpy(dtype="int64"), index=indice.astype(str))
+    nueva = {"tipo": "categorica", "count": col["count"], "missing": col["missing"],
+             "frecuencias": frecuencias, "podado": podado}
+    if max_categorias is not None:
+        nueva["hashes"] = _hashes_minimos(frecuencias.index, max_categorias)
+    return nueva
+
+
+def _convertir(col: Dict, tipo: str, k: int, semilla: int, max_categorias: Optional[int]) -> Dict:
+    """Columna de una partición expresada con el tipo común de la combinación."""
+    if col["tipo"] == tipo:
+        return col
+    if col["count"] == 0 or tipo == "otra":
+        return dict(_columna_vacia(tipo, k, semilla), count=col["count"], missing=col["missing"])
+    return _a_categorica(col, max_categorias)
+
+
+def _combinar_columnas(a: Dict, b: Dict, k: int = 200, max_distintos: Optional[int] = None,
+                       max_categorias: Optional[int] = None, semilla: int = 0) -> Dict:
+    """
+    Combina las estadísticas de una columna de dos particiones.
+    Si los tipos difieren, manda la partición con valores (una partición toda nula no fija el
+    tipo); numérica + categórica da categórica y cualquier combinación con 'otra' da 'otra'.
+    """
+    if a["tipo"] != b["tipo"]:
+        if a["count"] == 0 or b["count"] == 0:
+            tipo = b["tipo"] if a["count"] == 0 else a["tipo"]
+        else:
+            tipo = "otra" if "otra" in (a["tipo"], b["tipo"]) else "categorica"
+        a = _convertir(a, tipo, k, semilla, max_categorias)
+        b = _convertir(b, tipo, k, semilla, max_categorias)
+    col = {"tipo": a["tipo"], "count": a["count"] + b["count"], "missing": a["missing"] + b["missing"]}
+    if a["tipo"] == "categorica":
+        frecuencias = a["frecuencias"].add(b["frecuencias"], fill_value=0).astype("int64")
+        col["podado"] = a.get("podado", False) or b.get("podado", False)
+        if max_categorias is not None:
+            hashes = [p["hashes"] if "hashes" in p
+                      else _hashes_minimos(p["frecuencias"].index[p["frecuencias"] > 0], max_categorias)
+                      for p in (a, b)]
+            col["hashes"] = np.union1d(*hashes)[:max_categorias]
+            if len(frecuencias) > 2 * max_categorias:
+                frecuencias = frecuencias.nlargest(max_categorias)
+                col["podado"] = True
+        col["frecuencias"] = frecuencias
+    elif a["tipo"] == "numerica":
+        # Media y M2 combinadas (algoritmo paralelo de Chan et al.)
+        n = col["count"]
+        delta = b["mean"] - a["mean"]
+        col["mean"] = a["mean"] + delta * b["count"] / n if n else 0.0
+        col["m2"] = a["m2"] + b["m2"] + (delta ** 2 * a["count"] * b["count"] / n if n else 0.0)
+        col["min"] = np.fmin(a["min"], b["min"])
+        col["max"] = np.fmax(a["max"], b["max"])
+        col["sketch"] = a["sketch"].merge(b["sketch"])
+        frecuencias = None
+        if max_distintos is not None and a.get("frecuencias") is not None and b.get("frecuencias") is not None:
+            frecuencias = a["frecuencias"].add(b["frecuencias"], fill_value=0).astype("int64")
+            if len(frecuencias) > max_distintos:
+                frecuencias = None
+        col["frecuencias"] = frecuencias
+    return col
+
+
+class PerfilDatos:
+    """
+    Perfil combinable de un DataFrame: por columna guarda conteos, faltantes y, según el tipo,
+    tabla de frecuencias (categóricas) o momentos + sketch de cuantiles (numéricas).
+    Con max_distintos las numéricas guardan además sus frecuencias por valor (cuantiles
+    exactos) mientras no superen ese número de valores distintos; con max_categorias las
+    tablas de frecuencias se podan y n_unique se estima con los k hashes mínimos (KMV).
+    """
+
+    def __init__(self, k: int = 200, max_distintos: Optional[int] = None,
+                 max_categorias: Optional[int] = None, semilla: int = 0):
+        self.k = k
+        self.max_distintos = max_distintos
+        self.max_categorias = max_categorias
+        self.semilla = semilla
+        self.n_filas = 0
+        self.columnas: Dict[str, Dict] = {}
+
+    @classmethod
+    def desde_dataframe(cls, df: pd.DataFrame, columnas: Optional[List[str]] = None,
+                        k: int = 200, max_distintos: Optional[int] = None,
+                        max_categorias: Optional[int] = None, semilla: int = 0) -> "PerfilDatos":
+        """Perfil de una partición.
+        args:
+            df (pd.DataFrame): partición a perfilar.
+            columnas (List[str]): columnas a incluir; None = todas.
+            k (int): capacidad del sketch de cuantiles.
+            max_distintos (int): valores distintos hasta los que una numérica guarda sus
+                frecuencias (cuantiles exactos); None = no se guardan.
+            max_categorias (int): frecuencias que se conservan por categórica (se poda a las
+                más frecuentes al superar el doble); None = todas.
+            semilla (int): semilla del sketch de cuantiles.
+        returns:
+            PerfilDatos: perfil de la partición."""
+        perfil = cls(k, max_distintos, max_categorias, semilla)
+        perfil.n_filas = len(df)
+        for c in (df.columns if columnas is None else columnas):
+            serie = df[c]
+            if es_categorica(serie.dtype):
+                frecuencias = serie.value_counts(dropna=True)
+                if isinstance(frecuencias.index, pd.CategoricalIndex):
+                    # Se conservan las categorías sin uso (cuenta 0), como value_counts en memoria
+                    frecuencias.index = frecuencias.index.astype(frecuencias.index.categories.dtype)
+                missing = len(serie) - int(frecuencias.sum())
+                col = {"tipo": "categorica", "count": len(serie) - missing, "missing": missing,
+                       "frecuencias": frecuencias.astype("int64"), "podado": False}
+                if max_categorias is not None:
+                    col["hashes"] = _hashes_minimos(frecuencias.index[frecuencias.to_numpy() > 0],
+                                                    max_categorias)
+                    if len(frecuencias) > 2 * max_categorias:
+                        col["frecuencias"] = col["frecuencias"].nlargest(max_categorias)
+                        col["podado"] = True
+                perfil.columnas[c] = col
+            elif es_numerica(serie.dtype):
+                valores = serie.to_numpy(dtype="float64", na_value=np.nan)
+                validos = valores[~np.isnan(valores)]
+                n = len(validos)
+                media = validos.mean() if n else 0.0
+                frecuencias = None
+                if max_distintos is not None:
+                    frecuencias = pd.Series(validos).value_counts()
+                    if len(frecuencias) > max_distintos:
+                        frecuencias = None
+                perfil.columnas[c] = {
+                    "tipo": "numerica", "count": n, "missing": len(valores) - n,
+                    "mean": media, "m2": float(((validos - media) ** 2).sum()),
+                    "min": validos.min() if n else np.nan, "max": validos.max() if n else np.nan,
+                    "sketch": SketchCuantiles(k, semilla).actualizar(validos),
+                    "frecuencias": frecuencias,
+                }
+            else:
+                missing = int(serie.isna().sum())
+                perfil.columnas[c] = {"tipo": "otra", "count": len(serie) - missing, "missing": missing}
+        return perfil
+
+    def merge(self, otro: "PerfilDatos") -> "PerfilDatos":
+        """Nuevo perfil con las particiones de ambos (no modifica ninguno de los dos)."""
+        nuevo = PerfilDatos(self.k, self.max_distintos, self.max_categorias, self.semilla)
+        nuevo.n_filas = self.n_filas + otro.n_filas
+        for c in list(self.columnas) + [c for c in otro.columnas if c not in self.columnas]:
+            # Una columna ausente en una partición cuenta como faltante en sus filas
+            a = self.columnas.get(c) or dict(_columna_vacia(otro.columnas[c]["tipo"], self.k, self.semilla),
+                                             missing=self.n_filas)
+            b = otro.columnas.get(c) or dict(_columna_vacia(a["tipo"], self.k, self.semilla),
+                                             missing=otro.n_filas)
+            nuevo.columnas[c] = _combinar_columnas(a, b, self.k, self.max_distintos,
+                                                   self.max_categorias, self.semilla)
+        return nuevo
+
+    def __add__(self, otro: "PerfilDatos") -> "PerfilDatos":
+        return self.merge(otro)
+
+    def __radd__(self, otro) -> "PerfilDatos":
+        # Permite sum(perfiles) empezando en 0
+        return self if otro == 0 else self.merge(otro)
+
+    def actualizar(self, df: pd.DataFrame) -> "PerfilDatos":
+        """Añade una partición a este perfil (coste proporcional al tamaño de df)."""
+        combinado = self.merge(PerfilDatos.desde_dataframe(df, k=self.k, max_distintos=self.max_distintos,
+                                                           max_categorias=self.max_categorias,
+                                                           semilla=self.semilla))
+        self.n_filas, self.columnas = combinado.n_filas, combinado.columnas
+        return self
+
+    def _tipo(self, tipo: str) -> List[str]:
+        return [c for c, col in self.columnas.items() if col["tipo"] == tipo]
+
+    def _n_unique(self, col: Dict) -> int:
+        """Valores distintos de una categórica (estimados con KMV si sus frecuencias se podaron)."""
+        hashes = col.get("hashes")
+        if not col.get("podado") or hashes is None:
+            n_unique = int((col["frecuencias"] > 0).sum())
+        elif len(hashes) < self.max_categorias:
+            n_unique = len(hashes)
+        else:
+            # Estimador KMV: k-ésimo hash mínimo como fracción del espacio de 64 bits
+            n_unique = int((len(hashes) - 1) / (float(hashes[-1]) / 2.0 ** 64))
+        # Como value_counts(dropna=False) en memoria, NaN cuenta como un valor más
+        return n_unique + int(col["missing"] > 0)
+
+    def aproximado(self, c: str) -> bool:
+        """True si los cuantiles o n_unique de la columna c son estimaciones."""
+        col = self.columnas[c]
+        if col["tipo"] == "categorica":
+            return bool(col.get("podado", False))
+        if col["tipo"] == "numerica":
+            return col.get("frecuencias") is None and len(col["sketch"].niveles) > 1
+        return False
+
+    def perfil_columnas(self, top_n: int = 3, max_valores: int = 11) -> Dict[str, Dict]:
+        """
+        Estadísticas por columna con el formato de analisis_exploratorio.perfil_columnas,
+        más 'aproximado' (ver aproximado()).
+        args:
+            top_n (int): número de valores top en categóricas.
+            max_valores (int): cardinalidad máxima para incluir la tabla de frecuencias completa.
+        returns:
+            Dict[str, Dict]: {columna: estadísticas}.
+        """
+        perfil = {}
+        qs = [0.0] + CUANTILES_DESCRIBE + [1.0]
+        for c, col in self.columnas.items():
+            estadisticas = {"tipo": col["tipo"], "count": col["count"], "missing": col["missing"]}
+            if col["tipo"] == "categorica":
+                vc = col["frecuencias"].sort_values(ascending=False, kind="stable")
+                if col["missing"]:
+                    # Índice object: NaN junto a los valores sin convertir enteros a float
+                    vc = pd.Series(np.append(vc.to_numpy(), col["missing"]),
+                                   index=pd.Index(vc.index.tolist() + [np.nan], dtype=object))
+                    vc = vc.sort_values(ascending=False, kind="stable")
+                n_unique = self._n_unique(col)
+                estadisticas.update({
+                    "n_unique": n_unique,
+                    "top_values": vc.index[:top_n].tolist(),
+                    "top_counts": vc.values[:top_n].tolist(),
+                    "value_counts": vc if n_unique <= max_valores else None,
+                })
+            elif col["tipo"] == "numerica":
+                n = col["count"]
+                frecuencias = col.get("frecuencias")
+                if n and frecuencias is not None:
+                    frecuencias = frecuencias[frecuencias > 0].sort_index()
+                    cuantiles = _cuantiles_desde_conteos(frecuencias.index.to_numpy(dtype="float64"),
+                                                         frecuencias.to_numpy(dtype="int64"), qs)
+                else:
+                    cuantiles = col["sketch"].cuantiles(qs)
+                    # Mínimo y máximo siempre exactos
+                    cuantiles[0], cuantiles[-1] = col["min"], col["max"]
+                estadisticas.update({
+                    "mean": col["mean"] if n else np.nan,
+                    "std": np.sqrt(col["m2"] / (n - 1)) if n > 1 else np.nan,
+                    "min": cuantiles[0],
+                })
+                for q, valor in zip(CUANTILES_DESCRIBE, cuantiles[1:-1]):
+                    estadisticas[f"{q:.0%}"] = valor
+                estadisticas["max"] = cuantiles[-1]
+            estadisticas["aproximado"] = self.aproximado(c)
+            perfil[c] = estadisticas
+        return perfil
+
+    def categorical_summary(self, top_n: int = 3) -> pd.DataFrame:
+        """Mismo formato que categorical_summary (los faltantes cuentan como un valor más)."""
+        return tabla_categoricas(self.perfil_columnas(top_n))
+
+    def describe(self) -> pd.DataFrame:
+        """Equivalente a describe().T de las columnas numéricas (cuantiles aproximados)."""
+        campos = ["count", "mean", "std", "min"] + [f"{q:.0%}" for q in CUANTILES_DESCRIBE] + ["max"]
+        perfil = self.perfil_columnas()
+        filas = {c: [perfil[c][campo] for campo in campos] for c in self._tipo("numerica")}
+        return pd.DataFrame.from_dict(filas, orient="index", columns=campos, dtype="float64")
+
+    def missing(self) -> pd.DataFrame:
+        """Tabla de faltantes con el formato de resultados['missing']."""
+        missing = pd.Series({c: col["missing"] for c, col in self.columnas.items()}, dtype="int64")
+        missing_pct = (missing / self.n_filas * 100).round(2)
+        return pd.DataFrame({'missing_count': missing, 'missing_pct': missing_pct})
+
+    def resultados(self, top_n: int = 3) -> Dict:
+        """Dict con las claves de analisis_exploratorio (sin 'structure')."""
+        resultados = {'categorical_columns': self._tipo("categorica")}
+        if resultados['categorical_columns']:
+            resultados['categorical_summary'] = self.categorical_summary(top_n)
+        resultados['numeric_columns'] = self._tipo("numerica")
+        resultados['missing'] = self.missing()
+        return resultados
+
+    def to_dict(self) -> Dict:
+        """Representación serializable en JSON."""
+        columnas = {}
+        for c, col in self.columnas.items():
+            entrada = {k: valor_json(v) for k, v in col.items()
+                       if k not in ("frecuencias", "sketch", "hashes")}
+            if "frecuencias" in col:
+                entrada["frecuencias"] = (None if col["frecuencias"] is None else
+                                          [[valor_json(v), int(n)] for v, n in col["frecuencias"].items()])
+            if "sketch" in col:
+                entrada["sketch"] = col["sketch"].to_dict()
+            if "hashes" in col:
+                entrada["hashes"] = [int(h) for h in col["hashes"]]
+            columnas[str(c)] = entrada
+        return {"k": self.k, "max_distintos": self.max_distintos, "max_categorias": self.max_categorias,
+                "semilla": self.semilla, "n_filas": self.n_filas, "columnas": columnas}
+
+    @classmethod
+    def from_dict(cls, datos: Dict) -> "PerfilDatos":
+        perfil = cls(datos["k"], datos.get("max_distintos"), datos.get("max_categorias"),
+                     datos.get("semilla", 0))
+        perfil.n_filas = datos["n_filas"]
+        for c, entrada in datos["columnas"].items():
+            col = {k: (np.nan if v is None else v) for k, v in entrada.items()
+                   if k not in ("frecuencias", "sketch", "hashes")}
+            if "frecuencias" in entrada:
+                pares = entrada["frecuencias"]
+                col["frecuencias"] = (None if pares is None else
+                                      pd.Series([n for _, n in pares], index=[v for v, _ in pares],
+                                                dtype="int64"))
+            if "sketch" in entrada:
+                col["sketch"] = SketchCuantiles.from_dict(entrada["sketch"])
+            if "hashes" in entrada:
+                col["hashes"] = np.asarray(entrada["hashes"], dtype="uint64")
+            perfil.columnas[c] = col
+        return perfil
+
+    def guardar(self, ruta: str) -> str:
+        """Guarda el perfil en JSON y devuelve la ruta."""
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return ruta
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "PerfilDatos":
+        """Carga un perfil guardado con guardar()."""
+        with open(ruta, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,335 @@
+# src/pipeline.py
+import hashlib
+import inspect
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+
+import pandas as pd
+from typing import Callable, Dict, List, Optional, Sequence
+
+import src.cleaning_campaing as cc
+import src.data_cleaning as dc
+import src.join_clientes as jc
+from src import __version__, ingestion, storage, variables_derivadas
+"""
+Módulo: pipeline.py
+======================================================
+
+Pipeline perezoso (lazy) para preparar df_perfil_cliente sin materializar cada paso.
+
+Este módulo está diseñado para:
+- Describir la preparación del notebook como un grafo de nodos:
+  carga → limpieza → normalización de nombres → unión por 'id' → variables derivadas
+  ('segmento_edad', 'antiguedad_dias', 'antiguedad_años', con src.variables_derivadas).
+- Calcular, a partir de las columnas pedidas al final, qué columnas necesita cada nodo y
+  leer/procesar solo esas (projection pushdown): pedir ['y', 'income', 'age'] lee del CSV de
+  campaña solo el índice, 'age', 'y' e 'id' en lugar de las 23 columnas.
+- Guardar en caché (memoria y Parquet en disco) la salida de cada nodo con una clave que
+  combina el hash de los ficheros de entrada, el nodo, las columnas pedidas y la versión y el
+  código fuente de sus transformaciones.
+
+------------------------------------------------------
+CLASES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) Nodo(nombre, funcion, entradas=(), esquema=None, requeridas=None, firma=None)
+   - Nodo genérico del grafo. funcion(*dfs_entrada, columnas=...) -> DataFrame.
+   - nodo.esquema(): columnas de salida sin calcular datos.
+   - nodo.plan(columnas): {nodo: columnas que se leerán/calcularán} para todo el subgrafo.
+   - nodo.recoger(columnas=None, cache=None): ejecuta el subgrafo y devuelve el DataFrame.
+
+2) CacheNodos(cache_dir=None, max_memoria=16)
+   - Caché de salidas de nodos: LRU en memoria y, si se indica cache_dir, Parquet en disco.
+
+3) PipelinePerfil(ruta_campaign='../data/raw/bank-additional.csv',
+                  ruta_clientes='../data/raw/customer-details.xlsx',
+                  hojas=('2012', '2013', '2014'), cache_dir='../data/cache/', cache_disco=True)
+   - pipeline.nodos: 'campaign', 'campaign_clean', 'campaign_norm', 'clientes',
+     'clientes_norm', 'perfil', 'perfil_derivado'.
+   - pipeline.plan(columnas, nodo='perfil_derivado') y pipeline.recoger(columnas, nodo=...).
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- La proyección no cambia el resultado: las columnas pedidas tienen los mismos valores que
+  en el pipeline completo (la limpieza de cada columna solo depende de ella misma).
+- El DataFrame devuelto es una copia: se puede modificar sin afectar a la caché.
+- Con cache_disco=True las salidas se guardan en cache_dir como 'nodo_<nombre>_<clave>.parquet';
+  la carpeta se puede borrar sin riesgo. Cambiar el código de limpieza, normalización, unión
+  o variables derivadas cambia la clave, así que no se sirven salidas calculadas con el
+  código anterior (los ficheros viejos quedan huérfanos y se pueden borrar).
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+from src.pipeline import PipelinePerfil
+pipeline = PipelinePerfil()
+pipeline.plan(['y', 'income', 'age'])
+df = pipeline.recoger(['y', 'income', 'age', 'segmento_edad'])
+"""
+
+__all__ = [
+    "Nodo",
+    "CacheNodos",
+    "PipelinePerfil",
+]
+
+# Variables derivadas del análisis demográfico del notebook -> columnas fuente
+COLUMNAS_DERIVADAS = {
+    c: variables_derivadas.columnas_fuente(variables_derivadas.ESPEC_PERFIL[c])
+    for c in ('segmento_edad', 'antiguedad_dias', 'antiguedad_años')
+}
+
+
+class Nodo:
+    """
+    Nodo del grafo perezoso.
+    funcion(*dfs_entrada, columnas=...) calcula la salida; esquema(*esquemas_entrada) da sus
+    columnas; requeridas(columnas, *esquemas_entrada) da las columnas que necesita de cada
+    entrada; firma() identifica el contenido de los datos de origen (nodos fuente) o la
+    definición del cálculo (ej. la especificación de variables derivadas).
+    """
+
+    def __init__(self, nombre: str, funcion: Callable, entradas: Sequence["Nodo"] = (),
+                 esquema: Optional[Callable] = None, requeridas: Optional[Callable] = None,
+                 firma: Optional[Callable[[], str]] = None):
+        self.nombre = nombre
+        self.funcion = funcion
+        self.entradas = list(entradas)
+        self._esquema = esquema
+        self._requeridas = requeridas
+        self._firma = firma
+        self._esquema_cache: Optional[List[str]] = None
+
+    def esquema(self) -> List[str]:
+        """Columnas de salida del nodo (sin calcular datos)."""
+        if self._esquema_cache is None:
+            self._esquema_cache = list(self._esquema(*[e.esquema() for e in self.entradas]))
+        return self._esquema_cache
+
+    def requeridas(self, columnas: Optional[List[str]]) -> List[Optional[List[str]]]:
+        """Columnas necesarias de cada entrada para producir columnas (None = todas)."""
+        if columnas is None or not self.entradas:
+            return [None] * len(self.entradas)
+        return self._requeridas(columnas, *[e.esquema() for e in self.entradas])
+
+    def clave(self, columnas: Optional[List[str]]) -> str:
+        """Hash del nodo, las columnas pedidas y (recursivamente) sus entradas."""
+        partes = [self.nombre, None if columnas is None else sorted(columnas)]
+        if self._firma is not None:
+            partes.append(self._firma())
+        for entrada, cols in zip(self.entradas, self.requeridas(columnas)):
+            partes.append(entrada.clave(cols))
+        return hashlib.sha256(json.dumps(partes).encode()).hexdigest()
+
+    def plan(self, columnas: Optional[List[str]] = None) -> Dict[str, Optional[List[str]]]:
+        """Columnas que calculará cada nodo del subgrafo para producir columnas."""
+        plan = {self.nombre: None if columnas is None else list(columnas)}
+        for entrada, cols in zip(self.entradas, self.requeridas(columnas)):
+            plan.update(entrada.plan(cols))
+        return plan
+
+    def _calcular(self, columnas: Optional[List[str]], cache: Optional["CacheNodos"]) -> pd.DataFrame:
+        clave = self.clave(columnas) if cache is not None else None
+        if cache is not None:
+            df = cache.obtener(self.nombre, clave)
+            if df is not None:
+                return df
+        dfs = [e._calcular(cols, cache) for e, cols in zip(self.entradas, self.requeridas(columnas))]
+        df = self.funcion(*dfs, columnas=columnas)
+        if columnas is not None:
+            df = df[[c for c in columnas if c in df.columns]]
+        if cache is not None:
+            # Las fuentes ya están en disco (CSV, caché de ingestion): solo se guardan en memoria
+            cache.guardar(self.nombre, clave, df, disco=bool(self.entradas))
+        return df
+
+    def recoger(self, columnas: Optional[List[str]] = None,
+                cache: Optional["CacheNodos"] = None) -> pd.DataFrame:
+        """Ejecuta el subgrafo y devuelve la salida (solo columnas, si se indican)."""
+        if columnas is not None:
+            desconocidas = [c for c in columnas if c not in self.esquema()]
+            if desconocidas:
+                raise ValueError(f"Columnas no disponibles en '{self.nombre}': {desconocidas}")
+        df = self._calcular(columnas, cache)
+        return df.copy() if cache is not None else df
+
+
+class CacheNodos:
+    """Salidas de nodos por clave: LRU en memoria y Parquet en disco (opcional)."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memoria: int = 16):
+        self.cache_dir = cache_dir
+        self.max_memoria = max_memoria
+        self.memoria: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _nombre(nombre: str, clave: str) -> str:
+        return f"nodo_{nombre}_{clave[:16]}"
+
+    def obtener(self, nombre: str, clave: str) -> Optional[pd.DataFrame]:
+        if clave in self.memoria:
+            self.memoria.move_to_end(clave)
+            return self.memoria[clave]
+        if self.cache_dir is not None:
+            fichero = self._nombre(nombre, clave)
+            if os.path.exists(os.path.join(self.cache_dir, f"{fichero}.parquet")):
+                df = storage.load_dataset(fichero, ruta=self.cache_dir)
+                self._en_memoria(clave, df)
+                return df
+        return None
+
+    def guardar(self, nombre: str, clave: str, df: pd.DataFrame, disco: bool = True) -> None:
+        self._en_memoria(clave, df)
+        if disco and self.cache_dir is not None:
+            storage.save_dataset(df, self._nombre(nombre, clave), ruta=self.cache_dir)
+
+    def _en_memoria(self, clave: str, df: pd.DataFrame) -> None:
+        self.memoria[clave] = df
+        self.memoria.move_to_end(clave)
+        while len(self.memoria) > self.max_memoria:
+            self.memoria.popitem(last=False)
+
+
+# --- Reglas de cada paso del pipeline del notebook ---------------------------------------
+
+@lru_cache(maxsize=None)
+def _firma_codigo(*modulos) -> str:
+    """Versión del paquete + hash del código fuente de los módulos de una transformación."""
+    h = hashlib.sha256(__version__.encode())
+    for modulo in modulos:
+        h.update(inspect.getsource(modulo).encode())
+    return h.hexdigest()
+
+
+def _en_orden(esquema: List[str], columnas) -> List[str]:
+    columnas = set(columnas)
+    return [c for c in esquema if c in columnas]
+
+
+def _leer_campaign(ruta_csv: str, columnas: Optional[List[str]]) -> pd.DataFrame:
+    """bank-additional.csv (index_col=0) leyendo solo columnas."""
+    if columnas is None:
+        return cc.leer_campaign_csv(ruta_csv)
+    indice = pd.read_csv(ruta_csv, nrows=0).columns[0]
+    pedidas = set(columnas)
+    return cc.leer_campaign_csv(ruta_csv, usecols=lambda c: c == indice or c in pedidas)
+
+
+def _esquema_clean(raw: List[str]) -> List[str]:
+    """Columnas de clean_campaign_df: sin las geográficas y con las creadas al limpiar."""
+    salida = [c for c in raw if c not in cc.COLUMNAS_GEO]
+    if 'date' in raw:
+        salida += ['contact_month', 'contact_year']
+    if 'pdays' in raw:
+        salida += ['previous_contact']
+    return salida
+
+
+def _requeridas_clean(columnas, raw):
+    dependencias = {'contact_month': ['date'], 'contact_year': ['date'], 'previous_contact': ['pdays']}
+    necesarias = [d for c in columnas for d in dependencias.get(c, [c])]
+    return [_en_orden(raw, necesarias)]
+
+
+def _esquema_normalizado(esquema: List[str]) -> List[str]:
+    return dc.nombres_normalizados(esquema)
+
+
+def _requeridas_normalizado(columnas, esquema):
+    nuevos = dc.nombres_normalizados(esquema)
+    pedidas = set(columnas)
+    return [[original for original, nuevo in zip(esquema, nuevos) if nuevo in pedidas]]
+
+
+def _comunes_union(izquierda: List[str], derecha: List[str], columna: str = 'id') -> set:
+    return (set(izquierda) & set(derecha)) - {columna}
+
+
+def _esquema_union(izquierda: List[str], derecha: List[str], columna: str = 'id') -> List[str]:
+    """Columnas de unir_perfil_cliente (id como índice, sufijos _x/_y en comunes)."""
+    comunes = _comunes_union(izquierda, derecha, columna)
+    return ([f"{c}_x" if c in comunes else c for c in izquierda if c != columna]
+            + [f"{c}_y" if c in comunes else c for c in derecha if c != columna])
+
+
+def _requeridas_union(columnas, izquierda, derecha, columna: str = 'id'):
+    comunes = _comunes_union(izquierda, derecha, columna)
+    pedidas = set(columnas)
+    lado_izq = [c for c in izquierda if c != columna and (f"{c}_x" if c in comunes else c) in pedidas]
+    lado_der = [c for c in derecha if c != columna and (f"{c}_y" if c in comunes else c) in pedidas]
+    return [[columna] + lado_izq, [columna] + lado_der]
+
+
+def _esquema_derivado(perfil: List[str]) -> List[str]:
+    return perfil + [c for c in COLUMNAS_DERIVADAS if c not in perfil]
+
+
+def _requeridas_derivado(columnas, perfil):
+    necesarias = [d for c in columnas for d in COLUMNAS_DERIVADAS.get(c, [c])]
+    return [_en_orden(perfil, necesarias)]
+
+
+def _derivar(df: pd.DataFrame, columnas: Optional[List[str]]) -> pd.DataFrame:
+    """Variables derivadas del notebook (solo las pedidas; todas si columnas es None)."""
+    pedidas = COLUMNAS_DERIVADAS if columnas is None else [c for c in columnas if c in COLUMNAS_DERIVADAS]
+    posibles = [c for c in pedidas if set(COLUMNAS_DERIVADAS[c]) <= set(df.columns)]
+    return variables_derivadas.construir_variables(df, columnas=posibles)
+
+
+class PipelinePerfil:
+    """Grafo perezoso campaña + clientes → df_perfil_cliente con variables derivadas."""
+
+    def __init__(self, ruta_campaign: str = '../data/raw/bank-additional.csv',
+                 ruta_clientes: str = '../data/raw/customer-details.xlsx',
+                 hojas: Sequence[str] = ingestion.HOJAS_CLIENTES,
+                 cache_dir: str = '../data/cache/', cache_disco: bool = True):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache = CacheNodos(cache_dir if cache_disco else None)
+        hojas = tuple(hojas)
+
+        campaign = Nodo(
+            'campaign', lambda columnas: _leer_campaign(ruta_campaign, columnas),
+            esquema=lambda: list(pd.read_csv(ruta_campaign, nrows=0).columns[1:]),
+            firma=lambda: ingestion.hash_con_indice(ruta_campaign, cache_dir))
+        campaign_clean = Nodo(
+            'campaign_clean', lambda df, columnas: cc.clean_campaign_df(df), [campaign],
+            esquema=_esquema_clean, requeridas=_requeridas_clean,
+            firma=lambda: _firma_codigo(cc, dc))
+        campaign_norm = Nodo(
+            'campaign_norm', lambda df, columnas: dc.clean_column_names(df, verbose=False), [campaign_clean],
+            esquema=_esquema_normalizado, requeridas=_requeridas_normalizado,
+            firma=lambda: _firma_codigo(dc))
+        clientes = Nodo(
+            'clientes',
+            lambda columnas: ingestion.load_customer_details(ruta_clientes, hojas, cache_dir, columnas=columnas),
+            esquema=lambda: ingestion.columnas_customer_details(ruta_clientes, hojas, cache_dir),
+            firma=lambda: ingestion.hash_con_indice(ruta_clientes, cache_dir) + '|'.join(hojas))
+        clientes_norm = Nodo(
+            'clientes_norm', lambda df, columnas: dc.clean_column_names(df, verbose=False), [clientes],
+            esquema=_esquema_normalizado, requeridas=_requeridas_normalizado,
+            firma=lambda: _firma_codigo(dc))
+        perfil = Nodo(
+            'perfil', lambda izq, der, columnas: jc.unir_perfil_cliente(izq, der)[0], [campaign_norm, clientes_norm],
+            esquema=_esquema_union, requeridas=_requeridas_union,
+            firma=lambda: _firma_codigo(jc))
+        perfil_derivado = Nodo(
+            'perfil_derivado', _derivar, [perfil],
+            esquema=_esquema_derivado, requeridas=_requeridas_derivado,
+            firma=lambda: (repr(sorted(variables_derivadas.ESPEC_PERFIL.items()))
+                           + _firma_codigo(variables_derivadas)))
+
+        self.nodos: Dict[str, Nodo] = {n.nombre: n for n in (campaign, campaign_clean, campaign_norm, clientes,
+                                                             clientes_norm, perfil, perfil_derivado)}
+
+    def plan(self, columnas: Optional[List[str]] = None, nodo: str = 'perfil_derivado') -> Dict:
+        """Columnas que leerá/calculará cada nodo para obtener columnas de nodo."""
+        return self.nodos[nodo].plan(columnas)
+
+    def recoger(self, columnas: Optional[List[str]] = None, nodo: str = 'perfil_derivado') -> pd.DataFrame:
+        """Ejecuta el grafo hasta nodo y devuelve columnas (None = todas)."""
+        return self.nodos[nodo].recoger(columnas, cache=self.cache)
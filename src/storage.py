@@ -0,0 +1,182 @@
+# src/storage.py
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+from typing import Dict, Iterator, List, Optional
+"""
+Módulo: storage.py
+======================================================
+
+Persistencia columnar (Parquet) de los datasets procesados del proyecto
+(df_campaign_clean, df_customer_details, df_perfil_cliente).
+
+Este módulo está diseñado para:
+- Sustituir el guardado en CSV de data/processed/ por un formato binario columnar.
+- Conservar exactamente los tipos: category (categorías y orden), enteros nulables (Int64),
+  datetime64 e índice del DataFrame.
+- Cargar solo las columnas necesarias (proyección) y solo los row groups que cumplen un filtro
+  (ej. contact_year == 2014) sin leer el fichero completo.
+
+------------------------------------------------------
+FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) save_dataset(df, nombre, ruta='../data/processed/', row_group_size=100_000)
+   - Guarda el DataFrame en '<ruta><nombre>.parquet' junto con sus dtypes de pandas.
+   - Retorna: ruta completa del fichero guardado.
+
+2) load_dataset(nombre, ruta='../data/processed/', columns=None, filters=None)
+   - Carga el dataset restaurando dtypes.
+   - Argumentos:
+       columns: lista de columnas a leer (None = todas).
+       filters: filtros de row group al estilo pyarrow, ej. [('contact_year', '==', 2014)].
+   - Retorna: pd.DataFrame.
+
+3) columnas_dataset(nombre, ruta='../data/processed/')
+   - Columnas del dataset (sin las del índice) leyendo solo el esquema del fichero.
+
+4) iter_dataset(nombre, ruta='../data/processed/', columns=None, batch_size=100_000)
+   - Recorre el dataset por bloques de filas con los mismos dtypes que load_dataset.
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- Los filtros se evalúan con las estadísticas de cada row group: ordenar el DataFrame por la
+  columna de filtro antes de guardar permite descartar más row groups.
+- Benchmark frente al CSV en `python -m benchmarks.bench_storage`.
+- pyarrow.parquet se importa en la primera lectura/escritura: importar el módulo no lo carga.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+import src.storage as st
+st.save_dataset(df_campaign_clean, 'df_campaign_clean')
+df_2014 = st.load_dataset('df_campaign_clean', columns=['y', 'age', 'contact_year'],
+                          filters=[('contact_year', '==', 2014)])
+"""
+
+__all__ = [
+    "save_dataset",
+    "load_dataset",
+    "columnas_dataset",
+    "iter_dataset",
+]
+
+# Clave de los metadatos del esquema Parquet donde se guardan los dtypes de pandas
+_METADATA_KEY = b"eda_marketing.dtypes"
+
+
+def _ruta_dataset(nombre: str, ruta: str) -> str:
+    return os.path.join(ruta, f"{nombre}.parquet")
+
+
+def _describir_categoricas(df: pd.DataFrame) -> Dict:
+    """Categorías, orden y dtype de categorías de cada columna category (incluido el índice)."""
+    columnas = {}
+    for nombre, serie in list(df.items()) + [(df.index.name, df.index)]:
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            cats = serie.dtype.categories
+            columnas[str(nombre)] = {
+                "categories": cats.astype(object).where(cats.notna(), None).tolist(),
+                "categories_dtype": str(cats.dtype),
+                "ordered": bool(serie.dtype.ordered),
+            }
+    return columnas
+
+
+def save_dataset(df: pd.DataFrame, nombre: str, ruta: str = '../data/processed/',
+                 row_group_size: int = 100_000) -> str:
+    """
+    Guarda un DataFrame procesado en Parquet conservando sus dtypes.
+    args:
+        df (pd.DataFrame): DataFrame a guardar (se conserva también el índice).
+        nombre (str): nombre base del fichero, sin extensión.
+        ruta (str): carpeta destino.
+        row_group_size (int): filas por row group (unidad mínima que se lee al filtrar).
+    returns:
+        str: ruta completa del fichero guardado.
+    """
+    import pyarrow.parquet as pq
+    filepath = _ruta_dataset(nombre, ruta)
+    tabla = pa.Table.from_pandas(df, preserve_index=True)
+    metadata = dict(tabla.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps(_describir_categoricas(df)).encode()
+    pq.write_table(tabla.replace_schema_metadata(metadata), filepath, row_group_size=row_group_size)
+    return filepath
+
+
+def _columnas_indice(esquema: pa.Schema) -> List[str]:
+    """Columnas del fichero que corresponden al índice de pandas."""
+    return [c for c in (esquema.pandas_metadata or {}).get("index_columns", []) if isinstance(c, str)]
+
+
+def columnas_dataset(nombre: str, ruta: str = '../data/processed/') -> List[str]:
+    """Columnas de un dataset guardado con save_dataset (sin el índice), sin leer los datos."""
+    import pyarrow.parquet as pq
+    esquema = pq.read_schema(_ruta_dataset(nombre, ruta))
+    indice = _columnas_indice(esquema)
+    return [c for c in esquema.names if c not in indice]
+
+
+def load_dataset(nombre: str, ruta: str = '../data/processed/',
+                 columns: Optional[List[str]] = None,
+                 filters: Optional[List] = None) -> pd.DataFrame:
+    """
+    Carga un dataset guardado con save_dataset restaurando exactamente sus dtypes.
+    args:
+        nombre (str): nombre base del fichero, sin extensión.
+        ruta (str): carpeta origen.
+        columns (List[str]): columnas a leer; None lee todas. El índice se carga siempre.
+        filters (List): filtros pyarrow, ej. [('contact_year', '==', 2014)]; se descartan
+            los row groups que no cumplen y después se filtran las filas.
+    returns:
+        pd.DataFrame: dataset con category, Int64 y datetime64 como al guardarlo.
+    """
+    import pyarrow.parquet as pq
+    filepath = _ruta_dataset(nombre, ruta)
+    esquema = pq.read_schema(filepath)
+    if columns is not None:
+        # Las columnas del índice se añaden para que la proyección no lo pierda
+        indice = _columnas_indice(esquema)
+        columns = list(columns) + [c for c in indice if c not in columns]
+    df = pq.read_table(filepath, columns=columns, filters=filters).to_pandas()
+    return _restaurar_categoricas(df, esquema)
+
+
+def _restaurar_categoricas(df: pd.DataFrame, esquema: pa.Schema) -> pd.DataFrame:
+    """pyarrow no conserva todas las categóricas (ej. categorías enteras): se restauran."""
+    metadata = esquema.metadata or {}
+    categoricas = json.loads(metadata.get(_METADATA_KEY, b"{}"))
+    for nombre_col, info in categoricas.items():
+        dtype = pd.CategoricalDtype(pd.Index(info["categories"], dtype=info["categories_dtype"]),
+                                    ordered=info["ordered"])
+        if nombre_col == str(df.index.name):
+            df.index = df.index.astype(dtype)
+        elif nombre_col in df.columns:
+            df[nombre_col] = df[nombre_col].astype(dtype)
+    return df
+
+
+def iter_dataset(nombre: str, ruta: str = '../data/processed/',
+                 columns: Optional[List[str]] = None,
+                 batch_size: int = 100_000) -> Iterator[pd.DataFrame]:
+    """
+    Recorre un dataset guardado con save_dataset por bloques de filas (memoria acotada).
+    args:
+        nombre (str): nombre base del fichero, sin extensión.
+        ruta (str): carpeta origen.
+        columns (List[str]): columnas a leer; None lee todas.
+        batch_size (int): filas por bloque.
+    returns:
+        Iterator[pd.DataFrame]: bloques con los mismos dtypes que load_dataset.
+    """
+    import pyarrow.parquet as pq
+    fichero = pq.ParquetFile(_ruta_dataset(nombre, ruta))
+    esquema = fichero.schema_arrow
+    if columns is not None:
+        indice = _columnas_indice(esquema)
+        columns = list(columns) + [c for c in indice if c not in columns]
+    for lote in fichero.iter_batches(batch_size=batch_size, columns=columns):
+        yield _restaurar_categoricas(pa.Table.from_batches([lote]).to_pandas(), esquema)
@@ -0,0 +1,272 @@
+# src/variables_derivadas.py
+import hashlib
+import os
+from collections import OrderedDict
+
+import pandas as pd
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+from src.analisis_exploratorio import codigos_bandas
+from src.cache_perfiles import huella_columna
+from src.data_cleaning import a_float_decimal
+"""
+Módulo: variables_derivadas.py
+======================================================
+
+Construcción de las variables derivadas de df_perfil_cliente a partir de una especificación
+declarativa (segmento_edad, antiguedad_dias, antiguedad_años, 'y' binaria...).
+
+Este módulo está diseñado para:
+- Sustituir las conversiones repartidas por el notebook (pd.cut, restas de pd.to_datetime,
+  replace + to_numeric de 'y', pd.to_numeric dentro de cada bucle) por una sola pasada
+  vectorizada: cada columna fuente se convierte una vez aunque la usen varias variables.
+- Calcular las bandas con np.searchsorted (misma semántica que pd.cut) y la antigüedad con
+  aritmética de datetime64 sobre enteros.
+- Devolver tipos compactos: category ordenada (códigos int8) para bandas, float32 para
+  numéricas y antigüedades, Int8 para binarias.
+- Guardar cada variable en caché con una clave formada por la huella de sus columnas fuente
+  (src.cache_perfiles.huella_columna) y su definición: al relanzar el notebook solo se
+  recalculan las variables cuyas fuentes han cambiado.
+
+------------------------------------------------------
+CLASES Y FUNCIONES DISPONIBLES EN ESTE MÓDULO:
+------------------------------------------------------
+
+1) ESPEC_PERFIL
+   - Especificación de las variables del análisis demográfico del notebook:
+     {'y': binaria, 'segmento_edad': bandas de 'age', 'antiguedad_dias' y 'antiguedad_años':
+     antigüedad de 'dt_customer' a 'date'}.
+   - Tipos de definición:
+       {'tipo': 'bandas', 'columna', 'bins', 'labels'=None, 'right'=True}
+       {'tipo': 'antiguedad', 'desde', 'hasta', 'unidad'='dias' | 'años'}
+       {'tipo': 'numerica', 'columna'}   (acepta coma decimal)
+       {'tipo': 'binaria', 'columna', 'valores'=VALORES_BINARIOS}
+
+2) construir_variables(df, espec=None, columnas=None, cache=None)
+   - Añade (o sustituye) las variables de espec (ESPEC_PERFIL por defecto) en una copia de df.
+   - columnas: subconjunto de variables a construir (None = todas).
+   - Lanza ValueError si falta alguna columna fuente.
+
+3) CacheVariables(max_entradas=64, cache_dir=None)
+   - Caché de variables derivadas: LRU en memoria y, si se indica cache_dir, pickle en disco.
+   - cache.aciertos, cache.fallos, cache.limpiar().
+
+4) columnas_fuente(definicion)
+   - Columnas de df que necesita una definición de la especificación (la usa src.pipeline para
+     saber qué columnas leer antes de construir cada variable).
+
+------------------------------------------------------
+BUENAS PRÁCTICAS/TIPS:
+------------------------------------------------------
+- float32 guarda unos 7 dígitos significativos: suficiente para edades, ingresos y
+  antigüedades; para importes que se vayan a sumar con precisión usar 'dtype': 'float64'.
+- La huella de columnas numéricas, fechas y category es casi gratuita; en columnas de texto
+  cuesta un hash por valor, del orden de la propia recodificación de una 'y' en texto. La caché
+  compensa sobre todo tras clean_campaign_df (y ya numérica) y con fechas en texto.
+- Benchmark frente al código del notebook en `python -m benchmarks.bench_variables`.
+
+------------------------------------------------------
+EJEMPLO DE USO EN NOTEBOOK:
+------------------------------------------------------
+from src.variables_derivadas import construir_variables, CacheVariables
+cache = CacheVariables(cache_dir='../data/cache/variables/')
+df_perfil_cliente = construir_variables(df_perfil_cliente, cache=cache)
+# Bandas adicionales declaradas junto a las del notebook
+espec = {'banda_ingresos': {'tipo': 'bandas', 'columna': 'income', 'bins': [0, 30_000, 60_000, 200_000]}}
+df_perfil_cliente = construir_variables(df_perfil_cliente, espec, cache=cache)
+"""
+
+__all__ = [
+    "ESPEC_PERFIL",
+    "construir_variables",
+    "CacheVariables",
+    "columnas_fuente",
+]
+
+ORDEN_EDAD = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+BINS_EDAD = [0, 25, 35, 45, 55, 65, 120]
+
+# Recodificación de 'y' del notebook (el resto de valores pasa por pd.to_numeric)
+VALORES_BINARIOS = {'yes': 1, 'no': 0, 'si': 1, 'sí': 1}
+
+ESPEC_PERFIL: Dict[str, Dict[str, Any]] = {
+    'y': {'tipo': 'binaria', 'columna': 'y'},
+    'segmento_edad': {'tipo': 'bandas', 'columna': 'age', 'bins': BINS_EDAD, 'labels': ORDEN_EDAD},
+    'antiguedad_dias': {'tipo': 'antiguedad', 'desde': 'dt_customer', 'hasta': 'date', 'unidad': 'dias'},
+    'antiguedad_años': {'tipo': 'antiguedad', 'desde': 'dt_customer', 'hasta': 'date', 'unidad': 'años'},
+}
+
+_NS_POR_DIA = 86_400 * 10 ** 9
+_NAT = np.iinfo(np.int64).min
+
+
+def columnas_fuente(definicion: Dict[str, Any]) -> List[str]:
+    """
+    Columnas de df que necesita una definición de variable.
+    args:
+        definicion (Dict): una entrada de la especificación (ej. ESPEC_PERFIL['segmento_edad']).
+    returns:
+        List[str]: columnas fuente ('hasta' y 'desde' en antigüedades, 'columna' en el resto).
+    """
+    if definicion.get('tipo') == 'antiguedad':
+        return [definicion['hasta'], definicion['desde']]
+    return [definicion['columna']]
+
+
+def _a_nanosegundos(serie: pd.Series) -> np.ndarray:
+    """Fechas como int64 en ns desde 1970 (NaT = mínimo de int64)."""
+    if not pd.api.types.is_datetime64_any_dtype(serie):
+        serie = pd.to_datetime(serie, errors='coerce')
+    if getattr(serie.dt, 'tz', None) is not None:
+        serie = serie.dt.tz_convert(None)
+    return serie.to_numpy(dtype='datetime64[ns]').view('int64')
+
+
+def _calcular(definicion: Dict[str, Any], convertir) -> Any:
+    """Valores de una variable; convertir(tipo, columna) devuelve la columna fuente ya convertida."""
+    tipo = definicion.get('tipo')
+    if tipo == 'bandas':
+        codigos, etiquetas = convertir('bandas', definicion['columna'], definicion)
+        return pd.Categorical.from_codes(codigos, categories=etiquetas, ordered=True)
+    if tipo == 'numerica':
+        return convertir('float', definicion['columna']).astype(definicion.get('dtype', 'float32'))
+    if tipo == 'antiguedad':
+        hasta, desde = convertir('fecha', definicion['hasta']), convertir('fecha', definicion['desde'])
+        # Días completos como .dt.days (división entera hacia -inf); NaT en cualquiera -> NaN
+        dias = np.floor_divide(hasta - desde, _NS_POR_DIA).astype('float64')
+        dias[(hasta == _NAT) | (desde == _NAT)] = np.nan
+        unidad = definicion.get('unidad', 'dias')
+        if unidad == 'años':
+            dias = dias / 365.25
+        elif unidad != 'dias':
+            raise ValueError(f"Unidad de antigüedad no soportada: {unidad!r} (usar 'dias' o 'años')")
+        return dias.astype(definicion.get('dtype', 'float32'))
+    if tipo == 'binaria':
+        return convertir('binaria', definicion['columna'], definicion)
+    raise ValueError(f"Tipo de variable derivada no soportado: {tipo!r}")
+
+
+def construir_variables(df: pd.DataFrame, espec: Optional[Dict[str, Dict[str, Any]]] = None,
+                        columnas: Optional[List[str]] = None,
+                        cache: Optional["CacheVariables"] = None) -> pd.DataFrame:
+    """
+    Construye las variables derivadas de espec en una sola pasada vectorizada.
+    args:
+        df (pd.DataFrame): DataFrame con las columnas fuente (no se modifica).
+        espec (Dict): {variable: definición}; None usa ESPEC_PERFIL.
+        columnas (List[str]): variables de espec a construir (None = todas).
+        cache (CacheVariables): si se indica, las variables se reutilizan mientras sus columnas
+            fuente no cambien.
+    returns:
+        pd.DataFrame: copia de df con las variables añadidas (o sustituidas si ya existían).
+    """
+    espec = ESPEC_PERFIL if espec is None else espec
+    nombres = list(espec) if columnas is None else list(columnas)
+    desconocidas = [n for n in nombres if n not in espec]
+    if desconocidas:
+        raise ValueError(f"Variables {desconocidas} no están en la especificación")
+    faltantes = list(dict.fromkeys(c for n in nombres for c in columnas_fuente(espec[n]) if c not in df.columns))
+    if faltantes:
+        raise ValueError(f"Columnas fuente {faltantes} no existen. Columnas disponibles: {df.columns.tolist()}")
+
+    # Cada columna fuente se convierte (y se hashea) como mucho una vez por llamada
+    convertidas: Dict[tuple, Any] = {}
+    huellas: Dict[str, str] = {}
+
+    def convertir(tipo: str, columna: str, definicion: Optional[Dict] = None):
+        clave = (tipo, columna) if definicion is None else (tipo, columna, repr(sorted(definicion.items())))
+        if clave not in convertidas:
+            serie = df[columna]
+            if tipo == 'fecha':
+                convertidas[clave] = _a_nanosegundos(serie)
+            elif tipo == 'float':
+                convertidas[clave] = a_float_decimal(serie)[0].to_numpy()
+            elif tipo == 'bandas':
+                codigos, etiquetas = codigos_bandas(serie, definicion['bins'], definicion.get('labels'),
+                                                    definicion.get('right', True))
+                dtype = np.int8 if len(etiquetas) < 127 else np.int32
+                convertidas[clave] = (codigos.astype(dtype), etiquetas)
+            else:
+                convertidas[clave] = _binaria(serie, definicion.get('valores', VALORES_BINARIOS))
+        return convertidas[clave]
+
+    def huella(columna: str) -> str:
+        if columna not in huellas:
+            huellas[columna] = huella_columna(df[columna])
+        return huellas[columna]
+
+    nuevas = {}
+    for nombre in nombres:
+        definicion = espec[nombre]
+        calcular = lambda: _calcular(definicion, convertir)
+        if cache is None:
+            valores = calcular()
+        else:
+            valores = cache.variable([huella(c) for c in columnas_fuente(definicion)], definicion, calcular)
+        nuevas[nombre] = pd.Series(valores, index=df.index, name=nombre, copy=False)
+    return df.assign(**nuevas)
+
+
+def _binaria(serie: pd.Series, valores: Dict[Any, int]) -> pd.arrays.IntegerArray:
+    """Recodificación + pd.to_numeric de 'y' como en el notebook, una vez por valor distinto."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos, unicos = serie.cat.codes.to_numpy(), serie.cat.categories
+    else:
+        codigos, unicos = pd.factorize(serie, use_na_sentinel=True)
+    unicos = pd.Series([valores.get(v, v) for v in unicos], dtype=object)
+    convertidos = pd.to_numeric(unicos, errors='coerce').to_numpy(dtype='float64')
+    nulos = np.isnan(convertidos)
+    validos = convertidos[~nulos]
+    if np.any((validos != np.round(validos)) | (np.abs(validos) > 127)):
+        raise ValueError(f"Columna '{serie.name}' con valores no convertibles a Int8: "
+                         f"{sorted(set(validos.tolist()))}")
+    # Código -1 (nulo original) → valor nulo añadido al final
+    datos = np.append(np.where(nulos, 0, convertidos), 0).astype('int8')[codigos]
+    mascara = np.append(nulos, True)[codigos]
+    return pd.arrays.IntegerArray(datos, mascara)
+
+
+class CacheVariables:
+    """Variables derivadas indexadas por huella de sus fuentes + definición: LRU en memoria y pickle en disco."""
+
+    def __init__(self, max_entradas: int = 64, cache_dir: Optional[str] = None):
+        self.max_entradas = max_entradas
+        self.cache_dir = cache_dir
+        self.memoria: "OrderedDict[str, Any]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def clave(self, huellas: List[str], definicion: Dict[str, Any]) -> str:
+        """Clave de la variable: huellas de las columnas fuente + definición."""
+        texto = '|'.join(huellas) + '|' + repr(sorted(definicion.items()))
+        return hashlib.sha1(texto.encode(), usedforsecurity=False).hexdigest()
+
+    def variable(self, huellas: List[str], definicion: Dict[str, Any], calcular) -> Any:
+        """Valores de la variable desde la caché (memoria, luego disco) o calculados con calcular()."""
+        clave = self.clave(huellas, definicion)
+        if clave in self.memoria:
+            self.memoria.move_to_end(clave)
+            self.aciertos += 1
+            return self.memoria[clave]
+        ruta = None if self.cache_dir is None else os.path.join(self.cache_dir, f"variable_{clave}.pkl")
+        if ruta is not None and os.path.exists(ruta):
+            valores = pd.read_pickle(ruta)
+            self.aciertos += 1
+        else:
+            valores = calcular()
+            self.fallos += 1
+            if ruta is not None:
+                pd.to_pickle(valores, ruta)
+        self.memoria[clave] = valores
+        while len(self.memoria) > self.max_entradas:
+            self.memoria.popitem(last=False)
+        return valores
+
+    def limpiar(self) -> None:
+        """Vacía la caché en memoria (los ficheros de cache_dir se conservan)."""
+        self.memoria.clear()
+        self.aciertos = 0
+        self.fallos = 0
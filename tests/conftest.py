@@ -0,0 +1,34 @@
+# tests/conftest.py
+import pandas as pd
+import pytest
+
+from benchmarks.generador import generar_campaign, generar_clientes
+"""
+Datos sintéticos compartidos por los tests (benchmarks.generador): un CSV con la forma de
+bank-additional.csv y un libro con las hojas anuales de customer-details.xlsx.
+"""
+
+N_CAMPAIGN = 3000
+
+
+@pytest.fixture(scope="session")
+def df_campaign():
+    return generar_campaign(N_CAMPAIGN)
+
+
+@pytest.fixture(scope="session")
+def ruta_campaign(tmp_path_factory, df_campaign):
+    ruta = tmp_path_factory.mktemp("datos") / "bank-additional.csv"
+    df_campaign.to_csv(ruta)
+    return str(ruta)
+
+
+@pytest.fixture(scope="session")
+def ruta_clientes(tmp_path_factory, df_campaign):
+    # Dos tercios de los ids de la campaña tienen cliente, repartidos por año como en el libro real
+    clientes = generar_clientes(2 * N_CAMPAIGN // 3, ids=df_campaign['id'].dropna().unique())
+    ruta = tmp_path_factory.mktemp("datos") / "customer-details.xlsx"
+    with pd.ExcelWriter(ruta) as writer:
+        for anio, hoja in clientes.groupby('year'):
+            hoja.drop(columns='year').reset_index(drop=True).to_excel(writer, sheet_name=anio)
+    return str(ruta)
@@ -0,0 +1,50 @@
+# tests/test_cleaning_campaing.py
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.cleaning_campaing as cc
+import src.data_cleaning as dc
+
+
+def _como_csv(df):
+    """El DataFrame tal y como queda escrito y releído (mismo formato que clean_campaign_csv)."""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+
+def test_clean_campaign_csv_igual_a_limpiar_completo(ruta_campaign, tmp_path):
+    salida = tmp_path / "campaign_clean.csv"
+    resultado = cc.clean_campaign_csv(ruta_campaign, str(salida), chunksize=700)
+    completo = dc.clean_column_names(cc.clean_campaign_df(pd.read_csv(ruta_campaign, index_col=0)),
+                                     verbose=False)
+    assert resultado['filas'] == len(completo)
+    pd.testing.assert_frame_equal(pd.read_csv(salida), _como_csv(completo))
+
+
+def test_estadisticas_campaign_igual_a_las_del_fichero_completo(ruta_campaign):
+    estadisticas = cc.estadisticas_campaign(ruta_campaign, chunksize=700)
+    df = pd.read_csv(ruta_campaign, index_col=0)
+    assert estadisticas['age'] == df['age'].median()
+    assert estadisticas['education'] == df['education'].mode()[0]
+    for c in cc.COLUMNAS_MACRO:
+        assert estadisticas[c] == pytest.approx(dc.a_float_decimal(df[c])[0].median())
+
+
+def test_estadisticas_incompletas_no_usan_la_mediana_del_lote(df_campaign):
+    with pytest.raises(KeyError):
+        cc.clean_campaign_df(df_campaign, estadisticas={'age': 40, 'education': 'basic.4y'})
+
+
+def test_mediana_nan_avisa_y_no_imputa(df_campaign):
+    df = df_campaign.copy()
+    df['euribor3m'] = np.nan
+    estadisticas = {**{c: 1.0 for c in cc.COLUMNAS_MACRO}, 'euribor3m': np.nan,
+                    'age': 40, 'education': 'basic.4y'}
+    with pytest.warns(UserWarning, match='euribor3m'):
+        limpio = cc.clean_campaign_df(df, estadisticas=estadisticas)
+    assert limpio['euribor3m'].isna().all()
@@ -0,0 +1,78 @@
+# tests/test_eda_por_bloques.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analisis_exploratorio import perfil_columnas
+from src.eda_por_bloques import categorical_summary_por_bloques, perfil_por_bloques
+
+
+def _comparar(por_bloques, completo):
+    """Mismas estadísticas que perfil_columnas (el orden de empates en top_values puede variar)."""
+    assert por_bloques.keys() == completo.keys()
+    for c, esperado in completo.items():
+        obtenido = por_bloques[c]
+        assert obtenido["tipo"] == esperado["tipo"], c
+        for k, v in esperado.items():
+            if k in ("top_values", "value_counts"):
+                continue
+            if k == "top_counts":
+                assert list(obtenido[k]) == list(v), c
+            elif isinstance(v, float):
+                assert obtenido[k] == pytest.approx(v, nan_ok=True), (c, k)
+            else:
+                assert obtenido[k] == v, (c, k)
+        if esperado.get("value_counts") is not None:
+            pd.testing.assert_series_equal(
+                obtenido["value_counts"].sort_index(), esperado["value_counts"].sort_index(),
+                check_names=False, check_index_type=False)
+
+
+@pytest.fixture
+def ruta_mixta(tmp_path):
+    n = 10_000
+    df = pd.DataFrame({
+        # Sin valores en el primer bloque: el tipo lo fija el primer bloque con datos
+        'nota': np.where(np.arange(n) < 6000, None, np.where(np.arange(n) % 2, 'x', 'y')),
+        'v': np.arange(n) % 13,
+        'vacia': np.nan,
+        # Numérica en los primeros bloques y texto después
+        'mix': [str(i % 7) for i in range(6000)] + ['a', 'b'] * 2000,
+    })
+    df.loc[::10, 'mix'] = None
+    ruta = tmp_path / "mixta.csv"
+    df.to_csv(ruta, index=False)
+    return str(ruta)
+
+
+def test_perfil_por_bloques_igual_a_perfil_columnas(ruta_campaign):
+    por_bloques, estructura = perfil_por_bloques(ruta_campaign, chunksize=700)
+    completo = pd.read_csv(ruta_campaign)
+    _comparar(por_bloques, perfil_columnas(completo))
+    assert estructura["shape"] == completo.shape
+    assert not any(p["aproximado"] for p in por_bloques.values())
+
+
+def test_tipo_de_columnas_vacias_y_mixtas(ruta_mixta):
+    por_bloques, estructura = perfil_por_bloques(ruta_mixta, chunksize=5000)
+    completo = pd.read_csv(ruta_mixta)
+    _comparar(por_bloques, perfil_columnas(completo))
+    assert estructura["dtypes"].to_dict() == completo.dtypes.to_dict()
+
+
+def test_categorical_summary_por_bloques(ruta_campaign):
+    resumen = categorical_summary_por_bloques(ruta_campaign, chunksize=700)
+    completo = perfil_columnas(pd.read_csv(ruta_campaign))
+    esperado = {c: p["n_unique"] for c, p in completo.items() if p["tipo"] == "categorica"}
+    assert resumen["n_unique"].to_dict() == esperado
+
+
+def test_marca_aproximado_al_superar_los_limites(ruta_campaign):
+    por_bloques, _ = perfil_por_bloques(ruta_campaign, chunksize=700, max_categorias=5,
+                                        tamano_muestra=50)
+    assert por_bloques["id"]["aproximado"]
+    assert por_bloques["duration"]["aproximado"]
+    # Pocas categorías o pocos valores distintos: sigue siendo exacto
+    assert not por_bloques["marital"]["aproximado"]
+    assert not por_bloques["previous"]["aproximado"]
+    assert por_bloques["duration"]["count"] == perfil_columnas(pd.read_csv(ruta_campaign))["duration"]["count"]
@@ -0,0 +1,71 @@
+# tests/test_join_clientes.py
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.join_clientes as jc
+
+
+@pytest.fixture
+def tablas():
+    # ids nulos, repetidos en ambos lados, sin UUID ('a', '17', '') y sin pareja
+    campaign = pd.DataFrame({
+        'id': ['u0', 'u1', None, 'u2', '17', None, 'u0', 'u0', 'u1', 'u7', 'u7', 'a', ''],
+        'y': np.arange(13),
+    })
+    clientes = pd.DataFrame({
+        'id': ['u0', 'u1', None, 'u9', 'u2', 'u2', 'u2', 'u9', '17', 'a', ''],
+        'income': np.arange(11) * 1000,
+    })
+    return campaign, clientes
+
+
+def _merge(campaign, clientes):
+    """
+    pd.merge sin ids nulos (pd.merge los empareja entre sí; unir_perfil_cliente los descarta),
+    en el orden de la campaña: pandas 2.2 no lo respeta con ids repetidos en clientes.
+    """
+    esperado = pd.merge(campaign[campaign['id'].notna()], clientes[clientes['id'].notna()],
+                        on='id', how='inner').set_index('id')
+    esperado.index.name = None
+    return esperado.sort_values(['y', 'income'], kind='stable')
+
+
+def test_igual_a_pd_merge_salvo_nulos(tablas):
+    campaign, clientes = tablas
+    unido, informe = jc.unir_perfil_cliente(campaign, clientes)
+    pd.testing.assert_frame_equal(unido, _merge(campaign, clientes))
+    assert unido['y'].is_monotonic_increasing
+    assert informe['n_campaign_id_nulo'] == 2
+    assert informe['n_clientes_id_nulo'] == 1
+
+
+def test_informe_cuenta_ids_distintos(tablas):
+    campaign, clientes = tablas
+    _, informe = jc.unir_perfil_cliente(campaign, clientes, max_ids=1)
+    assert informe['n_ids_duplicados_clientes'] == 2  # u2, u9
+    assert informe['n_ids_duplicados_campaign'] == 3  # u0, u1, u7
+    assert informe['n_campaign_sin_cliente'] == 2  # las dos filas de u7
+    assert informe['n_clientes_sin_campaign'] == 2  # las dos filas de u9
+    assert len(informe['ids_campaign_sin_cliente']) == 1
+    assert None not in list(informe['ids_campaign_sin_cliente'])
+
+
+def test_uuid_igual_a_pd_merge(df_campaign):
+    ids = df_campaign['id'].to_numpy()
+    clientes = pd.DataFrame({'id': np.concatenate([ids[::2], ids[:10]]), 'x': np.arange(len(ids[::2]) + 10)})
+    unido, _ = jc.unir_perfil_cliente(df_campaign, clientes, id_como_indice=False)
+    esperado = pd.merge(df_campaign, clientes, on='id', how='inner')
+    pd.testing.assert_frame_equal(unido.reset_index(drop=True), esperado)
+
+
+def test_indice_en_disco_se_reutiliza_y_se_invalida(tablas, tmp_path):
+    campaign, clientes = tablas
+    ruta = str(tmp_path / "indice.npz")
+    jc.unir_perfil_cliente(campaign, clientes, ruta_indice=ruta)
+    assert jc.cargar_indice(ruta)['huella'] is not None
+    # Mismo número de filas, ids intercambiados: la huella detecta el cambio
+    cambiados = clientes.copy()
+    cambiados.loc[[0, 1], 'id'] = ['u1', 'u0']
+    unido, _ = jc.unir_perfil_cliente(campaign, cambiados, ruta_indice=ruta)
+    pd.testing.assert_frame_equal(unido, _merge(campaign, cambiados))
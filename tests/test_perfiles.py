@@ -0,0 +1,87 @@
+# tests/test_perfiles.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analisis_exploratorio import perfil_columnas
+from src.perfiles import PerfilDatos, SketchCuantiles
+
+
+@pytest.fixture
+def df(df_campaign):
+    return df_campaign.drop(columns='id')
+
+
+def _particiones(df, n=4):
+    return [df.iloc[i::n] for i in range(n)]
+
+
+def test_merge_igual_al_perfil_completo(df):
+    total = sum((PerfilDatos.desde_dataframe(p) for p in _particiones(df)), PerfilDatos())
+    completo = PerfilDatos.desde_dataframe(df)
+    assert total.n_filas == len(df)
+    pd.testing.assert_frame_equal(total.missing(), completo.missing())
+    # top_values puede ordenar distinto los empates
+    campos = ["n_unique", "top_counts"]
+    pd.testing.assert_frame_equal(total.categorical_summary()[campos], completo.categorical_summary()[campos])
+    # Conteos, media, desviación, mínimo y máximo exactos tras combinar
+    esperado = df.select_dtypes(np.number).describe().T
+    campos = ["count", "mean", "std", "min", "max"]
+    pd.testing.assert_frame_equal(total.describe()[campos], esperado[campos], rtol=1e-9)
+
+
+def test_actualizar_con_max_distintos_da_cuantiles_exactos(df):
+    perfil = PerfilDatos(max_distintos=100_000)
+    for p in _particiones(df):
+        perfil.actualizar(p)
+    esperado = perfil_columnas(df)
+    obtenido = perfil.perfil_columnas()
+    for c in df.select_dtypes(np.number).columns:
+        for q in ("25%", "50%", "75%"):
+            assert obtenido[c][q] == pytest.approx(esperado[c][q]), (c, q)
+        assert not obtenido[c]["aproximado"]
+
+
+def test_columna_ausente_cuenta_como_faltante(df):
+    a = PerfilDatos.desde_dataframe(df[['age', 'job']])
+    b = PerfilDatos.desde_dataframe(df[['age']])
+    total = a + b
+    assert total.columnas['job']['missing'] == df['job'].isna().sum() + len(df)
+
+
+def test_numerica_y_texto_se_combinan_como_categorica():
+    a = PerfilDatos.desde_dataframe(pd.DataFrame({'c': [1.0, 2.0, 2.0, np.nan]}), max_distintos=10)
+    b = PerfilDatos.desde_dataframe(pd.DataFrame({'c': ['2', 'x']}))
+    col = (a + b).perfil_columnas()['c']
+    assert col['tipo'] == 'categorica'
+    assert col['top_values'][0] == '2' and col['top_counts'][0] == 3
+    assert col['n_unique'] == 4  # '1', '2', 'x' y NaN
+
+
+def test_particion_vacia_no_fija_el_tipo():
+    vacia = PerfilDatos.desde_dataframe(pd.DataFrame({'c': [np.nan, np.nan]}))
+    texto = PerfilDatos.desde_dataframe(pd.DataFrame({'c': ['a', 'b', 'a']}))
+    col = (vacia + texto).perfil_columnas()['c']
+    assert col['tipo'] == 'categorica'
+    assert (col['count'], col['missing']) == (3, 2)
+
+
+def test_to_dict_ida_y_vuelta(df):
+    perfil = PerfilDatos(max_distintos=50, max_categorias=5)
+    for p in _particiones(df):
+        perfil.actualizar(p)
+    recuperado = PerfilDatos.from_dict(perfil.to_dict())
+    pd.testing.assert_frame_equal(recuperado.describe(), perfil.describe())
+    pd.testing.assert_frame_equal(recuperado.categorical_summary(), perfil.categorical_summary())
+
+
+def test_sketch_exacto_sin_compactar_y_acotado_despues():
+    valores = np.random.default_rng(0).normal(size=10_000)
+    pequeno = SketchCuantiles(k=20_000).actualizar(valores)
+    np.testing.assert_allclose(pequeno.cuantiles([0.25, 0.5, 0.75]),
+                               np.quantile(valores, [0.25, 0.5, 0.75]))
+    sketch = SketchCuantiles(k=200)
+    for bloque in np.array_split(valores, 10):
+        sketch = sketch.merge(SketchCuantiles(k=200).actualizar(bloque))
+    rangos = np.searchsorted(np.sort(valores), sketch.cuantiles([0.25, 0.5, 0.75])) / len(valores)
+    np.testing.assert_allclose(rangos, [0.25, 0.5, 0.75], atol=0.05)
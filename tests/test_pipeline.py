@@ -0,0 +1,48 @@
+# tests/test_pipeline.py
+import pandas as pd
+import pytest
+
+import src.pipeline as pipeline
+from src.pipeline import PipelinePerfil
+
+COLUMNAS = ['y', 'income', 'age', 'segmento_edad', 'antiguedad_años']
+
+
+@pytest.fixture
+def completo(ruta_campaign, ruta_clientes, tmp_path):
+    return PipelinePerfil(ruta_campaign, ruta_clientes, cache_dir=str(tmp_path), cache_disco=False).recoger()
+
+
+def test_proyeccion_igual_al_pipeline_completo(ruta_campaign, ruta_clientes, tmp_path, completo):
+    perfil = PipelinePerfil(ruta_campaign, ruta_clientes, cache_dir=str(tmp_path / "cache"))
+    plan = perfil.plan(COLUMNAS)
+    assert set(plan['campaign']) == {'age', 'y', 'date', 'id'}
+    pd.testing.assert_frame_equal(perfil.recoger(COLUMNAS), completo[COLUMNAS])
+    # Segunda llamada (caché en memoria) y pipeline nuevo (caché en disco)
+    pd.testing.assert_frame_equal(perfil.recoger(COLUMNAS), completo[COLUMNAS])
+    nuevo = PipelinePerfil(ruta_campaign, ruta_clientes, cache_dir=str(tmp_path / "cache"))
+    pd.testing.assert_frame_equal(nuevo.recoger(COLUMNAS), completo[COLUMNAS])
+
+
+def test_pipeline_igual_a_los_pasos_del_notebook(ruta_campaign, ruta_clientes, tmp_path, completo):
+    import src.cleaning_campaing as cc
+    import src.data_cleaning as dc
+    from src import ingestion, variables_derivadas
+    from src.join_clientes import unir_perfil_cliente
+
+    campaign = dc.clean_column_names(cc.clean_campaign_df(pd.read_csv(ruta_campaign, index_col=0)),
+                                     verbose=False)
+    clientes = dc.clean_column_names(ingestion.load_customer_details(ruta_clientes, cache_dir=str(tmp_path)),
+                                     verbose=False)
+    unido, _ = unir_perfil_cliente(campaign, clientes)
+    esperado = variables_derivadas.construir_variables(unido, columnas=list(pipeline.COLUMNAS_DERIVADAS))
+    pd.testing.assert_frame_equal(completo, esperado)
+
+
+def test_clave_cambia_con_el_codigo(ruta_campaign, ruta_clientes, tmp_path, monkeypatch):
+    perfil = PipelinePerfil(ruta_campaign, ruta_clientes, cache_dir=str(tmp_path), cache_disco=False)
+    claves = {n: nodo.clave(None) for n, nodo in perfil.nodos.items()}
+    monkeypatch.setattr(pipeline, '_firma_codigo', lambda *modulos: 'otro código')
+    cambiadas = {n for n, nodo in perfil.nodos.items() if nodo.clave(None) != claves[n]}
+    # Los nodos fuente solo dependen de los ficheros
+    assert cambiadas == set(perfil.nodos) - {'campaign', 'clientes'}